@@ -26,8 +26,14 @@ For auth, billing, and other features with model dependencies, import from submo
     from django_matt.billing import BillingController
 """
 
+from pathlib import Path
+
 __version__ = "0.10.0"
 
+# Directory containing the django_matt package, resolved once for the config
+# modules (Path.resolve() stats every path component).
+BASE_DIR = Path(__file__).resolve().parent.parent
+
 # =============================================================================
 # Lazy imports to avoid circular dependencies with Django models
 # =============================================================================
@@ -292,7 +298,7 @@ def __getattr__(name: str):
 
 def __dir__():
     """List available attributes for autocompletion."""
-    return list(_LAZY_IMPORTS.keys()) + ["__version__"]
+    return list(_LAZY_IMPORTS.keys()) + ["__version__", "BASE_DIR"]
 
 
 # Export list for `from django_matt import *`
@@ -6,9 +6,60 @@ by separating concerns into different modules and supporting multiple environmen
 """
 
 import importlib
+import sys
+from collections import ChainMap
+from collections.abc import Mapping
 from typing import Any, Optional
 
-from django.conf import settings as django_settings
+# Known settings modules, resolved without building the dotted path per call.
+# Unknown names fall back to the conventional package location.
+_ENVIRONMENT_MODULES = {
+    "development": "django_matt.config.environments.development",
+    "staging": "django_matt.config.environments.staging",
+    "production": "django_matt.config.environments.production",
+}
+
+_COMPONENT_MODULES = {
+    "database": "django_matt.config.components.database",
+    "cache": "django_matt.config.components.cache",
+    "performance": "django_matt.config.components.performance",
+    "security": "django_matt.config.components.security",
+}
+
+# module path -> exported ``settings`` mapping
+_settings_cache: dict[str, Mapping[str, Any]] = {}
+
+# Sequence settings (lists or tuples) that later layers extend instead of replace
+_LIST_MERGE_KEYS = frozenset({"INSTALLED_APPS", "MIDDLEWARE", "STATICFILES_DIRS"})
+
+
+def _merge_settings(dst: dict[str, Any], src: Mapping[str, Any]) -> None:
+    """
+    Merge a settings layer into ``dst`` in place.
+
+    Keys in ``_LIST_MERGE_KEYS`` are extended (skipping duplicates) into a
+    tuple, dict values are shallow-merged, and everything else is overridden.
+    New containers are always built so the source modules' constants are never
+    mutated.
+    """
+    for key, value in src.items():
+        current = dst.get(key)
+        if key in _LIST_MERGE_KEYS and current is not None:
+            dst[key] = (*current, *(item for item in value if item not in current))
+        elif isinstance(value, dict) and isinstance(current, dict):
+            dst[key] = current | value
+        else:
+            dst[key] = value
+
+
+def _load_settings_module(module_path: str) -> Mapping[str, Any]:
+    """Import a settings module once and return its ``settings`` mapping."""
+    cached = _settings_cache.get(module_path)
+    if cached is None:
+        module = importlib.import_module(module_path)
+        cached = getattr(module, "settings", {})
+        _settings_cache[module_path] = cached
+    return cached
 
 
 class ConfigurationManager:
@@ -17,15 +68,73 @@ class ConfigurationManager:
 
     This class provides methods to load settings from different modules,
     merge them together, and apply them to Django's settings.
+
+    Each loaded module is kept as its own layer in a ``ChainMap`` (no copying
+    on load); the layers are flattened into a plain dict only when the merged
+    settings are requested.
     """
 
+    __slots__ = (
+        "_base_loaded",
+        "_django_settings_applied",
+        "_layers",
+        "_loaded_components",
+        "_loaded_environments",
+        "_overrides",
+        "_settings",
+    )
+
     def __init__(self):
-        self._settings = {}
+        self._layers: ChainMap[str, Any] = ChainMap()
+        self._overrides: dict[str, Any] = {}
+        self._settings: dict[str, Any] | None = None
         self._loaded_components = set()
         self._loaded_environments = set()
         self._base_loaded = False
         self._django_settings_applied = False
 
+    def _push_layer(self, layer: Mapping[str, Any]) -> None:
+        """Add a settings layer on top of the chain and invalidate the merged view."""
+        self._layers = self._layers.new_child(layer)
+        self._settings = None
+
+    def _add_base_layer(self) -> None:
+        if not self._base_loaded:
+            from django_matt.config.base import settings as base_settings
+
+            self._push_layer(base_settings)
+            self._base_loaded = True
+
+    def _add_environment_layer(self, environment: str) -> None:
+        if environment in self._loaded_environments:
+            return
+
+        module_path = _ENVIRONMENT_MODULES.get(environment) or (
+            f"django_matt.config.environments.{environment}"
+        )
+        try:
+            env_settings = _load_settings_module(module_path)
+        except ImportError:
+            raise ImportError(f"Could not import environment settings for '{environment}'")
+
+        self._push_layer(env_settings)
+        self._loaded_environments.add(environment)
+
+    def _add_component_layer(self, component: str) -> None:
+        if component in self._loaded_components:
+            return
+
+        module_path = _COMPONENT_MODULES.get(component) or (
+            f"django_matt.config.components.{component}"
+        )
+        try:
+            component_settings = _load_settings_module(module_path)
+        except ImportError:
+            raise ImportError(f"Could not import component settings for '{component}'")
+
+        self._push_layer(component_settings)
+        self._loaded_components.add(component)
+
     def load_base(self) -> dict[str, Any]:
         """
         Load the base settings.
@@ -33,13 +142,8 @@ class ConfigurationManager:
         Returns:
             The base settings dictionary.
         """
-        if not self._base_loaded:
-            from django_matt.config.base import settings as base_settings
-
-            self._settings.update(base_settings)
-            self._base_loaded = True
-
-        return self._settings
+        self._add_base_layer()
+        return self.get_settings()
 
     def load_environment(self, environment: str) -> dict[str, Any]:
         """
@@ -54,18 +158,8 @@ class ConfigurationManager:
         Raises:
             ImportError: If the environment module cannot be found.
         """
-        if environment in self._loaded_environments:
-            return self._settings
-
-        try:
-            env_module = importlib.import_module(f"django_matt.config.environments.{environment}")
-            env_settings = getattr(env_module, "settings", {})
-            self._settings.update(env_settings)
-            self._loaded_environments.add(environment)
-        except ImportError:
-            raise ImportError(f"Could not import environment settings for '{environment}'")
-
-        return self._settings
+        self._add_environment_layer(environment)
+        return self.get_settings()
 
     def load_component(self, component: str) -> dict[str, Any]:
         """
@@ -80,18 +174,8 @@ class ConfigurationManager:
         Raises:
             ImportError: If the component module cannot be found.
         """
-        if component in self._loaded_components:
-            return self._settings
-
-        try:
-            component_module = importlib.import_module(f"django_matt.config.components.{component}")
-            component_settings = getattr(component_module, "settings", {})
-            self._settings.update(component_settings)
-            self._loaded_components.add(component)
-        except ImportError:
-            raise ImportError(f"Could not import component settings for '{component}'")
-
-        return self._settings
+        self._add_component_layer(component)
+        return self.get_settings()
 
     def load_components(self, components: list[str]) -> dict[str, Any]:
         """
@@ -104,17 +188,29 @@ class ConfigurationManager:
             The updated settings dictionary.
         """
         for component in components:
-            self.load_component(component)
+            self._add_component_layer(component)
 
-        return self._settings
+        return self.get_settings()
 
     def get_settings(self) -> dict[str, Any]:
         """
         Get the current settings dictionary.
 
+        The layers are merged on first access after a load; loading another
+        layer rebuilds the dict, so pass overrides via ``extra_settings``
+        rather than mutating the returned mapping.
+
         Returns:
             The settings dictionary.
         """
+        if self._settings is None:
+            merged: dict[str, Any] = {}
+            # ChainMap.maps is ordered highest precedence first
+            for layer in reversed(self._layers.maps):
+                _merge_settings(merged, layer)
+            merged.update(self._overrides)
+            self._settings = merged
+
         return self._settings
 
     def apply_to_django_settings(self) -> None:
@@ -126,8 +222,26 @@ class ConfigurationManager:
         if self._django_settings_applied:
             return
 
-        for key, value in self._settings.items():
-            setattr(django_settings, key, value)
+        from django.conf import settings as django_settings
+        from django.utils.functional import empty
+
+        settings = self.get_settings()
+
+        # Write straight into the wrapped holder in one dict update rather than
+        # going through LazySettings.__setattr__ once per key.
+        if django_settings._wrapped is empty:
+            django_settings._setup()
+        holder = django_settings._wrapped
+        holder.__dict__.update(settings)
+
+        # Mirror what the per-key setattr path does on both objects: un-delete
+        # keys on a UserSettingsHolder and drop values LazySettings has cached.
+        deleted = holder.__dict__.get("_deleted")
+        if deleted:
+            deleted.difference_update(settings)
+        cached = django_settings.__dict__
+        for key in cached.keys() & settings.keys():
+            del cached[key]
 
         self._django_settings_applied = True
 
@@ -152,25 +266,34 @@ class ConfigurationManager:
         Returns:
             The final settings dictionary.
         """
+        # Names coming from env vars or the CLI are not interned; interning them
+        # lets the loaded-name sets and the module tables (whose literal keys are
+        # interned by the compiler) match on identity before comparing characters.
+        environment = sys.intern(environment)
+
         # Load base settings first
-        self.load_base()
+        self._add_base_layer()
 
         # Load environment settings
-        self.load_environment(environment)
+        self._add_environment_layer(environment)
 
         # Load component settings
-        if components:
-            self.load_components(components)
+        for component in components or ():
+            self._add_component_layer(sys.intern(component))
 
-        # Apply extra settings
+        # Apply extra settings. Overrides sit above every layer, so an already
+        # merged dict can be patched in place instead of re-merged; a repeat
+        # configure() with the same arguments then does no merge work at all.
         if extra_settings:
-            self._settings.update(extra_settings)
+            self._overrides.update(extra_settings)
+            if self._settings is not None:
+                self._settings.update(extra_settings)
 
         # Apply to Django settings if requested
         if apply_to_django:
             self.apply_to_django_settings()
 
-        return self._settings
+        return self.get_settings()
 
 
 # Create a singleton instance
@@ -302,6 +425,8 @@ def configure(
 
     # Auto-insert django_matt into INSTALLED_APPS if missing
     if apply_to_django:
+        from django.conf import settings as django_settings
+
         installed = list(getattr(django_settings, "INSTALLED_APPS", []))
         if "django_matt" not in installed:
             # Insert after django.contrib.contenttypes (or at end if not found)
@@ -4,14 +4,17 @@ Base settings for Django Matt applications.
 This module contains settings that are common to all environments.
 """
 
-import os
-from pathlib import Path
+from types import MappingProxyType
 
-# Build paths inside the project
-BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
+from django_matt import BASE_DIR
+
+# Filesystem roots, computed once at import
+STATIC_ROOT = str(BASE_DIR / "staticfiles")
+STATICFILES_DIR = str(BASE_DIR / "static")
+MEDIA_ROOT = str(BASE_DIR / "media")
 
 # Default settings dictionary
-settings = {
+_BASE = {
     # Core Django settings
     "DEBUG": False,
     "SECRET_KEY": None,  # Must be set in environment settings
@@ -19,16 +22,16 @@ settings = {
     "ROOT_URLCONF": None,  # Must be set in project settings
     "WSGI_APPLICATION": None,  # Must be set in project settings
     # Application definition
-    "INSTALLED_APPS": [
+    "INSTALLED_APPS": (
         "django.contrib.admin",
         "django.contrib.auth",
         "django.contrib.contenttypes",
         "django.contrib.sessions",
         "django.contrib.messages",
         "django.contrib.staticfiles",
-    ],
+    ),
     # Middleware
-    "MIDDLEWARE": [
+    "MIDDLEWARE": (
         "django.middleware.security.SecurityMiddleware",
         "django.contrib.sessions.middleware.SessionMiddleware",
         "django.middleware.common.CommonMiddleware",
@@ -36,7 +39,7 @@ settings = {
         "django.contrib.auth.middleware.AuthenticationMiddleware",
         "django.contrib.messages.middleware.MessageMiddleware",
         "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    ],
+    ),
     # Templates
     "TEMPLATES": [
         {
@@ -60,13 +63,13 @@ settings = {
     "USE_TZ": True,
     # Static files (CSS, JavaScript, Images)
     "STATIC_URL": "static/",
-    "STATIC_ROOT": os.path.join(BASE_DIR, "staticfiles"),
+    "STATIC_ROOT": STATIC_ROOT,
     "STATICFILES_DIRS": [
-        os.path.join(BASE_DIR, "static"),
+        STATICFILES_DIR,
     ],
     # Media files
     "MEDIA_URL": "media/",
-    "MEDIA_ROOT": os.path.join(BASE_DIR, "media"),
+    "MEDIA_ROOT": MEDIA_ROOT,
     # Default primary key field type
     "DEFAULT_AUTO_FIELD": "django.db.models.BigAutoField",
     # Django Matt specific settings
@@ -79,3 +82,6 @@ settings = {
         "CACHE_KEY_PREFIX": "django_matt:",
     },
 }
+
+# Read-only view; ConfigurationManager merges it into its own dict
+settings = MappingProxyType(_BASE)
@@ -32,12 +32,10 @@ Usage:
 from __future__ import annotations
 
 import os
+from types import MappingProxyType
 from typing import Any
 
-
-def _get_bool_env(key: str, default: bool = False) -> bool:
-    """Get boolean from environment variable."""
-    return os.environ.get(key, str(default)).lower() in ("true", "1", "yes")
+from django_matt.config.utils import get_env_bool
 
 
 def get_redis_cache_config(
@@ -376,7 +374,7 @@ default_cache_config = configure_cache(
 )
 
 # Cache settings to export
-settings: dict[str, Any] = {
+_SETTINGS: dict[str, Any] = {
     "CACHES": {
         "default": default_cache_config,
     },
@@ -388,12 +386,15 @@ settings: dict[str, Any] = {
     "CACHE_MIDDLEWARE_KEY_PREFIX": CACHE_KEY_PREFIX,
     # Django Matt cache settings
     "DJANGO_MATT": {
-        "CACHE_ENABLED": _get_bool_env("DJANGO_MATT_CACHE_ENABLED", True),
+        "CACHE_ENABLED": get_env_bool("DJANGO_MATT_CACHE_ENABLED", True),
         "CACHE_TIMEOUT": CACHE_TIMEOUT,
         "CACHE_KEY_PREFIX": f"{CACHE_KEY_PREFIX}:",
     },
 }
 
+# Read-only view shared by every ConfigurationManager that loads this component
+settings = MappingProxyType(_SETTINGS)
+
 
 __all__ = [
     "settings",
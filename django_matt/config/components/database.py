@@ -11,17 +11,15 @@ Supports Django 5.2+ and 6.0+ with modern connection pooling options.
 from __future__ import annotations
 
 import os
-from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import orjson
 
+from django_matt import BASE_DIR
 from django_matt.compat import DJANGO_5_1_PLUS, DJANGO_5_2_PLUS, DJANGO_6_0_PLUS
 from django_matt.config.utils import get_env_bool, get_env_dict, get_env_int
 
-# Get the base directory
-BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
-
 # Detect database type from environment
 DB_TYPE = os.environ.get("DB_TYPE", "postgres").lower()
 
@@ -227,12 +225,13 @@ def get_database_config(db_type: str | None = None) -> dict[str, Any]:
 db_config = get_database_config()
 
 # Override engine if explicitly set
-if os.environ.get("DB_ENGINE"):
-    db_config["ENGINE"] = os.environ.get("DB_ENGINE")
+db_engine = os.environ.get("DB_ENGINE")
+if db_engine:
+    db_config["ENGINE"] = db_engine
 
 
 # Database settings to export
-settings: dict[str, Any] = {
+_SETTINGS: dict[str, Any] = {
     "DATABASES": {"default": db_config},
     # Django Matt specific settings
     "DJANGO_MATT_DB_TYPE": DB_TYPE,
@@ -240,10 +239,12 @@ settings: dict[str, Any] = {
     "DJANGO_MATT_DB_PGVECTOR_ENABLED": get_env_bool("DB_PGVECTOR_ENABLED", False),
 }
 
+
 # Add multiple databases if configured
-if os.environ.get("DB_MULTIPLE"):
+db_multiple = os.environ.get("DB_MULTIPLE")
+if db_multiple:
     try:
-        multiple_dbs = orjson.loads(os.environ.get("DB_MULTIPLE", "{}"))
+        multiple_dbs = orjson.loads(db_multiple)
         for db_name, db_settings in multiple_dbs.items():
             db_type = db_settings.get("type", "postgres").lower()
             # Set env vars temporarily to build config
@@ -255,7 +256,7 @@ if os.environ.get("DB_MULTIPLE"):
                     os.environ[env_key] = str(value)
 
             # Build config
-            settings["DATABASES"][db_name] = get_database_config(db_type)
+            _SETTINGS["DATABASES"][db_name] = get_database_config(db_type)
 
             # Restore env vars
             for env_key, original_value in original_env.items():
@@ -269,7 +270,10 @@ if os.environ.get("DB_MULTIPLE"):
 # Add database routers if configured
 db_routers = os.environ.get("DB_ROUTERS")
 if db_routers:
-    settings["DATABASE_ROUTERS"] = [r.strip() for r in db_routers.split(",") if r.strip()]
+    _SETTINGS["DATABASE_ROUTERS"] = [r.strip() for r in db_routers.split(",") if r.strip()]
+
+# Read-only view shared by every ConfigurationManager that loads this component
+settings = MappingProxyType(_SETTINGS)
 
 
 # Convenience functions for users
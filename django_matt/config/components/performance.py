@@ -6,6 +6,10 @@ This module contains settings for optimizing performance.
 
 import logging
 import os
+from types import MappingProxyType
+from typing import Any
+
+from django_matt.config.utils import get_env_bool
 
 logger = logging.getLogger("django_matt")
 
@@ -82,11 +86,10 @@ def apply_api_mode(middleware_list: list[str]) -> list[str]:
 
 
 # Performance settings
-settings = {
+_SETTINGS: dict[str, Any] = {
     # Django Matt performance settings
     "DJANGO_MATT": {
-        "BENCHMARK_ENABLED": os.environ.get("DJANGO_MATT_BENCHMARK_ENABLED", "False").lower()
-        == "true",
+        "BENCHMARK_ENABLED": get_env_bool("DJANGO_MATT_BENCHMARK_ENABLED", False),
         "BENCHMARK_HEADER": os.environ.get("DJANGO_MATT_BENCHMARK_HEADER", "X-Django-Matt-Timing"),
     },
     # Django optimization settings
@@ -119,8 +122,11 @@ settings = {
         "django.contrib.staticfiles.storage.ManifestStaticFilesStorage",
     ),
     # Middleware for performance
-    "MIDDLEWARE": [
+    "MIDDLEWARE": (
         "django.middleware.gzip.GZipMiddleware",
         "django.middleware.http.ConditionalGetMiddleware",
-    ],
+    ),
 }
+
+# Read-only view shared by every ConfigurationManager that loads this component
+settings = MappingProxyType(_SETTINGS)
@@ -5,16 +5,20 @@ This module contains settings for enhancing security.
 """
 
 import os
+from types import MappingProxyType
+from typing import Any
+
+from django_matt.config.utils import get_env_bool
 
 # Security settings
-settings = {
+_SETTINGS: dict[str, Any] = {
     # CSRF settings
-    "CSRF_COOKIE_SECURE": os.environ.get("CSRF_COOKIE_SECURE", "False").lower() == "true",
+    "CSRF_COOKIE_SECURE": get_env_bool("CSRF_COOKIE_SECURE", False),
     "CSRF_COOKIE_HTTPONLY": True,
     "CSRF_COOKIE_SAMESITE": "Lax",
     "CSRF_TRUSTED_ORIGINS": os.environ.get("CSRF_TRUSTED_ORIGINS", "").split(","),
     # Session settings
-    "SESSION_COOKIE_SECURE": os.environ.get("SESSION_COOKIE_SECURE", "False").lower() == "true",
+    "SESSION_COOKIE_SECURE": get_env_bool("SESSION_COOKIE_SECURE", False),
     "SESSION_COOKIE_HTTPONLY": True,
     "SESSION_COOKIE_SAMESITE": "Lax",
     "SESSION_ENGINE": os.environ.get("SESSION_ENGINE", "django.contrib.sessions.backends.db"),
@@ -22,16 +26,13 @@ settings = {
     # Security middleware settings
     "SECURE_BROWSER_XSS_FILTER": True,
     "SECURE_CONTENT_TYPE_NOSNIFF": True,
-    "SECURE_HSTS_INCLUDE_SUBDOMAINS": os.environ.get(
-        "SECURE_HSTS_INCLUDE_SUBDOMAINS", "False"
-    ).lower()
-    == "true",
-    "SECURE_HSTS_PRELOAD": os.environ.get("SECURE_HSTS_PRELOAD", "False").lower() == "true",
+    "SECURE_HSTS_INCLUDE_SUBDOMAINS": get_env_bool("SECURE_HSTS_INCLUDE_SUBDOMAINS", False),
+    "SECURE_HSTS_PRELOAD": get_env_bool("SECURE_HSTS_PRELOAD", False),
     "SECURE_HSTS_SECONDS": int(os.environ.get("SECURE_HSTS_SECONDS", 0)),
-    "SECURE_SSL_REDIRECT": os.environ.get("SECURE_SSL_REDIRECT", "False").lower() == "true",
+    "SECURE_SSL_REDIRECT": get_env_bool("SECURE_SSL_REDIRECT", False),
     "SECURE_PROXY_SSL_HEADER": (
         ("HTTP_X_FORWARDED_PROTO", "https")
-        if os.environ.get("SECURE_PROXY_SSL_HEADER", "False").lower() == "true"
+        if get_env_bool("SECURE_PROXY_SSL_HEADER", False)
         else None
     ),
     # Content Security Policy
@@ -61,8 +62,11 @@ settings = {
         },
     ],
     # Rate limiting
-    "RATELIMIT_ENABLE": os.environ.get("RATELIMIT_ENABLE", "True").lower() == "true",
+    "RATELIMIT_ENABLE": get_env_bool("RATELIMIT_ENABLE", True),
     "RATELIMIT_USE_CACHE": os.environ.get("RATELIMIT_USE_CACHE", "default"),
     "RATELIMIT_VIEW": os.environ.get("RATELIMIT_VIEW", "django_matt.views.ratelimited"),
-    "RATELIMIT_FAIL_OPEN": os.environ.get("RATELIMIT_FAIL_OPEN", "False").lower() == "true",
+    "RATELIMIT_FAIL_OPEN": get_env_bool("RATELIMIT_FAIL_OPEN", False),
 }
+
+# Read-only view shared by every ConfigurationManager that loads this component
+settings = MappingProxyType(_SETTINGS)
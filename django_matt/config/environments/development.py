@@ -4,22 +4,26 @@ Development environment settings for Django Matt applications.
 These settings are suitable for local development.
 """
 
-import secrets
+from django.utils.functional import SimpleLazyObject
+
+
+def _generate_secret_key() -> str:
+    import secrets
+
+    return secrets.token_hex(32)
+
 
 # Development-specific settings
 settings = {
     "DEBUG": True,
-    "SECRET_KEY": secrets.token_hex(32),  # Generate a random secret key for development
+    # Random per-process key, only generated if Django actually reads it
+    "SECRET_KEY": SimpleLazyObject(_generate_secret_key),
     "ALLOWED_HOSTS": ["localhost", "127.0.0.1", "[::1]"],
     # Email backend for development
     "EMAIL_BACKEND": "django.core.mail.backends.console.EmailBackend",
     # Django Debug Toolbar settings
-    "INSTALLED_APPS": [
-        "debug_toolbar",
-    ],
-    "MIDDLEWARE": [
-        "debug_toolbar.middleware.DebugToolbarMiddleware",
-    ],
+    "INSTALLED_APPS": ("debug_toolbar",),
+    "MIDDLEWARE": ("debug_toolbar.middleware.DebugToolbarMiddleware",),
     "INTERNAL_IPS": [
         "127.0.0.1",
     ],
@@ -1,90 +1,114 @@
 """
 Staging environment settings for Django Matt applications.
 
-These settings are suitable for staging/testing environments.
+These settings are suitable for staging/testing environments. They are built
+on first access of ``settings`` so that importing this module does not read
+the environment.
 """
 
 import os
+from functools import cache
+from typing import Any
 
-# Staging-specific settings
-settings = {
-    "DEBUG": False,
-    "SECRET_KEY": os.environ.get("DJANGO_SECRET_KEY"),  # Must be set in environment variables
-    "ALLOWED_HOSTS": os.environ.get("ALLOWED_HOSTS", "").split(","),
-    # Security settings (less strict than production)
-    "SECURE_SSL_REDIRECT": False,
-    "SESSION_COOKIE_SECURE": False,
-    "CSRF_COOKIE_SECURE": False,
-    # Email backend for staging
-    "EMAIL_BACKEND": "django.core.mail.backends.console.EmailBackend",
-    # Logging configuration
-    "LOGGING": {
-        "version": 1,
-        "disable_existing_loggers": False,
-        "formatters": {
-            "verbose": {
-                "format": "{levelname} {asctime} {module} {process:d} {thread:d} {message}",
-                "style": "{",
-            },
+# Logging configuration
+_LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "verbose": {
+            "format": "{levelname} {asctime} {module} {process:d} {thread:d} {message}",
+            "style": "{",
         },
-        "handlers": {
-            "console": {
-                "level": "DEBUG",
-                "class": "logging.StreamHandler",
-                "formatter": "verbose",
-            },
-        },
-        "loggers": {
-            "django": {
-                "handlers": ["console"],
-                "level": "INFO",
-                "propagate": True,
-            },
-            "django_matt": {
-                "handlers": ["console"],
-                "level": "DEBUG",
-                "propagate": True,
-            },
+    },
+    "handlers": {
+        "console": {
+            "level": "DEBUG",
+            "class": "logging.StreamHandler",
+            "formatter": "verbose",
         },
     },
-    # Django Matt specific settings for staging
-    "DJANGO_MATT": {
-        "BENCHMARK_ENABLED": True,
-        "CACHE_ENABLED": True,
-        "CACHE_TIMEOUT": 300,  # 5 minutes
-        "DB_TYPE": "postgres",  # Default to PostgreSQL
+    "loggers": {
+        "django": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": True,
+        },
+        "django_matt": {
+            "handlers": ["console"],
+            "level": "DEBUG",
+            "propagate": True,
+        },
     },
-    # Database settings for staging
-    "DATABASES": {
-        "default": {
-            "ENGINE": "django.db.backends.postgresql",
-            "NAME": os.environ.get("DB_NAME", "django_matt_staging"),
-            "USER": os.environ.get("DB_USER", "django_matt"),
-            "PASSWORD": os.environ.get("DB_PASSWORD", ""),
-            "HOST": os.environ.get("DB_HOST", "localhost"),
-            "PORT": os.environ.get("DB_PORT", "5432"),
-            "CONN_MAX_AGE": int(
-                os.environ.get("DB_CONN_MAX_AGE", "0")
-            ),  # ASGI requires 0 (Django #33497)
-            "OPTIONS": {},
-        }
+}
+
+# Password validation (same as production)
+_AUTH_PASSWORD_VALIDATORS = [
+    {
+        "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
     },
-    # Password validation (same as production)
-    "AUTH_PASSWORD_VALIDATORS": [
-        {
-            "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
+    {
+        "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
+        "OPTIONS": {
+            "min_length": 10,
         },
-        {
-            "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
-            "OPTIONS": {
-                "min_length": 10,
-            },
-        },
-        {
-            "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
+    },
+]
+
+
+@cache
+def get_settings() -> dict[str, Any]:
+    """
+    Build the staging settings, reading environment variables on first call.
+
+    Returns:
+        The staging settings dictionary.
+    """
+    return {
+        "DEBUG": False,
+        "SECRET_KEY": os.environ.get("DJANGO_SECRET_KEY"),  # Must be set in environment variables
+        "ALLOWED_HOSTS": os.environ.get("ALLOWED_HOSTS", "").split(","),
+        # Security settings (less strict than production)
+        "SECURE_SSL_REDIRECT": False,
+        "SESSION_COOKIE_SECURE": False,
+        "CSRF_COOKIE_SECURE": False,
+        # Email backend for staging
+        "EMAIL_BACKEND": "django.core.mail.backends.console.EmailBackend",
+        # Logging configuration
+        "LOGGING": _LOGGING,
+        # Django Matt specific settings for staging
+        "DJANGO_MATT": {
+            "BENCHMARK_ENABLED": True,
+            "CACHE_ENABLED": True,
+            "CACHE_TIMEOUT": 300,  # 5 minutes
+            "DB_TYPE": "postgres",  # Default to PostgreSQL
         },
-        {
-            "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
+        # Database settings for staging
+        "DATABASES": {
+            "default": {
+                "ENGINE": "django.db.backends.postgresql",
+                "NAME": os.environ.get("DB_NAME", "django_matt_staging"),
+                "USER": os.environ.get("DB_USER", "django_matt"),
+                "PASSWORD": os.environ.get("DB_PASSWORD", ""),
+                "HOST": os.environ.get("DB_HOST", "localhost"),
+                "PORT": os.environ.get("DB_PORT", "5432"),
+                "CONN_MAX_AGE": int(
+                    os.environ.get("DB_CONN_MAX_AGE", "0")
+                ),  # ASGI requires 0 (Django #33497)
+                "OPTIONS": {},
+            }
         },
-    ],
-}
+        "AUTH_PASSWORD_VALIDATORS": _AUTH_PASSWORD_VALIDATORS,
+    }
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``staging.settings`` / ``from ... import settings`` working lazily
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
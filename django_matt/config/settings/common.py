@@ -15,16 +15,11 @@ Usage:
 from __future__ import annotations
 
 import os
-from pathlib import Path
 from typing import Any
 
+from django_matt import BASE_DIR
 from django_matt.compat import DJANGO_5_2_PLUS, DJANGO_6_0_PLUS, DJANGO_VERSION
 
-# Build paths inside the project
-# This will be overridden by the user's project
-BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
-
-
 # Common settings dictionary
 settings: dict[str, Any] = {
     # ==========================================================================
@@ -20,12 +20,7 @@ import os
 from typing import Any
 
 from django_matt.config.settings.common import DJANGO_5_2_PLUS
-
-
-def _get_bool_env(key: str, default: bool = False) -> bool:
-    """Get boolean from environment variable."""
-    return os.environ.get(key, str(default)).lower() in ("true", "1", "yes")
-
+from django_matt.config.utils import get_env_bool
 
 # Production-specific settings
 settings: dict[str, Any] = {
@@ -45,7 +40,7 @@ settings: dict[str, Any] = {
     "SECURE_HSTS_INCLUDE_SUBDOMAINS": True,
     "SECURE_HSTS_PRELOAD": True,
     # SSL/TLS
-    "SECURE_SSL_REDIRECT": _get_bool_env("SECURE_SSL_REDIRECT", True),
+    "SECURE_SSL_REDIRECT": get_env_bool("SECURE_SSL_REDIRECT", True),
     "SECURE_PROXY_SSL_HEADER": ("HTTP_X_FORWARDED_PROTO", "https"),
     # Cookies
     "SESSION_COOKIE_SECURE": True,
@@ -68,8 +63,8 @@ settings: dict[str, Any] = {
     "EMAIL_PORT": int(os.environ.get("EMAIL_PORT", 587)),
     "EMAIL_HOST_USER": os.environ.get("EMAIL_HOST_USER", ""),
     "EMAIL_HOST_PASSWORD": os.environ.get("EMAIL_HOST_PASSWORD", ""),
-    "EMAIL_USE_TLS": _get_bool_env("EMAIL_USE_TLS", True),
-    "EMAIL_USE_SSL": _get_bool_env("EMAIL_USE_SSL", False),
+    "EMAIL_USE_TLS": get_env_bool("EMAIL_USE_TLS", True),
+    "EMAIL_USE_SSL": get_env_bool("EMAIL_USE_SSL", False),
     "DEFAULT_FROM_EMAIL": os.environ.get("DEFAULT_FROM_EMAIL", "noreply@example.com"),
     "SERVER_EMAIL": os.environ.get("SERVER_EMAIL", os.environ.get("DEFAULT_FROM_EMAIL", "")),
     # ==========================================================================
@@ -96,7 +91,7 @@ settings: dict[str, Any] = {
                             "max_lifetime": int(os.environ.get("DB_POOL_MAX_LIFETIME", 3600)),
                         }
                     }
-                    if DJANGO_5_2_PLUS and _get_bool_env("DB_POOL_ENABLED", True)
+                    if DJANGO_5_2_PLUS and get_env_bool("DB_POOL_ENABLED", True)
                     else {}
                 ),
             },
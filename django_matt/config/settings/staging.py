@@ -20,6 +20,7 @@ import os
 from typing import Any
 
 from django_matt.config.settings.common import DJANGO_5_2_PLUS
+from django_matt.config.utils import get_env_bool
 
 # Staging-specific settings
 settings: dict[str, Any] = {
@@ -36,7 +37,7 @@ settings: dict[str, Any] = {
     "SECURE_HSTS_SECONDS": 3600,  # Shorter than prod for testing
     "SECURE_HSTS_INCLUDE_SUBDOMAINS": True,
     "SECURE_HSTS_PRELOAD": False,  # Don't preload in staging
-    "SECURE_SSL_REDIRECT": os.environ.get("SECURE_SSL_REDIRECT", "True").lower() == "true",
+    "SECURE_SSL_REDIRECT": get_env_bool("SECURE_SSL_REDIRECT", True),
     "SESSION_COOKIE_SECURE": True,
     "CSRF_COOKIE_SECURE": True,
     "SECURE_BROWSER_XSS_FILTER": True,
@@ -50,7 +51,7 @@ settings: dict[str, Any] = {
     "EMAIL_PORT": int(os.environ.get("EMAIL_PORT", 587)),
     "EMAIL_HOST_USER": os.environ.get("EMAIL_HOST_USER", ""),
     "EMAIL_HOST_PASSWORD": os.environ.get("EMAIL_HOST_PASSWORD", ""),
-    "EMAIL_USE_TLS": os.environ.get("EMAIL_USE_TLS", "True").lower() == "true",
+    "EMAIL_USE_TLS": get_env_bool("EMAIL_USE_TLS", True),
     "DEFAULT_FROM_EMAIL": os.environ.get("DEFAULT_FROM_EMAIL", "noreply@staging.example.com"),
     # ==========================================================================
     # Database (PostgreSQL with connection pooling)
@@ -3,8 +3,49 @@ Utility functions for the Django Matt configuration system.
 """
 
 import os
+from functools import lru_cache
 from typing import Any
 
+# Sentinel for single-lookup dict access; distinct from any stored value (including None)
+_MISSING = object()
+
+
+def _extend_unique(current: list[Any], new: list[Any]) -> list[Any]:
+    """Return ``current`` plus the items of ``new`` it does not already contain."""
+    try:
+        seen = set(current)
+        return current + [item for item in new if not (item in seen or seen.add(item))]
+    except TypeError:
+        # Unhashable items (e.g. dicts in LOGGING handlers) — fall back to equality scans
+        result = list(current)
+        for item in new:
+            if item not in result:
+                result.append(item)
+        return result
+
+
+def _merge_into(dst: dict[str, Any], src: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merge ``src`` into ``dst`` in place and return ``dst``.
+
+    Nested dictionaries are copied only when they actually receive overrides,
+    so untouched subtrees are shared with the original rather than rebuilt.
+    """
+    for key, value in src.items():
+        current = dst.get(key, _MISSING)
+        if isinstance(current, dict) and isinstance(value, dict):
+            # If both values are dictionaries, merge them recursively
+            if value:
+                dst[key] = _merge_into(current.copy(), value)
+        elif isinstance(current, list) and isinstance(value, list):
+            # If both values are lists, extend the base list with the override list
+            dst[key] = _extend_unique(current, value)
+        else:
+            # Otherwise, override the base value with the override value
+            dst[key] = value
+
+    return dst
+
 
 def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     """
@@ -17,20 +58,54 @@ def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]
     Returns:
         A new dictionary with the merged values.
     """
-    result = base.copy()
+    return _merge_into(base.copy(), override)
+
+
+# Recognised boolean spellings; anything else falls back to the caller's default
+_TRUTHY = frozenset(("true", "yes", "1", "y", "t", "on"))
+_FALSY = frozenset(("false", "no", "0", "n", "f", "off", ""))
+_BOOL_MAP = dict.fromkeys(_TRUTHY, True) | dict.fromkeys(_FALSY, False)
+
+
+# Parsers are memoized on the raw string rather than the variable name, so
+# changes to os.environ (tests, DB_MULTIPLE) are still picked up.
+@lru_cache(maxsize=256)
+def _parse_bool(value: str) -> bool | None:
+    return _BOOL_MAP.get(value.strip().lower())
 
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            # If both values are dictionaries, merge them recursively
-            result[key] = deep_merge(result[key], value)
-        elif key in result and isinstance(result[key], list) and isinstance(value, list):
-            # If both values are lists, extend the base list with the override list
-            result[key] = result[key] + [item for item in value if item not in result[key]]
-        else:
-            # Otherwise, override the base value with the override value
-            result[key] = value
 
-    return result
+@lru_cache(maxsize=256)
+def _parse_int(value: str) -> int | None:
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _parse_float(value: str) -> float | None:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _parse_list(value: str, separator: str) -> tuple[str, ...]:
+    return tuple(item.strip() for item in value.split(separator) if item.strip())
+
+
+@lru_cache(maxsize=256)
+def _parse_dict(
+    value: str, separator: str, key_value_separator: str
+) -> tuple[tuple[str, str], ...]:
+    pairs = []
+    for item in value.split(separator):
+        # partition() splits on the first separator in one call, no list allocation
+        key, sep, val = item.partition(key_value_separator)
+        if sep:
+            pairs.append((key.strip(), val.strip()))
+    return tuple(pairs)
 
 
 def get_env_bool(name: str, default: bool = False) -> bool:
@@ -44,8 +119,11 @@ def get_env_bool(name: str, default: bool = False) -> bool:
     Returns:
         The boolean value of the environment variable.
     """
-    value = os.environ.get(name, str(default)).lower()
-    return value in ("true", "yes", "1", "y", "t")
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    parsed = _parse_bool(value)
+    return default if parsed is None else parsed
 
 
 def get_env_int(name: str, default: int = 0) -> int:
@@ -59,10 +137,11 @@ def get_env_int(name: str, default: int = 0) -> int:
     Returns:
         The integer value of the environment variable.
     """
-    try:
-        return int(os.environ.get(name, default))
-    except (ValueError, TypeError):
+    value = os.environ.get(name)
+    if value is None:
         return default
+    parsed = _parse_int(value)
+    return default if parsed is None else parsed
 
 
 def get_env_float(name: str, default: float = 0.0) -> float:
@@ -76,10 +155,11 @@ def get_env_float(name: str, default: float = 0.0) -> float:
     Returns:
         The float value of the environment variable.
     """
-    try:
-        return float(os.environ.get(name, default))
-    except (ValueError, TypeError):
+    value = os.environ.get(name)
+    if value is None:
         return default
+    parsed = _parse_float(value)
+    return default if parsed is None else parsed
 
 
 def get_env_list(name: str, default: list[str] | None = None, separator: str = ",") -> list[str]:
@@ -101,7 +181,8 @@ def get_env_list(name: str, default: list[str] | None = None, separator: str = "
     if value is None:
         return default
 
-    return [item.strip() for item in value.split(separator) if item.strip()]
+    # The cached parse is an immutable tuple; hand callers their own list
+    return list(_parse_list(value, separator))
 
 
 def get_env_dict(
@@ -129,10 +210,4 @@ def get_env_dict(
     if value is None:
         return default
 
-    result = {}
-    for item in value.split(separator):
-        if key_value_separator in item:
-            key, value = item.split(key_value_separator, 1)
-            result[key.strip()] = value.strip()
-
-    return result
+    return dict(_parse_dict(value, separator, key_value_separator))
@@ -26,17 +26,17 @@ Usage::
 """
 
 import inspect
-from functools import wraps
+from collections.abc import Callable
+from functools import cache, wraps
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, get_type_hints
 
-import orjson
-
 if TYPE_CHECKING:
     pass
 from django.db.models import ForeignKey, ManyToManyField, ManyToOneRel
 from django.http import HttpRequest, JsonResponse
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from django_matt.conf import get_error_config as _get_error_config
 from django_matt.conf import get_matt_setting
@@ -44,10 +44,13 @@ from django_matt.conf import reset_cache as _reset_di_config  # noqa: F401 — b
 from django_matt.core.errors import (
     APIError,
     ConfigurationError,
-    ErrorHandler,
     NotFoundAPIError,
     ValidationAPIError,
+    _get_error_handler,
 )
+from django_matt.core.responses import OrjsonJsonResponse
+from django_matt.core.router import load_json_body
+from django_matt.core.schema import ModelSchema, _get_camel_case_config
 
 
 def _get_di_config() -> bool:
@@ -55,6 +58,104 @@ def _get_di_config() -> bool:
     return get_matt_setting("DI_AUTO_WIRE", False)
 
 
+# Query parameters reserved for pagination/rendering, never treated as filters
+_NON_FILTER_PARAMS = frozenset({"page", "page_size", "limit", "offset", "ordering", "format"})
+
+
+@cache
+def _field_accessors(model: type) -> tuple[tuple[str, ...], Callable[[Any], tuple]]:
+    """
+    Build (field names, attrgetter) for raw model serialization, once per model.
+
+    Foreign keys are read through their ``attname`` (``<name>_id``) so no
+    related object is fetched.
+    """
+    fields = model._meta.fields
+    names = tuple(f.name for f in fields)
+    getter = attrgetter(*(f.attname for f in fields))
+    if len(fields) == 1:
+        # attrgetter returns a bare value for a single attribute
+        single = getter
+
+        def getter(instance):
+            return (single(instance),)
+
+    return names, getter
+
+
+@cache
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter for serializing a page of ``schema`` instances, built once per schema."""
+    return TypeAdapter(list[schema])
+
+
+@cache
+def _route_hints(func) -> tuple[dict[str, Any], tuple[tuple[str, type[BaseModel]], ...]]:
+    """
+    Resolve type hints for a route function once per process.
+
+    ``get_type_hints`` re-evaluates string annotations and walks the MRO on
+    every call, so the result is memoized per underlying function rather than
+    recomputed for each controller instance.
+
+    Args:
+        func: The plain (unbound) route function
+
+    Returns:
+        Tuple of (hints, pydantic_params) where pydantic_params holds the
+        ``(name, model)`` pairs that are populated from the request body.
+    """
+    hints = get_type_hints(func)
+    pydantic_params = tuple(
+        (name, ptype)
+        for name, ptype in hints.items()
+        if name != "return"
+        and name != "request"
+        and inspect.isclass(ptype)
+        and issubclass(ptype, BaseModel)
+    )
+    return hints, pydantic_params
+
+
+@cache
+def _route_is_coro(func) -> bool:
+    """Whether a route function is async (cached per function)."""
+    return inspect.iscoroutinefunction(func)
+
+
+@cache
+def _route_takes_request(func) -> bool:
+    """Whether a route function accepts a ``request`` parameter (cached per function)."""
+    return "request" in inspect.signature(func).parameters
+
+
+@cache
+def _route_di_params(func) -> dict[str, Any] | None:
+    """
+    Find a route function's ``Depends()`` parameters once per process.
+
+    Only called when DI auto-wiring is enabled, so the DI package stays
+    unimported otherwise.
+
+    Args:
+        func: The plain (unbound) route function
+
+    Returns:
+        Mapping of parameter names to their dependency markers, or None
+    """
+    from django_matt.di.depends import DependencyMarker
+
+    di_params = {}
+    for pname, pparam in inspect.signature(func).parameters.items():
+        if pname in ("self", "cls", "request"):
+            continue
+        if pparam.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            continue
+        if isinstance(pparam.default, DependencyMarker):
+            di_params[pname] = pparam.default
+    return di_params or None
+
+
 class Controller:
     """
     Base controller class for Django Matt framework.
@@ -71,6 +172,9 @@ class Controller:
     auto_error_handling: bool = True  # Enable automatic error handling by default
     permission_classes: list = []
     middleware_classes: list = []
+    # (method_name, function) pairs for route-decorated methods, collected
+    # once per class by __init_subclass__.
+    _routes: tuple[tuple[str, Any], ...] = ()
 
     def __init_subclass__(cls, **kwargs: object) -> None:
         super().__init_subclass__(**kwargs)
@@ -82,6 +186,29 @@ class Controller:
             cls.permission_classes = list(cls.permission_classes)
         if "middleware_classes" not in cls.__dict__:
             cls.middleware_classes = list(cls.middleware_classes)
+        cls._routes = cls._collect_routes()
+
+    @classmethod
+    def _collect_routes(cls) -> tuple[tuple[str, Any], ...]:
+        """
+        Collect route-decorated methods across the MRO.
+
+        Walks base classes first so that a subclass attribute overriding a
+        route (with or without its own decorator) replaces the inherited one.
+
+        Returns:
+            Tuple of (method_name, function) pairs
+        """
+        routes: dict[str, Any] = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                if name.startswith("_"):
+                    continue
+                if callable(attr) and hasattr(attr, "_route_info"):
+                    routes[name] = attr
+                else:
+                    routes.pop(name, None)
+        return tuple(routes.items())
 
     def __init__(self) -> None:
         self._setup_methods()
@@ -94,49 +221,24 @@ class Controller:
         once instead of twice.
         """
         error_config = _get_error_config() if self.auto_error_handling else None
-        error_handler = ErrorHandler(debug=error_config["debug"]) if error_config else None
-
-        for method_name in dir(self):
-            if method_name.startswith("_"):
-                continue
+        # Resolve the exception path once: a controller-level handle_exception
+        # hook wins, otherwise a generic ErrorHandler is needed.
+        handle_exception = getattr(self, "handle_exception", None) if error_config else None
+        error_handler = (
+            _get_error_handler(error_config["debug"])
+            if error_config and handle_exception is None
+            else None
+        )
 
+        for method_name, _func in type(self)._routes:
             method = getattr(self, method_name)
-            if not callable(method) or not hasattr(method, "_route_info"):
-                continue
 
-            # Cache type hints once at init — not per-request
-            hints = get_type_hints(method)
-            is_coro = inspect.iscoroutinefunction(method)
-            takes_request = "request" in inspect.signature(method).parameters
-
-            # Pre-compute which params need Pydantic injection
-            pydantic_params = {
-                name: ptype
-                for name, ptype in hints.items()
-                if name != "return"
-                and name != "request"
-                and inspect.isclass(ptype)
-                and issubclass(ptype, BaseModel)
-            }
-
-            # Analyze DI params once at init — not per-request
-            di_params = None
-            if _get_di_config():
-                from django_matt.di.depends import DependencyMarker
-
-                sig = inspect.signature(method)
-                di_params_found = {}
-                for pname, pparam in sig.parameters.items():
-                    if pname in ("self", "cls", "request"):
-                        continue
-                    if pparam.kind in (
-                        inspect.Parameter.VAR_POSITIONAL,
-                        inspect.Parameter.VAR_KEYWORD,
-                    ):
-                        continue
-                    if isinstance(pparam.default, DependencyMarker):
-                        di_params_found[pname] = pparam.default
-                di_params = di_params_found if di_params_found else None
+            # Hints and signature analysis are cached per function — not per-instance
+            func = getattr(method, "__func__", method)
+            _, pydantic_params = _route_hints(func)
+            takes_request = _route_takes_request(func)
+            is_coro = _route_is_coro(func)
+            di_params = _route_di_params(func) if _get_di_config() else None
 
             # Pre-resolve permission instances once at init — not per-request
             # Method-level @guard() overrides controller-level permission_classes
@@ -159,6 +261,56 @@ class Controller:
                     getattr(method, "_skip_middleware", None),
                 )
 
+            # Build the DI/middleware handler once per method — not per-request.
+            # Plain routes (no DI, no scoped middleware) skip it entirely and
+            # call the method inline from the wrapper.
+            handler = None
+            if di_params is not None or _mw_stack is not None:
+
+                async def handler(
+                    _request,
+                    *_args,
+                    _method=method,
+                    _is_coro=is_coro,
+                    _di_params=di_params,
+                    _takes_request=takes_request,
+                    **_kwargs,
+                ):
+                    scope_token = None
+                    if _di_params is not None:
+                        from django_matt.di.container import _scoped_instances
+                        from django_matt.di.depends import aresolve_dependencies
+
+                        if _scoped_instances.get() is None:
+                            scope_token = _scoped_instances.set({})
+
+                        try:
+                            deps = await aresolve_dependencies(
+                                _method,
+                                request=_request,
+                                **_kwargs,
+                            )
+                            _kwargs.update(deps)
+                        except Exception:
+                            if scope_token is not None:
+                                _scoped_instances.reset(scope_token)
+                            raise
+
+                    try:
+                        if _takes_request:
+                            call_args = (_request, *_args)
+                        else:
+                            call_args = _args
+                        if _is_coro:
+                            result = await _method(*call_args, **_kwargs)
+                        else:
+                            result = _method(*call_args, **_kwargs)
+
+                        return result
+                    finally:
+                        if scope_token is not None:
+                            _scoped_instances.reset(scope_token)
+
             @wraps(method)
             async def wrapper(
                 request,
@@ -168,9 +320,10 @@ class Controller:
                 _pydantic_params=pydantic_params,
                 _error_handler=error_handler,
                 _error_config=error_config,
-                _di_params=di_params,
+                _handle_exception=handle_exception,
                 _perms=_permission_instances,
                 _takes_request=takes_request,
+                _handler=handler,
                 _middleware_stack=_mw_stack,
                 **kwargs,
             ):
@@ -181,85 +334,47 @@ class Controller:
                             if not perm.has_permission(request, None):
                                 status_code = getattr(perm, "status_code", 403)
                                 message = getattr(perm, "message", "Permission denied.")
-                                return JsonResponse({"detail": message}, status=status_code)
+                                return OrjsonJsonResponse({"detail": message}, status=status_code)
 
-                    # Parse body once with orjson if needed
+                    # Parse body once (shared with the router's view function).
+                    # Routes without Pydantic params never touch the body, and the
+                    # content type is checked before reading the (possibly large) stream.
                     if (
                         _pydantic_params
-                        and request.body
                         and request.content_type == "application/json"
+                        and request.body
                     ):
                         try:
-                            body_data = orjson.loads(request.body)
-                        except (ValueError, orjson.JSONDecodeError):
-                            return JsonResponse({"detail": "Invalid JSON"}, status=400)
+                            body_data = load_json_body(request)
+                        except ValueError:
+                            return OrjsonJsonResponse({"detail": "Invalid JSON"}, status=400)
 
-                        for param_name, param_type in _pydantic_params.items():
+                        for param_name, param_type in _pydantic_params:
                             try:
                                 kwargs[param_name] = param_type(**body_data)
                             except ValidationError as e:
-                                return JsonResponse(
+                                return OrjsonJsonResponse(
                                     {"detail": "Validation error", "errors": e.errors()},
                                     status=422,
                                 )
 
-                    # Inner handler: DI resolution + method call
-                    async def _inner_handler(
-                        _request,
-                        *_args,
-                        _method=_method,
-                        _is_coro=_is_coro,
-                        _di_params=_di_params,
-                        _takes_request=_takes_request,
-                        **_kwargs,
-                    ):
-                        scope_token = None
-                        if _di_params is not None:
-                            from django_matt.di.container import _scoped_instances
-                            from django_matt.di.depends import aresolve_dependencies
-
-                            if _scoped_instances.get() is None:
-                                scope_token = _scoped_instances.set({})
-
-                            try:
-                                deps = await aresolve_dependencies(
-                                    _method,
-                                    request=_request,
-                                    **_kwargs,
-                                )
-                                _kwargs.update(deps)
-                            except Exception:
-                                if scope_token is not None:
-                                    _scoped_instances.reset(scope_token)
-                                raise
-
-                        try:
-                            if _takes_request:
-                                call_args = (_request, *_args)
-                            else:
-                                call_args = _args
-                            if _is_coro:
-                                result = await _method(*call_args, **_kwargs)
-                            else:
-                                result = _method(*call_args, **_kwargs)
-
-                            return result
-                        finally:
-                            if scope_token is not None:
-                                _scoped_instances.reset(scope_token)
+                    # Fast path: call the route method directly
+                    if _handler is None:
+                        call_args = (request, *args) if _takes_request else args
+                        if _is_coro:
+                            return await _method(*call_args, **kwargs)
+                        return _method(*call_args, **kwargs)
 
-                    # Execute through middleware stack or call directly
+                    # Execute through middleware stack or call the handler directly
                     if _middleware_stack is not None:
-                        return await _middleware_stack.execute(
-                            request, _inner_handler, *args, **kwargs
-                        )
-                    return await _inner_handler(request, *args, **kwargs)
+                        return await _middleware_stack.execute(request, _handler, *args, **kwargs)
+                    return await _handler(request, *args, **kwargs)
 
                 except Exception as e:
                     if _error_config is None:
                         raise  # error handling disabled
-                    if hasattr(self, "handle_exception"):
-                        return self.handle_exception(e, request)
+                    if _handle_exception is not None:
+                        return _handle_exception(e, request)
                     error_detail = _error_handler.capture_exception(e, request)
                     return error_detail.to_response(
                         include_traceback=_error_config["include_traceback"],
@@ -275,9 +390,6 @@ class APIController(Controller):
     Provides additional functionality for API-specific concerns.
     """
 
-    # Class-level error handler — shared across all instances
-    _error_handler: ErrorHandler | None = None
-
     def handle_exception(self, exc: Exception, request: HttpRequest = None) -> JsonResponse:
         """
         Handle exceptions raised during request processing.
@@ -285,13 +397,9 @@ class APIController(Controller):
         """
         error_config = _get_error_config()
 
-        # Lazy-init class-level error handler
-        if APIController._error_handler is None:
-            APIController._error_handler = ErrorHandler(debug=error_config["debug"])
-
         # Handle specific API exceptions
         if isinstance(exc, APIError):
-            return JsonResponse(
+            return OrjsonJsonResponse(
                 {
                     "detail": str(exc),
                     "code": getattr(exc, "code", "error"),
@@ -302,7 +410,7 @@ class APIController(Controller):
 
         # Handle validation errors
         if isinstance(exc, ValidationError):
-            return JsonResponse(
+            return OrjsonJsonResponse(
                 {
                     "detail": "Validation error",
                     "errors": exc.errors(),
@@ -313,7 +421,7 @@ class APIController(Controller):
         # Handle model DoesNotExist exceptions
         if hasattr(exc, "__class__") and exc.__class__.__name__ == "DoesNotExist":
             model_name = exc.__class__.__module__.split(".")[-2]  # Get model name from module path
-            return JsonResponse(
+            return OrjsonJsonResponse(
                 {
                     "detail": f"{model_name} not found",
                     "code": "not_found",
@@ -322,7 +430,7 @@ class APIController(Controller):
             )
 
         # Use the error handler for other exceptions
-        error_detail = APIController._error_handler.capture_exception(exc, request)
+        error_detail = _get_error_handler(error_config["debug"]).capture_exception(exc, request)
         return error_detail.to_response(
             include_traceback=error_config["include_traceback"],
             include_snippet=error_config["include_snippet"],
@@ -404,13 +512,34 @@ class CRUDController(APIController):
         super().__init__()
         # Cache field introspection once at init — not per-request
         if self.model:
-            self._valid_filter_fields = frozenset(f.name for f in self.model._meta.fields)
+            self._field_names = tuple(f.name for f in self.model._meta.fields)
+            self._valid_filter_fields = frozenset(self._field_names)
             self._fk_fields = self._get_foreign_key_fields()
             self._m2m_fields = self._get_many_to_many_fields()
         else:
+            self._field_names = ()
             self._valid_filter_fields = frozenset()
             self._fk_fields = []
             self._m2m_fields = []
+        # Without a schema (or custom serializers), list rows can be fetched as
+        # dicts straight from the database instead of building model instances.
+        cls = type(self)
+        self._serialize_with_values = (
+            self.schema is None
+            and bool(self._field_names)
+            and cls._model_to_dict_fast is CRUDController._model_to_dict_fast
+            and cls._model_to_dict_raw is CRUDController._model_to_dict_raw
+        )
+        # Stock ModelSchema output can be dumped for a whole page in one
+        # pydantic-core call instead of one model_dump() per row; that call
+        # bypasses Python-level model_dump overrides, so those keep the row path.
+        self._batch_dump = (
+            self.schema is not None
+            and issubclass(self.schema, ModelSchema)
+            and self.schema.model_dump_response is ModelSchema.model_dump_response
+            and self.schema.model_dump is BaseModel.model_dump
+            and cls._model_to_dict_fast is CRUDController._model_to_dict_fast
+        )
 
     def get_queryset(self):
         """
@@ -513,9 +642,10 @@ class CRUDController(APIController):
         Raises:
             ValidationAPIError: If an unknown lookup suffix is used
         """
+        filters = {}
         for key, value in request.GET.items():
             # Skip pagination and special parameters
-            if key in ("page", "page_size", "limit", "offset", "ordering", "format"):
+            if key in _NON_FILTER_PARAMS:
                 continue
 
             # Handle field lookups (e.g., name__icontains) — uses cached field set
@@ -531,9 +661,10 @@ class CRUDController(APIController):
                             field=field_name,
                             code="invalid_lookup",
                         )
-                queryset = queryset.filter(**{key: value})
+                filters[key] = value
 
-        return queryset
+        # One filter() call — a single queryset clone and WHERE clause
+        return queryset.filter(**filters) if filters else queryset
 
     def _get_pagination_params(self, request: HttpRequest) -> tuple[int, int]:
         """
@@ -584,10 +715,13 @@ class CRUDController(APIController):
         limit, offset = self._get_pagination_params(request)
         paginated_qs = queryset[offset : offset + limit]
 
-        # Use fast serialization (model_construct, no re-validation)
-        items = []
-        async for item in paginated_qs:
-            items.append(self._model_to_dict_fast(item))
+        if self._serialize_with_values:
+            # Schemaless: one values() query, no model instances. Prefetches
+            # don't apply to dict rows, so drop them.
+            rows = paginated_qs.prefetch_related(None).values(*self._field_names)
+            items = [row async for row in rows]
+        else:
+            items = self._dump_instances([item async for item in paginated_qs])
 
         return {
             "items": items,
@@ -744,7 +878,7 @@ class CRUDController(APIController):
         created = await self.model.objects.abulk_create(model_instances)
 
         return {
-            "items": [self._model_to_dict_fast(instance) for instance in created],
+            "items": self._dump_instances(created),
             "count": len(created),
         }
 
@@ -836,15 +970,20 @@ class CRUDController(APIController):
             return schema_instance.model_dump()
         return self._model_to_dict_raw(instance)
 
+    def _dump_instances(self, instances: list) -> list[dict[str, Any]]:
+        """Serialize model instances for a multi-item response (no re-validation)."""
+        if self._batch_dump:
+            # model_construct per row, then a single batched dump
+            schema_instances = [self.schema.from_orm_fast(instance) for instance in instances]
+            return _list_adapter(self.schema).dump_python(
+                schema_instances, by_alias=_get_camel_case_config()
+            )
+        return [self._model_to_dict_fast(instance) for instance in instances]
+
     def _model_to_dict_raw(self, instance) -> dict[str, Any]:
         """Fallback: field-by-field conversion without schema."""
-        result = {}
-        for field in instance._meta.fields:
-            if isinstance(field, ForeignKey):
-                result[field.name] = getattr(instance, f"{field.name}_id")
-            else:
-                result[field.name] = getattr(instance, field.name)
-        return result
+        names, getter = _field_accessors(type(instance))
+        return dict(zip(names, getter(instance), strict=True))
 
     def get_query_optimization_info(self) -> dict[str, Any]:
         """
@@ -12,8 +12,10 @@ import json
 import logging
 import os
 import sys
+import time
 import traceback
-from functools import wraps
+from functools import lru_cache, partial, wraps
+from pathlib import Path
 from typing import Any, Callable
 
 from django.conf import settings
@@ -22,6 +24,9 @@ from django.http import HttpRequest, JsonResponse
 import orjson
 from pydantic import ValidationError
 
+from django_matt.core.responses import EncodedJsonResponse, OrjsonJsonResponse
+from django_matt.core.router import load_json_body
+
 logger = logging.getLogger("django_matt.errors")
 
 
@@ -41,6 +46,26 @@ class ErrorDetail:
     to either ``to_dict()`` implementation.
     """
 
+    __slots__ = (
+        "_code_snippet",
+        "_created",
+        "_exc_info",
+        "_snippet_loader",
+        "_timestamp",
+        "_traceback_str",
+        "_utils_style",
+        "code",
+        "context",
+        "error_type",
+        "exception_type",
+        "file_path",
+        "line_number",
+        "message",
+        "path",
+        "status_code",
+        "suggestion",
+    )
+
     def __init__(
         self,
         message: str,
@@ -57,6 +82,9 @@ class ErrorDetail:
         # Style B additional fields
         exception_type: str | None = None,
         file_path: str | None = None,
+        *,
+        exc_info: tuple | None = None,
+        snippet_loader: Callable[[], list[str] | None] | None = None,
     ):
         self.message = message
         # Normalise: exception_type and error_type are the same concept
@@ -74,9 +102,48 @@ class ErrorDetail:
         self.line_number = line_number
         self.context = context or {}
         self.suggestion = suggestion
-        self.traceback_str = traceback_str
-        self.code_snippet = code_snippet
-        self.timestamp = datetime.datetime.now().isoformat()
+        self._traceback_str = traceback_str
+        # (type, value, tb) formatted into traceback_str on first access
+        self._exc_info = exc_info
+        self._code_snippet = code_snippet
+        # Called to read the snippet from disk on first access
+        self._snippet_loader = snippet_loader
+        # Formatted on first read; most details are never serialized
+        self._created = time.time()
+        self._timestamp: str | None = None
+
+    @property
+    def timestamp(self) -> str:
+        """Local ISO-8601 creation time."""
+        if self._timestamp is None:
+            self._timestamp = datetime.datetime.fromtimestamp(self._created).isoformat()
+        return self._timestamp
+
+    @property
+    def code_snippet(self) -> list[str] | dict[int, str] | None:
+        """Source lines around the error, read lazily via ``snippet_loader`` when given."""
+        if self._snippet_loader is not None:
+            self._code_snippet = self._snippet_loader()
+            self._snippet_loader = None
+        return self._code_snippet
+
+    @code_snippet.setter
+    def code_snippet(self, value: list[str] | dict[int, str] | None) -> None:
+        self._code_snippet = value
+        self._snippet_loader = None
+
+    @property
+    def traceback_str(self) -> str | None:
+        """Formatted traceback, rendered lazily from ``exc_info`` when given."""
+        if self._traceback_str is None and self._exc_info is not None:
+            self._traceback_str = "".join(traceback.format_exception(*self._exc_info))
+            self._exc_info = None
+        return self._traceback_str
+
+    @traceback_str.setter
+    def traceback_str(self, value: str | None) -> None:
+        self._traceback_str = value
+        self._exc_info = None
 
     # ------------------------------------------------------------------
     # Style A serialisation (used by core/errors consumers)
@@ -120,11 +187,10 @@ class ErrorDetail:
         if include_traceback and self.traceback_str:
             result["traceback"] = self.traceback_str
 
-        if self.code_snippet:
-            if include_snippet or self._utils_style:
-                # utils style: always show snippet when present
-                # core style: only show when include_snippet=True
-                result["code_snippet"] = self.code_snippet
+        # utils style: always show snippet when present
+        # core style: only show when include_snippet=True
+        if (include_snippet or self._utils_style) and self.code_snippet:
+            result["code_snippet"] = self.code_snippet
 
         return result
 
@@ -138,8 +204,8 @@ class ErrorDetail:
     def to_response(
         self, include_traceback: bool = False, include_snippet: bool = False
     ) -> JsonResponse:
-        """Convert error details to a JsonResponse."""
-        return JsonResponse(
+        """Convert error details to a JsonResponse (encoded with orjson)."""
+        return OrjsonJsonResponse(
             self.to_dict(include_traceback=include_traceback, include_snippet=include_snippet),
             status=self.status_code,
         )
@@ -191,6 +257,59 @@ def _make_error_envelope(
     return envelope
 
 
+# Lazy translation strings are excluded from the envelope cache: they'd be
+# keyed by whatever language was active when first rendered
+_PLAIN_HINT = (str, type(None))
+
+
+@lru_cache(maxsize=256)
+def _encoded_error_envelope(status: int, detail: str, code: str, hint: str | None) -> bytes:
+    """Serialized context-free error envelope; repeated 404/401/403s reuse the bytes."""
+    return orjson.dumps(_make_error_envelope(status, detail, code=code, hint=hint))
+
+
+@lru_cache(maxsize=128)
+def _read_source_lines(path: str, mtime: float) -> tuple[str, ...]:
+    """Read a source file's lines; ``mtime`` is part of the key so edits invalidate."""
+    with open(path) as f:
+        return tuple(f.read().splitlines())
+
+
+# Exception type -> (HTTP status code, suggestion template), resolved by walking
+# the exception's MRO so subclasses inherit their base's mapping
+_EXC_META: dict[type, tuple[int, str]] = {
+    ValidationError: (422, "Check the request data against the schema requirements."),
+    PermissionError: (403, "Ensure the user has the necessary permissions for this action."),
+    FileNotFoundError: (
+        404,
+        "The file '{exc.filename}' could not be found. Check the path and file existence.",
+    ),
+    json.JSONDecodeError: (400, "The JSON data is invalid. Check the syntax and structure."),
+    KeyError: (400, "The key '{exc.args[0]}' was not found in the dictionary."),
+    AttributeError: (400, "Check that you're accessing a valid attribute on the object."),
+    NotImplementedError: (501, "This feature is not yet implemented."),
+}
+_DEFAULT_META = (500, "Review the error message and traceback for more information.")
+
+
+def _lookup_exc_meta(exc: Exception) -> tuple[int, str]:
+    """Return the (status code, suggestion template) registered for an exception."""
+    for cls in type(exc).__mro__:
+        meta = _EXC_META.get(cls)
+        if meta is not None:
+            return meta
+    return _DEFAULT_META
+
+
+def _get_source_lines(path: str) -> tuple[str, ...] | None:
+    """Return the (cached) lines of a source file, or None if it doesn't exist."""
+    try:
+        mtime = Path(path).stat().st_mtime
+    except OSError:
+        return None
+    return _read_source_lines(path, mtime)
+
+
 class ErrorHandler:
     """
     Error handler for Django Matt framework.
@@ -219,48 +338,46 @@ class ErrorHandler:
         """
         error_type = exc.__class__.__name__
         message = str(exc)
-        status_code = self._get_status_code(exc)
-        code = self._get_error_code(exc)
-
-        # Get traceback information
-        tb = traceback.extract_tb(sys.exc_info()[2])
-        if tb:
-            frame = tb[-1]  # Get the last frame (where the error occurred)
-            path = frame.filename
-            line_number = frame.lineno
-
-            # Get code snippet if in debug mode
-            code_snippet = None
-            if self.debug:
-                code_snippet = self._get_code_snippet(path, line_number)
+        status_code, code, suggestion = self._classify(exc)
+
+        # Fetch the active traceback once and reuse it below
+        exc_tb = sys.exc_info()[2]
+        if exc_tb is not None:
+            # Walk to the last frame (where the error occurred) without
+            # materializing the whole stack as FrameSummary objects
+            last = exc_tb
+            while last.tb_next is not None:
+                last = last.tb_next
+            path = last.tb_frame.f_code.co_filename
+            line_number = last.tb_lineno
         else:
             path = None
             line_number = None
-            code_snippet = None
 
-        # Format traceback
-        traceback_str = None
-        if self.debug:
-            traceback_str = "".join(traceback.format_exception(type(exc), exc, sys.exc_info()[2]))
+        # In debug mode the snippet is read only if the detail is serialized with it
+        snippet_loader = None
+        if self.debug and path is not None:
+            snippet_loader = partial(self._get_code_snippet, path, line_number)
+
+        # Keep the raw traceback; ErrorDetail formats it only if it's read
+        exc_info = (type(exc), exc, exc_tb) if self.debug else None
 
         # Build context
         context = {}
         if request:
-            context["request"] = {
+            request_context = {
                 "method": request.method,
                 "path": request.path,
-                "query_params": dict(request.GET.items()),
+                "query_params": request.GET.dict() if request.GET else {},
             }
 
-            # Add body if it's a JSON request
+            # Add body if it's a JSON request (reusing the view's parse when cached)
             if request.content_type == "application/json" and request.body:
                 try:
-                    context["request"]["body"] = orjson.loads(request.body)
-                except (orjson.JSONDecodeError, ValueError):
-                    context["request"]["body"] = "Invalid JSON"
-
-        # Generate suggestion
-        suggestion = self._generate_suggestion(exc, error_type)
+                    request_context["body"] = load_json_body(request)
+                except ValueError:
+                    request_context["body"] = "Invalid JSON"
+            context["request"] = request_context
 
         # Create error detail
         error_detail = ErrorDetail(
@@ -272,41 +389,35 @@ class ErrorHandler:
             line_number=line_number,
             context=context,
             suggestion=suggestion,
-            traceback_str=traceback_str,
-            code_snippet=code_snippet,
+            exc_info=exc_info,
+            snippet_loader=snippet_loader,
         )
 
-        # Log the error
-        logger.error(
-            f"Error: {error_type} - {message}",
-            extra={"error_detail": error_detail.to_dict(include_traceback=True)},
-        )
+        # Log the error (the detail dict, and with it the traceback, is only
+        # built when ERROR records are actually handled)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Error: %s - %s",
+                error_type,
+                message,
+                extra={"error_detail": error_detail.to_dict(include_traceback=True)},
+            )
 
         return error_detail
 
+    def _classify(self, exc: Exception) -> tuple[int, str, str]:
+        """Resolve the status code, error code and suggestion for an exception."""
+        status_code, suggestion = _lookup_exc_meta(exc)
+        if hasattr(exc, "status_code"):
+            status_code = exc.status_code
+        code = exc.code if hasattr(exc, "code") else exc.__class__.__name__.lower()
+        return status_code, code, suggestion.format(exc=exc)
+
     def _get_status_code(self, exc: Exception) -> int:
         """Get the appropriate HTTP status code for an exception."""
         if hasattr(exc, "status_code"):
             return exc.status_code
-
-        # Map common exceptions to status codes
-        if isinstance(exc, ValidationError):
-            return 422  # Unprocessable Entity
-        if isinstance(exc, PermissionError):
-            return 403  # Forbidden
-        if isinstance(exc, FileNotFoundError):
-            return 404  # Not Found
-        if (
-            isinstance(exc, json.JSONDecodeError)
-            or isinstance(exc, KeyError)
-            or isinstance(exc, AttributeError)
-        ):
-            return 400  # Bad Request
-        if isinstance(exc, NotImplementedError):
-            return 501  # Not Implemented
-
-        # Default to 500 Internal Server Error
-        return 500
+        return _lookup_exc_meta(exc)[0]
 
     def _get_error_code(self, exc: Exception) -> str:
         """Get a machine-readable error code for an exception."""
@@ -319,12 +430,10 @@ class ErrorHandler:
     def _get_code_snippet(self, path: str, line_number: int, context_lines: int = 5) -> list[str]:
         """Get a code snippet around the error location."""
         try:
-            if not os.path.exists(path):
+            lines = _get_source_lines(path)
+            if lines is None:
                 return None
 
-            with open(path) as f:
-                lines = f.readlines()
-
             start_line = max(0, line_number - context_lines - 1)
             end_line = min(len(lines), line_number + context_lines)
 
@@ -334,25 +443,7 @@ class ErrorHandler:
 
     def _generate_suggestion(self, exc: Exception, error_type: str) -> str:
         """Generate a helpful suggestion for fixing the error."""
-        if isinstance(exc, ValidationError):
-            return "Check the request data against the schema requirements."
-        if isinstance(exc, PermissionError):
-            return "Ensure the user has the necessary permissions for this action."
-        if isinstance(exc, FileNotFoundError):
-            return (
-                f"The file '{exc.filename}' could not be found. Check the path and file existence."
-            )
-        if isinstance(exc, json.JSONDecodeError):
-            return "The JSON data is invalid. Check the syntax and structure."
-        if isinstance(exc, KeyError):
-            return f"The key '{exc.args[0]}' was not found in the dictionary."
-        if isinstance(exc, AttributeError):
-            return "Check that you're accessing a valid attribute on the object."
-        if isinstance(exc, NotImplementedError):
-            return "This feature is not yet implemented."
-
-        # Default suggestion
-        return "Review the error message and traceback for more information."
+        return _lookup_exc_meta(exc)[1].format(exc=exc)
 
     # ------------------------------------------------------------------
     # Static / class methods (utils/errors style)
@@ -363,12 +454,10 @@ class ErrorHandler:
         file_path: str, line_number: int, context_lines: int = 3
     ) -> dict[int, str]:
         """Get a code snippet around the error location (returns line-keyed dict)."""
-        if not os.path.exists(file_path):
-            return {}
-
         try:
-            with open(file_path) as f:
-                lines = f.readlines()
+            lines = _get_source_lines(file_path)
+            if lines is None:
+                return {}
 
             start_line = max(0, line_number - context_lines - 1)
             end_line = min(len(lines), line_number + context_lines)
@@ -498,7 +587,24 @@ class ErrorHandler:
     ) -> JsonResponse:
         """Create a JSON response with detailed error information (utils/errors style)."""
         response_data = cls.format_response(exception, include_traceback)
-        return JsonResponse(response_data, status=status_code)
+        return OrjsonJsonResponse(response_data, status=status_code)
+
+
+def _env_debug() -> bool:
+    """Whether DJANGO_DEBUG is enabled in the environment."""
+    return os.environ.get("DJANGO_DEBUG", "False").lower() == "true"
+
+
+@lru_cache(maxsize=2)
+def _get_error_handler(debug: bool) -> ErrorHandler:
+    """Shared ErrorHandler per debug flag — it holds no per-request state."""
+    return ErrorHandler(debug=debug)
+
+
+@lru_cache(maxsize=1)
+def _default_error_handler() -> ErrorHandler:
+    """ErrorHandler for the process's DJANGO_DEBUG setting, resolved on first use."""
+    return _get_error_handler(_env_debug())
 
 
 class APIError(Exception):
@@ -506,8 +612,11 @@ class APIError(Exception):
     Base class for API errors in Django Matt.
 
     This exception can be raised with custom status codes and error details.
+    Subclasses set ``default_suggestion`` for the hint used when none is given.
     """
 
+    default_suggestion: str | None = None
+
     def __init__(
         self,
         message: str,
@@ -519,14 +628,19 @@ class APIError(Exception):
         self.message = message
         self.status_code = status_code
         self.code = code
-        self.context = context or {}
-        self.suggestion = suggestion
+        self.context = context if context is not None else {}
+        self.suggestion = suggestion or self.default_suggestion
         super().__init__(message)
 
     def to_response(self) -> JsonResponse:
         """Render the standard error envelope as a JSON response."""
-        is_debug = os.environ.get("DJANGO_DEBUG", "False").lower() == "true"
-        extra = self.context if (is_debug and self.context) else None
+        extra = self.context if (self.context and _env_debug()) else None
+        if extra is None and type(self.message) is str and type(self.suggestion) in _PLAIN_HINT:
+            # Without context the body depends only on these fields — reuse the bytes
+            content = _encoded_error_envelope(
+                self.status_code, self.message, self.code, self.suggestion
+            )
+            return EncodedJsonResponse(content, status=self.status_code)
         envelope = _make_error_envelope(
             self.status_code,
             self.message,
@@ -534,12 +648,14 @@ class APIError(Exception):
             code=self.code,
             hint=self.suggestion,
         )
-        return JsonResponse(envelope, status=self.status_code)
+        return OrjsonJsonResponse(envelope, status=self.status_code)
 
 
 class ValidationAPIError(APIError):
     """Error raised when validation fails."""
 
+    default_suggestion = "Check the request data against the schema requirements."
+
     def __init__(
         self,
         message: str = "Validation error",
@@ -557,7 +673,7 @@ class ValidationAPIError(APIError):
             status_code=status_code,
             code=code,
             context=context,
-            suggestion=suggestion or "Check the request data against the schema requirements.",
+            suggestion=suggestion,
         )
 
     def to_response(self) -> JsonResponse:
@@ -584,12 +700,14 @@ class ValidationAPIError(APIError):
             code=self.code,
             hint=self.suggestion,
         )
-        return JsonResponse(envelope, status=self.status_code)
+        return OrjsonJsonResponse(envelope, status=self.status_code)
 
 
 class NotFoundAPIError(APIError):
     """Error raised when a resource is not found."""
 
+    default_suggestion = "Check that the resource exists and that you have the correct ID."
+
     def __init__(
         self,
         message: str = "Resource not found",
@@ -612,14 +730,15 @@ class NotFoundAPIError(APIError):
             status_code=status_code,
             code=code,
             context=context,
-            suggestion=suggestion
-            or "Check that the resource exists and that you have the correct ID.",
+            suggestion=suggestion,
         )
 
 
 class PermissionAPIError(APIError):
     """Error raised when a user doesn't have permission."""
 
+    default_suggestion = "Ensure the user has the necessary permissions for this action."
+
     def __init__(
         self,
         message: str = "Permission denied",
@@ -639,14 +758,15 @@ class PermissionAPIError(APIError):
             status_code=status_code,
             code=code,
             context=context,
-            suggestion=suggestion
-            or "Ensure the user has the necessary permissions for this action.",
+            suggestion=suggestion,
         )
 
 
 class AuthenticationAPIError(APIError):
     """Error raised when authentication fails."""
 
+    default_suggestion = "Provide valid authentication credentials."
+
     def __init__(
         self,
         message: str = "Authentication required",
@@ -665,7 +785,7 @@ class AuthenticationAPIError(APIError):
             status_code=status_code,
             code=code,
             context=context,
-            suggestion=suggestion or "Provide valid authentication credentials.",
+            suggestion=suggestion,
         )
 
 
@@ -704,6 +824,8 @@ class RateLimitAPIError(APIError):
 class ConfigurationError(APIError):
     """Error raised when a controller or component is misconfigured."""
 
+    default_suggestion = "Check the controller/component configuration."
+
     def __init__(
         self,
         message: str = "Configuration error",
@@ -717,7 +839,7 @@ class ConfigurationError(APIError):
             status_code=status_code,
             code=code,
             context=context,
-            suggestion=suggestion or "Check the controller/component configuration.",
+            suggestion=suggestion,
         )
 
 
@@ -797,9 +919,7 @@ class ErrorMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
-        self.error_handler = ErrorHandler(
-            debug=os.environ.get("DJANGO_DEBUG", "False").lower() == "true"
-        )
+        self.error_handler = _get_error_handler(_env_debug())
         # Signal to Django's ASGI handler that this middleware is coroutine-aware.
         # Django 5.x imports iscoroutinefunction from inspect (not asyncio), which
         # checks inspect._is_coroutine (different sentinel). Use markcoroutinefunction
@@ -836,13 +956,10 @@ class ErrorMiddleware:
 
     def process_exception(self, request, exception) -> JsonResponse | None:
         """Process an exception and return a formatted error response."""
-        error_detail = self.error_handler.capture_exception(exception, request)
-
-        include_traceback = self.error_handler.debug
-        include_snippet = self.error_handler.debug
-
+        error_handler = self.error_handler
+        error_detail = error_handler.capture_exception(exception, request)
         return error_detail.to_response(
-            include_traceback=include_traceback, include_snippet=include_snippet
+            include_traceback=error_handler.debug, include_snippet=error_handler.debug
         )
 
 
@@ -864,16 +981,10 @@ def handle_exceptions(func) -> Callable:
                 return await func(request, *args, **kwargs)
             return func(request, *args, **kwargs)
         except Exception as exc:
-            error_handler = ErrorHandler(
-                debug=os.environ.get("DJANGO_DEBUG", "False").lower() == "true"
-            )
+            error_handler = _default_error_handler()
             error_detail = error_handler.capture_exception(exc, request)
-
-            include_traceback = error_handler.debug
-            include_snippet = error_handler.debug
-
             return error_detail.to_response(
-                include_traceback=include_traceback, include_snippet=include_snippet
+                include_traceback=error_handler.debug, include_snippet=error_handler.debug
             )
 
     return wrapper
@@ -0,0 +1,48 @@
+"""JSON response helpers shared by the core controller, router and error handling."""
+
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse
+
+import orjson
+
+_django_encoder = DjangoJSONEncoder()
+
+# Datetimes are passed through to DjangoJSONEncoder so their format (millisecond
+# precision, "Z" for UTC) matches what JsonResponse has always produced
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson doesn't handle natively (Decimal, lazy strings, ...)."""
+    return _django_encoder.default(obj)
+
+
+class OrjsonJsonResponse(JsonResponse):
+    """
+    ``JsonResponse`` that encodes its payload with orjson.
+
+    Skips ``DjangoJSONEncoder``'s pure-Python encoding path; types orjson
+    doesn't support natively (and datetimes, to keep Django's format) are
+    still delegated to it, and non-string dict keys are stringified as
+    ``json.dumps`` does. Still an instance of
+    ``JsonResponse`` so existing isinstance checks keep working.
+    """
+
+    def __init__(self, data: Any, safe: bool = True, **kwargs: Any) -> None:
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                "In order to allow non-dict objects to be serialized set the safe parameter to False."
+            )
+        kwargs.setdefault("content_type", "application/json")
+        content = orjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTIONS)
+        HttpResponse.__init__(self, content=content, **kwargs)
+
+
+class EncodedJsonResponse(JsonResponse):
+    """``JsonResponse`` around a payload that is already encoded JSON bytes."""
+
+    def __init__(self, content: bytes, **kwargs: Any) -> None:
+        kwargs.setdefault("content_type", "application/json")
+        HttpResponse.__init__(self, content=content, **kwargs)
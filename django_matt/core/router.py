@@ -20,19 +20,23 @@ Usage::
     urlpatterns = router.get_urls()
 """
 
+import dataclasses
+import functools
 import inspect
 import logging
-from collections.abc import Callable
-from typing import get_type_hints
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, get_type_hints
 
 import django
-from django.http import HttpResponseBase, JsonResponse
+from django.http import HttpResponseBase
 from django.urls import path
 
 import orjson
 from pydantic import BaseModel, ValidationError
 
 from django_matt._accel import HAS_RUST, RadixRouter
+from django_matt.core.responses import OrjsonJsonResponse
+from django_matt.core.schema import _get_camel_case_config
 
 logger = logging.getLogger("django_matt.router")
 
@@ -121,6 +125,102 @@ def parse_body(body_data: dict, schema: type[BaseModel] | None) -> BaseModel | d
     return body_data
 
 
+_UNSET = object()
+
+# Methods whose requests don't normally carry a JSON payload
+_BODYLESS_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+
+
+def _wants_body(endpoint: Callable, allowed_methods: frozenset[str] | None) -> bool:
+    """
+    Return True if the view function should parse the JSON body for an endpoint.
+
+    Endpoints that declare a ``body`` parameter always receive it. Endpoints that
+    only take ``**kwargs`` receive it on routes that can carry a payload; any
+    other endpoint never sees ``body``, so the parse is skipped entirely.
+    """
+    try:
+        params = inspect.signature(endpoint).parameters
+    except (TypeError, ValueError):
+        return True
+    if "body" in params:
+        return True
+    if not any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+        return False
+    return allowed_methods is None or not allowed_methods <= _BODYLESS_METHODS
+
+
+def load_json_body(request) -> object:
+    """
+    Parse the JSON request body once and cache it on the request object.
+
+    The router's view function and the controller wrapper both need the
+    decoded body; memoizing on the request keeps it to a single orjson parse.
+
+    Raises:
+        ValueError: If the body is not valid JSON (nothing is cached).
+    """
+    data = getattr(request, "_json_body", _UNSET)
+    if data is _UNSET:
+        data = orjson.loads(request.body)
+        request._json_body = data  # type: ignore[attr-defined]
+    return data
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Route(Mapping):
+    """
+    A registered endpoint in ``APIRouter.routes``.
+
+    Fields are read by attribute in the router itself; the read-only mapping
+    interface (``route["path"]``, ``route.get("tags", [])``) keeps the OpenAPI,
+    RPC and tooling consumers that treat routes as dicts working unchanged.
+    """
+
+    path: str
+    endpoint: Callable
+    methods: list[str]
+    name: str
+    response_model: type[BaseModel] | None = None
+    status_code: int = 200
+    tags: list[str] = dataclasses.field(default_factory=list)
+    responses: dict[int, type[BaseModel]] = dataclasses.field(default_factory=dict)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _ROUTE_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_ROUTE_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_ROUTE_FIELDS)
+
+
+_ROUTE_FIELDS = tuple(f.name for f in dataclasses.fields(Route))
+
+
+@functools.cache
+def _controller_routes(controller_class: type) -> tuple[tuple[str, dict], ...]:
+    """
+    (method_name, route_info) pairs for a controller class, scanned once per class.
+
+    ``Controller`` subclasses already collect their routes in declaration order;
+    other registered classes fall back to scanning public class attributes.
+    """
+    routes = getattr(controller_class, "_routes", None)
+    if routes is None:
+        routes = [
+            (name, attr)
+            for name in dir(controller_class)
+            if not name.startswith("_")
+            and callable(attr := getattr(controller_class, name, None))
+            and getattr(attr, "_route_info", None)
+        ]
+    return tuple((name, func._route_info) for name, func in routes)
+
+
 class APIRouter:
     """
     Main router class for Django Matt framework.
@@ -132,11 +232,13 @@ class APIRouter:
     def __init__(self, prefix: str = "", tags: list[str] = None):
         self.prefix = prefix
         self.tags = tags or []
-        self.routes = []
+        self.routes: list[Route] = []
         self.controllers = []
         # Rust-accelerated radix tree router (built lazily in get_urls)
         self._radix_router: RadixRouter | None = None
         self._radix_endpoints: dict[str, Callable] = {}
+        # get_urls() results keyed by csrf_exempt; cleared whenever routes change
+        self._urls_cache: dict[bool, list] = {}
 
     def add_route(
         self,
@@ -150,17 +252,18 @@ class APIRouter:
         responses: dict[int, type[BaseModel]] | None = None,
     ) -> Callable:
         """Add a route to the router."""
-        route = {
-            "path": path_pattern,
-            "endpoint": endpoint,
-            "methods": methods,
-            "name": name or endpoint.__name__,
-            "response_model": response_model,
-            "status_code": status_code,
-            "tags": tags or [],
-            "responses": responses or {},
-        }
+        route = Route(
+            path=path_pattern,
+            endpoint=endpoint,
+            methods=methods,
+            name=name or endpoint.__name__,
+            response_model=response_model,
+            status_code=status_code,
+            tags=tags or [],
+            responses=responses or {},
+        )
         self.routes.append(route)
+        self._urls_cache.clear()
         return endpoint
 
     def get(
@@ -296,18 +399,18 @@ class APIRouter:
     def include_router(self, router: "APIRouter", prefix: str = "") -> None:
         """Include another router in this router."""
         combined_prefix = self.prefix + prefix
-        for route in router.routes:
-            route_copy = route.copy()
-            route_copy["path"] = combined_prefix + route["path"]
-            route_copy["tags"] = route["tags"] + self.tags
-            self.routes.append(route_copy)
-
-        for controller in router.controllers:
-            self.controllers.append(controller)
+        tags = self.tags
+        self.routes.extend(
+            dataclasses.replace(route, path=combined_prefix + route.path, tags=route.tags + tags)
+            for route in router.routes
+        )
+        self.controllers.extend(router.controllers)
+        self._urls_cache.clear()
 
     def register_controller(self, controller_class: type) -> type:
         """Register a controller class with the router."""
         self.controllers.append(controller_class)
+        self._urls_cache.clear()
         return controller_class
 
     @staticmethod
@@ -315,36 +418,41 @@ class APIRouter:
         """Create an async view function that handles parsing and serialization."""
         body_schema = get_body_schema(endpoint)
         is_coro = inspect.iscoroutinefunction(endpoint)
+        has_response_model = response_model is not None
         # Pre-compute allowed methods set for O(1) lookup
         allowed_methods = frozenset(m.upper() for m in methods) if methods else None
+        # Decided once from the signature: endpoints that can't receive ``body``
+        # (and GET/DELETE-only ``**kwargs`` endpoints) never parse the payload
+        parses_body = _wants_body(endpoint, allowed_methods)
         # Analyze DI params once at registration — not per-request
         di_params = _analyze_di_params(endpoint)
+        if di_params is not None:
+            from django_matt.di.container import _scoped_instances
+            from django_matt.di.depends import aresolve_dependencies
 
-        async def view_func(request, *args, _di_params=di_params, **kwargs):
+        async def view_func(request, *args, **kwargs):
             # Enforce HTTP method
             if allowed_methods and request.method not in allowed_methods:
-                response = JsonResponse({"detail": "Method not allowed"}, status=405)
+                response = OrjsonJsonResponse({"detail": "Method not allowed"}, status=405)
                 response["Allow"] = ", ".join(sorted(allowed_methods))
                 return response
 
-            # Parse request body with orjson (single parse)
-            if request.body and request.content_type == "application/json":
+            # Parse request body with orjson (single parse). Django strips
+            # parameters such as charset from content_type; the body is read last.
+            if parses_body and request.content_type == "application/json" and request.body:
                 try:
-                    body_data = orjson.loads(request.body)
+                    body_data = load_json_body(request)
                     kwargs["body"] = parse_body(body_data, body_schema)
                 except ValidationError as e:
-                    return JsonResponse(
+                    return OrjsonJsonResponse(
                         {"detail": "Validation error", "errors": e.errors()},
                         status=422,
                     )
                 except ValueError:
-                    return JsonResponse({"detail": "Invalid JSON"}, status=400)
+                    return OrjsonJsonResponse({"detail": "Invalid JSON"}, status=400)
 
             # Call the endpoint (with DI resolution if needed)
-            if _di_params is not None:
-                from django_matt.di.container import _scoped_instances
-                from django_matt.di.depends import aresolve_dependencies
-
+            if di_params is not None:
                 # Create per-request scope if not already set
                 scope_token = None
                 if _scoped_instances.get() is None:
@@ -378,24 +486,25 @@ class APIRouter:
                 return result
 
             # Serialize the response (use aliases for camelCase when enabled)
-            from django_matt.core.schema import _get_camel_case_config
-
             _by_alias = _get_camel_case_config()
-            if isinstance(result, BaseModel):
-                result = result.model_dump(by_alias=_by_alias)
-            elif response_model and isinstance(result, dict):
+            if has_response_model and isinstance(result, dict):
                 try:
-                    result = response_model(**result).model_dump(by_alias=_by_alias)
+                    result = response_model.model_validate(result)
                 except ValidationError as e:
-                    return JsonResponse(
+                    return OrjsonJsonResponse(
                         {"detail": "Response validation error", "errors": e.errors()},
                         status=500,
                     )
-            elif isinstance(result, list) and result and isinstance(result[0], BaseModel):
+            if isinstance(result, BaseModel):
+                return OrjsonJsonResponse(result.model_dump(by_alias=_by_alias), status=status_code)
+            if isinstance(result, list) and result and isinstance(result[0], BaseModel):
                 result = [item.model_dump(by_alias=_by_alias) for item in result]
 
-            return JsonResponse(result, status=status_code, safe=False)
+            return OrjsonJsonResponse(result, status=status_code, safe=False)
 
+        # Carry the endpoint's name/module/qualname so Django's resolver and
+        # tracebacks report the real endpoint instead of "view_func"
+        functools.update_wrapper(view_func, endpoint, updated=())
         return view_func
 
     @staticmethod
@@ -425,7 +534,14 @@ class APIRouter:
                          function so that CSRF middleware skips those endpoints.
                          This is set automatically by ``DjangoMattAPI`` when
                          ``csrf=False`` (the default).
+
+        The patterns are built once per ``csrf_exempt`` value and reused until
+        a route or controller is added; callers get a fresh list each time.
         """
+        cached = self._urls_cache.get(csrf_exempt)
+        if cached is not None:
+            return list(cached)
+
         # Collect all (path_pattern, view_func, name, methods) entries first,
         # then merge entries that share the same path_pattern.
         # Use a list to preserve registration order.
@@ -434,16 +550,16 @@ class APIRouter:
         # Add routes from decorators
         for route in self.routes:
             view_func = self._create_view_func(
-                endpoint=route["endpoint"],
-                response_model=route["response_model"],
-                status_code=route["status_code"],
-                methods=route["methods"],
+                endpoint=route.endpoint,
+                response_model=route.response_model,
+                status_code=route.status_code,
+                methods=route.methods,
             )
             if csrf_exempt:
                 view_func._csrf_exempt = True
             if _login_not_required is not None:
                 view_func = _login_not_required(view_func)
-            path_entries.append((route["path"], view_func, route["name"], route["methods"]))
+            path_entries.append((route.path, view_func, route.name, route.methods))
 
         # Add routes from controllers
         for controller_class in self.controllers:
@@ -451,20 +567,9 @@ class APIRouter:
             controller_prefix = getattr(controller, "prefix", "")
             combined_prefix = self.prefix + controller_prefix
 
-            for method_name in dir(controller):
-                if method_name.startswith("_"):
-                    continue
-
-                method = getattr(controller, method_name)
-                if not callable(method):
-                    continue
-
-                route_info = getattr(method, "_route_info", None)
-                if not route_info:
-                    continue
-
+            for method_name, route_info in _controller_routes(controller_class):
                 view_func = self._create_view_func(
-                    endpoint=method,
+                    endpoint=getattr(controller, method_name),
                     response_model=route_info.get("response_model"),
                     status_code=route_info.get("status_code", 200),
                     methods=route_info.get("methods"),
@@ -524,7 +629,7 @@ class APIRouter:
                 ):
                     handler = _method_map.get(request.method)
                     if handler is None:
-                        response = JsonResponse({"detail": "Method not allowed"}, status=405)
+                        response = OrjsonJsonResponse({"detail": "Method not allowed"}, status=405)
                         response["Allow"] = ", ".join(sorted(_method_map.keys()))
                         return response
                     return await handler(request, *args, **kwargs)
@@ -546,7 +651,8 @@ class APIRouter:
 
             register_radix_router(self)
 
-        return django_patterns
+        self._urls_cache[csrf_exempt] = django_patterns
+        return list(django_patterns)
 
     def _build_radix_router(
         self,
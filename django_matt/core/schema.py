@@ -6,13 +6,16 @@ inspired by ninja-schema but with enhanced features.
 """
 
 import datetime
+import functools
+import operator
 import uuid
+from collections.abc import Callable
 from decimal import Decimal
 from typing import Any, ClassVar, Literal, Optional, Union, get_args, get_origin
 
 from django.db import models
 
-from pydantic import BaseModel, Field, create_model, field_validator
+from pydantic import BaseModel, Field, field_validator
 from pydantic.alias_generators import to_camel
 
 # --- camelCase API config (cached at module level) ---
@@ -65,6 +68,17 @@ FIELD_TYPE_MAP: dict[type, type] = {
     models.ImageField: str,
 }
 
+
+@functools.cache
+def _optional(python_type: Any) -> Any:
+    """Return ``Optional[python_type]``, building each distinct alias only once."""
+    return Optional[python_type]
+
+
+# Annotation shared by every many-to-many field (optional list of related IDs)
+_OPTIONAL_ID_LIST = _optional(list[int])
+
+
 # Custom field type registry — populated by register_field_type()
 _CUSTOM_FIELD_TYPE_MAP: dict[type, type] = {}
 _CUSTOM_OPENAPI_SCHEMAS: dict[type, dict[str, str]] = {}
@@ -100,6 +114,7 @@ def register_field_type(
     elif django_field_class in _CUSTOM_OPENAPI_SCHEMAS:
         # Clear stale openapi_schema if re-registering without one
         del _CUSTOM_OPENAPI_SCHEMAS[django_field_class]
+    _clear_schema_caches()
 
 
 def unregister_field_type(django_field_class: type) -> None:
@@ -110,6 +125,7 @@ def unregister_field_type(django_field_class: type) -> None:
     """
     _CUSTOM_FIELD_TYPE_MAP.pop(django_field_class, None)
     _CUSTOM_OPENAPI_SCHEMAS.pop(django_field_class, None)
+    _clear_schema_caches()
 
 
 def get_custom_openapi_schemas() -> dict[type, dict[str, str]]:
@@ -254,19 +270,20 @@ class ModelSchemaMetaclass(type(BaseModel)):
             )
 
             if is_optional and python_type is not type(None):
-                python_type = Optional[python_type]
+                python_type = _optional(python_type)
 
             # Add to annotations
             annotations[schema_field_name] = python_type
 
-            # Set default value
+            # Set default value. Plain values go straight into the class body;
+            # only callables need a FieldInfo (for default_factory).
             if field.has_default() and not field.primary_key:
                 if callable(field.default):
                     namespace[schema_field_name] = Field(default_factory=field.default)
-                elif field.default is not models.NOT_PROVIDED:
-                    namespace[schema_field_name] = Field(default=field.default)
+                else:
+                    namespace[schema_field_name] = field.default
             elif is_optional:
-                namespace[schema_field_name] = Field(default=None)
+                namespace[schema_field_name] = None
 
         # Also iterate many-to-many fields (not included in _meta.fields)
         for field in django_model._meta.many_to_many:
@@ -283,7 +300,7 @@ class ModelSchemaMetaclass(type(BaseModel)):
                 continue
 
             # M2M fields are always optional (can be empty) and default to empty list
-            python_type = Optional[list[int]]
+            python_type = _OPTIONAL_ID_LIST
             annotations[field_name] = python_type
             namespace[field_name] = Field(default_factory=list)
 
@@ -459,6 +476,41 @@ class ModelSchema(BaseModel, metaclass=ModelSchemaMetaclass):
         return self._django_model(**data)
 
 
+@functools.cache
+def _model_field_table(
+    model_class: type[models.Model], depth: int = 0
+) -> tuple[tuple[str, ...], tuple[Any, ...], tuple[bool, ...], tuple[Any, ...], tuple[str, ...]]:
+    """
+    Reflect a model's fields once into parallel tuples for schema generation.
+
+    Returns:
+        ``(names, python_types, nullable, defaults, m2m_names)``. ``nullable``
+        marks non-PK fields with ``null=True``; ``defaults`` holds each field's
+        default, or ``NOT_PROVIDED`` for PKs and fields without one.
+    """
+    fields = model_class._meta.fields
+    return (
+        tuple(f.name for f in fields),
+        tuple(_get_python_type_for_field(f, depth) for f in fields),
+        tuple(f.null and not f.primary_key for f in fields),
+        tuple(models.NOT_PROVIDED if f.primary_key else f.default for f in fields),
+        tuple(f.name for f in model_class._meta.many_to_many),
+    )
+
+
+def _clear_schema_caches() -> None:
+    """Drop cached field tables and generated schemas (field type registry changed)."""
+    _custom_type_for_class.cache_clear()
+    _model_field_table.cache_clear()
+    _build_schema.cache_clear()
+    for cache in _schema_class_caches:
+        cache.clear()
+
+
+# Per-class caches created by Schema.from_django_model
+_schema_class_caches: list[dict] = []
+
+
 def create_schema_from_model(
     model_class: type[models.Model],
     name: str | None = None,
@@ -472,7 +524,9 @@ def create_schema_from_model(
     Dynamically create a Pydantic schema from a Django model.
 
     For most cases, prefer using ModelSchema class directly.
-    This function is useful for programmatic schema creation.
+    This function is useful for programmatic schema creation. Schemas are
+    cached per (model, name, projection, base class), so repeated calls with
+    the same arguments return the same class.
 
     Args:
         model_class: The Django model class
@@ -489,78 +543,98 @@ def create_schema_from_model(
     if name is None:
         name = f"{model_class.__name__}Schema"
 
-    if exclude is None:
-        exclude = []
-    if optional is None:
-        optional = []
-
-    # Get all fields from the model
-    fields = {}
-    field_definitions = {}
+    return _build_schema(
+        model_class,
+        name,
+        include=frozenset(include) if include is not None else None,
+        exclude=frozenset(exclude or ()),
+        optional=frozenset(optional or ()),
+        depth=depth,
+        base_class=base_class,
+    )
 
-    for field in model_class._meta.fields:
-        field_name = field.name
 
+@functools.cache
+def _build_schema(
+    model_class: type[models.Model],
+    name: str,
+    *,
+    include: frozenset[str] | None,
+    exclude: frozenset[str],
+    optional: frozenset[str],
+    depth: int,
+    base_class: type[BaseModel],
+) -> type[BaseModel]:
+    """Build the schema for create_schema_from_model (arguments already normalized)."""
+    names, python_types, nullable, defaults, m2m_names = _model_field_table(model_class, depth)
+
+    # Class body for the schema: annotations plus defaults for non-required fields
+    annotations: dict[str, Any] = {}
+    namespace: dict[str, Any] = {"__module__": __name__, "__annotations__": annotations}
+    for field_name, python_type, is_null, field_default in zip(
+        names, python_types, nullable, defaults, strict=True
+    ):
         # Skip if not in include or in exclude
         if include is not None and field_name not in include:
             continue
         if field_name in exclude:
             continue
 
-        # Get the Python type for this field
-        python_type = _get_python_type_for_field(field, depth)
-
         # Handle nullable/optional fields.
         # PKs are never Optional; blank is not a DB-nullability signal.
-        is_optional = (
-            (field.null and not field.primary_key)
-            or field_name in optional
-            or (field.has_default() and not field.primary_key)
-        )
+        has_default = field_default is not models.NOT_PROVIDED
+        is_optional = is_null or field_name in optional or has_default
 
         if is_optional:
-            python_type = Optional[python_type]
-
-        # Determine default value
-        if field.has_default() and not field.primary_key:
-            if callable(field.default):
-                default = Field(default_factory=field.default)
-            elif field.default is not models.NOT_PROVIDED:
-                default = Field(default=field.default)
+            python_type = _optional(python_type)
+        annotations[field_name] = python_type
+
+        # Determine default value (required fields get none). Plain values go
+        # straight into the class body; only callables need a FieldInfo.
+        if has_default:
+            if callable(field_default):
+                namespace[field_name] = Field(default_factory=field_default)
             else:
-                default = Field(default=None) if is_optional else ...
+                namespace[field_name] = field_default
         elif is_optional:
-            default = Field(default=None)
-        else:
-            default = ...
-
-        fields[field_name] = (python_type, default)
+            namespace[field_name] = None
 
     # Also iterate many-to-many fields
-    for field in model_class._meta.many_to_many:
-        field_name = field.name
-
+    for field_name in m2m_names:
         if include is not None and field_name not in include:
             continue
         if field_name in exclude:
             continue
 
         # M2M fields are always optional and default to empty list
-        fields[field_name] = (Optional[list[int]], Field(default_factory=list))
+        annotations[field_name] = _OPTIONAL_ID_LIST
+        namespace[field_name] = Field(default_factory=list)
 
-    # Create the Pydantic model
-    schema_class = create_model(name, __base__=base_class, **fields)
+    # Create the Pydantic model through the regular class-creation path;
+    # create_model() would only re-normalize the same definitions first.
+    # The base's config is inherited as-is: BaseModel already slots its own
+    # bookkeeping, and with the default extra="ignore" instances carry no
+    # per-row extras dict, so there is no lighter layout to opt into.
+    schema_class = type(base_class)(name, (base_class,), namespace)
 
     # Add from_orm method
     @classmethod
     def from_orm(cls, obj):
+        # (field name, attrgetter) pairs, built once per schema class
+        getters = cls.__dict__.get("_orm_getters")
+        if getters is None:
+            getters = tuple((name, operator.attrgetter(name)) for name in cls.model_fields)
+            cls._orm_getters = getters
+
         data = {}
-        for field_name in cls.model_fields:
-            if hasattr(obj, field_name):
-                value = getattr(obj, field_name)
-                if isinstance(value, models.Model):
-                    value = value.pk
-                data[field_name] = value
+        for field_name, getter in getters:
+            try:
+                value = getter(obj)
+            except AttributeError:
+                continue
+            if isinstance(value, models.Model):
+                value = value.pk
+            data[field_name] = value
         return cls(**data)
 
     schema_class.from_orm = from_orm
@@ -655,15 +729,38 @@ def _get_fk_pk_type(field: models.ForeignKey | models.OneToOneField) -> type:
     return FIELD_TYPE_MAP.get(type(related_pk), int)
 
 
+_RELATION_FIELDS = (models.ForeignKey, models.OneToOneField)
+
+
+@functools.cache
+def _custom_type_for_class(field_class: type) -> type | None:
+    """Return the registered custom type for a field class, or None."""
+    for registered_class, python_type in _CUSTOM_FIELD_TYPE_MAP.items():
+        if issubclass(field_class, registered_class):
+            return python_type
+    return None
+
+
+@functools.cache
+def _mapped_type_for_class(field_class: type) -> type:
+    """
+    Return the FIELD_TYPE_MAP type for a field class.
+
+    Concrete Django field classes hit the map directly; subclasses resolve to
+    their closest mapped base class. Unknown field types map to Any.
+    """
+    for klass in field_class.__mro__:
+        python_type = FIELD_TYPE_MAP.get(klass)
+        if python_type is not None:
+            return python_type
+    return Any
+
+
 def _get_python_type_for_field(field: models.Field, depth: int = 0) -> type:
     """Get the Python/Pydantic type for a Django model field."""
-    # Handle foreign keys and one-to-one relationships
-    if isinstance(field, (models.ForeignKey, models.OneToOneField)):
-        if depth > 0:
-            # Return the related model's schema type
-            # For now, just return the ID
-            return int
-        return int  # Use the ID for relationships
+    # Foreign keys and one-to-one relationships use the related ID
+    if isinstance(field, _RELATION_FIELDS):
+        return int
 
     # Handle many-to-many relationships
     if isinstance(field, models.ManyToManyField):
@@ -671,9 +768,10 @@ def _get_python_type_for_field(field: models.Field, depth: int = 0) -> type:
 
     # Custom field type registry takes highest priority so users can
     # override even built-in Django field types if needed.
-    for field_class, python_type in _CUSTOM_FIELD_TYPE_MAP.items():
-        if isinstance(field, field_class):
-            return python_type
+    field_class = type(field)
+    custom_type = _custom_type_for_class(field_class)
+    if custom_type is not None:
+        return custom_type
 
     # Choices → Literal enum (Task 1.3): check before general mapping so that
     # e.g. a CharField with choices gets a union type rather than plain str.
@@ -681,55 +779,64 @@ def _get_python_type_for_field(field: models.Field, depth: int = 0) -> type:
     if choices_literal is not None:
         return choices_literal
 
-    # Look up the type in the mapping
-    for field_class, python_type in FIELD_TYPE_MAP.items():
-        if isinstance(field, field_class):
-            return python_type
+    return _mapped_type_for_class(field_class)
 
-    # Default to Any for unknown field types
-    return Any
 
+def _json_field() -> models.Field:
+    return models.JSONField(null=True)
 
-def _get_django_field_for_type(type_hint: type) -> models.Field:
-    """Get the Django field for a Python/Pydantic type."""
-    # Handle Optional types
+
+def _text_field() -> models.Field:
+    return models.TextField(null=True)
+
+
+# Map Python types to Django field factories (fields are built fresh per model)
+_TYPE_TO_DJANGO_FACTORY: dict[Any, Callable[[], models.Field]] = {
+    int: lambda: models.IntegerField(null=True),
+    str: lambda: models.CharField(max_length=255, null=True),
+    bool: lambda: models.BooleanField(null=True),
+    float: lambda: models.FloatField(null=True),
+    datetime.datetime: lambda: models.DateTimeField(null=True),
+    datetime.date: lambda: models.DateField(null=True),
+    datetime.time: lambda: models.TimeField(null=True),
+    uuid.UUID: lambda: models.UUIDField(null=True),
+    bytes: lambda: models.BinaryField(null=True),
+}
+
+# Container types (bare or parameterized) are stored as JSON
+_JSON_CONTAINER_TYPES = frozenset({list, tuple, set, frozenset, dict})
+
+
+@functools.cache
+def _django_field_factory(type_hint: Any) -> Callable[[], models.Field]:
+    """Resolve the Django field factory for a type hint (cached per hint)."""
+    # Handle Optional types (every factory already builds a nullable field)
     origin = get_origin(type_hint)
     if origin is Union:
         args = get_args(type_hint)
         if type(None) in args:
-            # It's an Optional type
             for arg in args:
                 if arg is not type(None):
-                    field = _get_django_field_for_type(arg)
-                    field.null = True
-                    return field
-
-    # Handle List types
-    if origin is list:
-        return models.JSONField(null=True)
-
-    # Map Python types to Django fields
-    type_to_field = {
-        int: lambda: models.IntegerField(null=True),
-        str: lambda: models.CharField(max_length=255, null=True),
-        bool: lambda: models.BooleanField(null=True),
-        float: lambda: models.FloatField(null=True),
-        datetime.datetime: lambda: models.DateTimeField(null=True),
-        datetime.date: lambda: models.DateField(null=True),
-        datetime.time: lambda: models.TimeField(null=True),
-        uuid.UUID: lambda: models.UUIDField(null=True),
-        bytes: lambda: models.BinaryField(null=True),
-        dict: lambda: models.JSONField(null=True),
-    }
+                    return _django_field_factory(arg)
 
-    if type_hint in type_to_field:
-        return type_to_field[type_hint]()
-
-    if origin is dict:
-        return models.JSONField(null=True)
+    # Handle container types: list[int], dict[str, Any], tuple, set, ...
+    if origin in _JSON_CONTAINER_TYPES or type_hint in _JSON_CONTAINER_TYPES:
+        return _json_field
 
     # Default to TextField for unknown types
-    return models.TextField(null=True)
+    return _TYPE_TO_DJANGO_FACTORY.get(type_hint, _text_field)
+
+
+def _get_django_field_for_type(type_hint: type) -> models.Field:
+    """Get the Django field for a Python/Pydantic type."""
+    return _django_field_factory(type_hint)()
+
+
+def _freeze_arg(value: Any) -> Any:
+    """Make list-like create_schema_from_model arguments hashable for cache keys."""
+    if isinstance(value, (list, tuple, set)):
+        return frozenset(value)
+    return value
 
 
 # Legacy alias for backwards compatibility
@@ -740,10 +847,32 @@ class Schema(ModelSchema):
     Use ModelSchema directly for new code.
     """
 
+    # Schemas built by from_django_model; each class (Schema included) gets
+    # its own dict on first use so the field registry can clear it
+    _schema_cache: ClassVar[dict]
+
     @classmethod
     def from_django_model(cls, model_class: type[models.Model], **kwargs) -> type["Schema"]:
-        """Create a schema from a Django model."""
-        return create_schema_from_model(model_class, base_class=cls, **kwargs)
+        """
+        Create a schema from a Django model.
+
+        Each subclass keeps its own cache keyed on ``(model_class, kwargs)``,
+        so repeat calls return the already-built schema without going through
+        create_schema_from_model's argument normalization.
+        """
+        cache = cls.__dict__.get("_schema_cache")
+        if cache is None:
+            cache = {}
+            cls._schema_cache = cache
+            _schema_class_caches.append(cache)
+        try:
+            key = (model_class, frozenset((k, _freeze_arg(v)) for k, v in kwargs.items()))
+            return cache[key]
+        except TypeError:  # unhashable argument; build without the class-level cache
+            return create_schema_from_model(model_class, base_class=cls, **kwargs)
+        except KeyError:
+            schema = cache[key] = create_schema_from_model(model_class, base_class=cls, **kwargs)
+            return schema
 
     @classmethod
     def to_django_model(cls, **kwargs) -> type[models.Model]:
@@ -13,6 +13,14 @@ from django.db import connection, connections
 from django.db.models import ExpressionWrapper, F, Func, Q, Value
 from django.db.models.functions import Cast, Coalesce
 
+# PostgreSQL support. The subpackage only needs Django at import time
+# (pgvector is probed with find_spec and imported on first use), so there is
+# no optional import to guard here.
+from . import postgres
+
+# Raw SQL cursor helpers
+from .cursors import FETCH_BATCH_SIZE, fetch_dict_rows, iter_dict_rows
+
 # Import hybrid properties
 from .hybrid import (
     HybridManager,
@@ -20,6 +28,9 @@ from .hybrid import (
     hybrid_method,
     hybrid_property,
 )
+
+# Per-connection metadata cache
+from .meta_cache import cached_per_connection, connection_vendor, invalidate_db_meta
 from .planetscale import (
     # Branch management
     BranchInfo as PlanetScaleBranchInfo,
@@ -70,6 +81,22 @@ from .planetscale import (
     safe_migrate as planetscale_safe_migrate,
 )
 
+# Import connection pool pre-warming
+from .pool_warmup import prewarm_connections, warmup_if_configured
+from .postgres import (
+    HAS_PGVECTOR,
+    # PostgreSQL utilities
+    check_postgres_connection,
+    create_extension,
+    create_vector_index,
+    execute_sql,
+    has_extension,
+    is_postgres_version_compatible,
+    list_extensions,
+    setup_pgvector,
+    vector_manager,
+)
+
 # Import soft delete support
 from .soft_delete import (
     SoftDeleteManager,
@@ -80,36 +107,15 @@ from .soft_delete import (
     soft_delete_cascade,
 )
 
-# Import connection pool pre-warming
-from .pool_warmup import prewarm_connections, warmup_if_configured
-
 HAS_PLANETSCALE = True
+HAS_POSTGRES = True
 
-# Import PostgreSQL support if available
-try:
-    from .postgres import (
-        HAS_PGVECTOR,
-        CosineDistance,
-        L2Distance,
-        MaxInnerProduct,
-        # Vector support
-        VectorField,
-        # PostgreSQL utilities
-        check_postgres_connection,
-        create_extension,
-        create_vector_index,
-        execute_sql,
-        has_extension,
-        is_postgres_version_compatible,
-        list_extensions,
-        setup_pgvector,
-        vector_manager,
-    )
-
-    HAS_POSTGRES = True
-except ImportError:
-    HAS_POSTGRES = False
-    HAS_PGVECTOR = False
+
+def __getattr__(name):
+    # pgvector classes (VectorField, distances) are imported on first access
+    if name in postgres._PGVECTOR_NAMES:
+        return getattr(postgres, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db_type():
@@ -119,7 +125,7 @@ def get_db_type():
     Returns:
         str: The database type ('postgresql', 'mysql', 'sqlite', etc.)
     """
-    return connection.vendor
+    return connection_vendor()
 
 
 def is_postgres():
@@ -152,10 +158,14 @@ def is_sqlite():
     return get_db_type() == "sqlite"
 
 
+@cached_per_connection
 def get_db_version():
     """
     Get the version of the default database connection.
 
+    The version is read once per connection and cached until Django
+    reconnects.
+
     Returns:
         str: The database version.
     """
@@ -215,8 +225,35 @@ def execute_raw_sql(sql, params=None, database="default"):
     with conn.cursor() as cursor:
         cursor.execute(sql, params or [])
         if cursor.description:
-            columns = [col[0] for col in cursor.description]
-            return [dict(zip(columns, row, strict=False)) for row in cursor.fetchall()]
+            return fetch_dict_rows(cursor)
+        return []
+
+
+def iter_raw_sql(sql, params=None, database="default", itersize=FETCH_BATCH_SIZE):
+    """
+    Execute a row-returning SQL query and yield its rows one at a time.
+
+    Uses the connection's chunked cursor, which is a server-side cursor on
+    PostgreSQL, so rows are streamed from the server ``itersize`` at a time
+    instead of being loaded all at once. Use execute_raw_sql() for
+    statements that don't return rows.
+
+    Args:
+        sql: The SQL query to execute.
+        params: The parameters for the SQL query.
+        database: The name of the database connection to use.
+        itersize: Number of rows to fetch from the server per round.
+
+    Yields:
+        dict: One column → value dict per row.
+    """
+    conn = connections[database]
+    with conn.chunked_cursor() as cursor:
+        cursor.execute(sql, params or [])
+        if cursor.description:
+            yield from iter_dict_rows(cursor, itersize)
+
+
 __all__ = [
     # Database type checks
     "get_db_type",
@@ -224,11 +261,13 @@ __all__ = [
     "is_mysql",
     "is_sqlite",
     "get_db_version",
+    "invalidate_db_meta",
     # Database introspection
     "get_table_names",
     "get_table_description",
     # SQL execution
     "execute_raw_sql",
+    "iter_raw_sql",
     # Connection pool pre-warming
     "prewarm_connections",
     "warmup_if_configured",
@@ -274,24 +313,23 @@ __all__ = [
     "acheck_planetscale_connection",
 ]
 
-# Add PostgreSQL-specific exports if available
-if HAS_POSTGRES:
-    __all__.extend(
-        [
-            # Vector support
-            "VectorField",
-            "L2Distance",
-            "CosineDistance",
-            "MaxInnerProduct",
-            "setup_pgvector",
-            "create_vector_index",
-            "vector_manager",
-            # PostgreSQL utilities
-            "check_postgres_connection",
-            "is_postgres_version_compatible",
-            "create_extension",
-            "list_extensions",
-            "has_extension",
-            "execute_sql",
-        ]
-    )
+# PostgreSQL-specific exports
+__all__.extend(
+    [
+        # Vector support
+        "VectorField",
+        "L2Distance",
+        "CosineDistance",
+        "MaxInnerProduct",
+        "setup_pgvector",
+        "create_vector_index",
+        "vector_manager",
+        # PostgreSQL utilities
+        "check_postgres_connection",
+        "is_postgres_version_compatible",
+        "create_extension",
+        "list_extensions",
+        "has_extension",
+        "execute_sql",
+    ]
+)
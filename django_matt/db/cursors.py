@@ -0,0 +1,59 @@
+"""
+Cursor helpers shared by the raw SQL utilities in ``django_matt.db``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+# Rows pulled from the driver per fetchmany() call
+FETCH_BATCH_SIZE = 1000
+
+
+def fetch_dict_rows(cursor, batch_size: int = FETCH_BATCH_SIZE) -> list[dict[str, Any]]:
+    """
+    Return every remaining row of an executed cursor as a column → value dict.
+
+    Column names are read from ``cursor.description`` once, and rows are
+    pulled with ``fetchmany()`` so the driver's row tuples for the whole
+    result never have to exist alongside the dicts built from them.
+
+    Args:
+        cursor: A cursor that has executed a statement returning rows.
+        batch_size: Number of rows to fetch per round.
+
+    Returns:
+        list: One dict per row.
+    """
+    columns = tuple(col[0] for col in cursor.description)
+    results: list[dict[str, Any]] = []
+    while batch := cursor.fetchmany(batch_size):
+        results.extend([dict(zip(columns, row, strict=False)) for row in batch])
+    return results
+
+
+def iter_dict_rows(cursor, batch_size: int = FETCH_BATCH_SIZE) -> Iterator[dict[str, Any]]:
+    """
+    Yield the remaining rows of an executed cursor one dict at a time.
+
+    Only one ``fetchmany()`` batch is held in memory at once.
+
+    Args:
+        cursor: A cursor that has executed a statement returning rows.
+        batch_size: Number of rows to fetch per round.
+
+    Yields:
+        dict: One column → value dict per row.
+    """
+    columns = tuple(col[0] for col in cursor.description)
+    while batch := cursor.fetchmany(batch_size):
+        for row in batch:
+            yield dict(zip(columns, row, strict=False))
+
+
+__all__ = [
+    "FETCH_BATCH_SIZE",
+    "fetch_dict_rows",
+    "iter_dict_rows",
+]
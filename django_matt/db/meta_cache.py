@@ -0,0 +1,81 @@
+"""
+Per-connection cache for database metadata lookups.
+
+Server version and installed extensions don't change while a connection is
+open, so helpers like ``get_db_version()`` and ``list_extensions()`` read them
+once per connection instead of paying a round-trip on every call. Entries are
+keyed by connection alias and dropped whenever Django opens a new connection
+for that alias.
+
+The backend vendor is cached the same way, so vendor checks such as
+``is_postgres()`` are a dict lookup rather than a trip through Django's
+thread-local connection proxy.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable
+from typing import Any
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db import connection as default_connection
+from django.db.backends.signals import connection_created
+
+_DB_META_CACHE: dict[str, dict[str, Any]] = {}
+_VENDOR_CACHE: dict[str, str] = {}
+
+
+def cached_per_connection(func: Callable[[], Any]) -> Callable[[], Any]:
+    """
+    Memoize a zero-argument metadata lookup on the default connection.
+
+    The cached value lives until the connection is re-established or
+    ``invalidate_db_meta()`` is called for its alias.
+    """
+    key = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper():
+        entry = _DB_META_CACHE.setdefault(default_connection.alias, {})
+        try:
+            return entry[key]
+        except KeyError:
+            value = entry[key] = func()
+            return value
+
+    return wrapper
+
+
+def connection_vendor(alias: str = DEFAULT_DB_ALIAS) -> str:
+    """Return the backend vendor ('postgresql', 'sqlite', ...) for a connection alias."""
+    try:
+        return _VENDOR_CACHE[alias]
+    except KeyError:
+        vendor = _VENDOR_CACHE[alias] = connections[alias].vendor
+        return vendor
+
+
+def invalidate_db_meta(alias: str | None = None) -> None:
+    """Drop cached metadata for one connection alias, or for all of them."""
+    if alias is None:
+        _DB_META_CACHE.clear()
+        _VENDOR_CACHE.clear()
+    else:
+        _DB_META_CACHE.pop(alias, None)
+        _VENDOR_CACHE.pop(alias, None)
+
+
+def _on_connection_created(sender, connection, **kwargs) -> None:
+    invalidate_db_meta(connection.alias)
+    _VENDOR_CACHE[connection.alias] = connection.vendor
+
+
+connection_created.connect(_on_connection_created, dispatch_uid="django_matt.db.meta_cache")
+
+
+__all__ = [
+    "cached_per_connection",
+    "connection_vendor",
+    "invalidate_db_meta",
+]
@@ -5,21 +5,28 @@ This module provides utilities for working with PostgreSQL in Django Matt.
 It includes support for pgvector, connection pooling, and other PostgreSQL-specific features.
 """
 
+import functools
+
 from django.db import connection
 
-try:
-    from .vector import (
-        HAS_PGVECTOR,
-        CosineDistance,
-        L2Distance,
-        MaxInnerProduct,
-        VectorField,
-        create_vector_index,
-        setup_pgvector,
-        vector_manager,
-    )
-except ImportError:
-    HAS_PGVECTOR = False
+from django_matt.db.cursors import fetch_dict_rows
+from django_matt.db.meta_cache import cached_per_connection, connection_vendor, invalidate_db_meta
+
+from . import vector
+from .vector import (
+    _PGVECTOR_NAMES,
+    HAS_PGVECTOR,
+    create_vector_index,
+    setup_pgvector,
+    vector_manager,
+)
+
+
+def __getattr__(name):
+    # pgvector classes are resolved lazily by the vector module
+    if name in _PGVECTOR_NAMES:
+        return getattr(vector, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def check_postgres_connection():
@@ -29,13 +36,23 @@ def check_postgres_connection():
     Returns:
         bool: True if the connection is PostgreSQL, False otherwise.
     """
-    return connection.vendor == "postgresql"
+    return connection_vendor() == "postgresql"
+
+
+@functools.lru_cache(maxsize=16)
+def _major_version(version):
+    """Parse the major component of a version string like "12" or "12.4"."""
+    return int(str(version).split(".", 1)[0])
 
 
 def is_postgres_version_compatible(min_version="12.0"):
     """
     Check if the PostgreSQL version is compatible.
 
+    Only the major version is compared. The server version comes from the
+    driver's connection info (``connection.pg_version``, e.g. ``150004``),
+    so no query is issued.
+
     Args:
         min_version: The minimum required PostgreSQL version.
 
@@ -45,18 +62,7 @@ def is_postgres_version_compatible(min_version="12.0"):
     if not check_postgres_connection():
         return False
 
-    with connection.cursor() as cursor:
-        cursor.execute("SHOW server_version;")
-        version = cursor.fetchone()[0]
-
-        # Parse version string
-        major_version = version.split(".")[0]
-        if "." not in min_version:
-            min_major_version = min_version
-        else:
-            min_major_version = min_version.split(".")[0]
-
-        return int(major_version) >= int(min_major_version)
+    return connection.pg_version // 10000 >= _major_version(min_version)
 
 
 def create_extension(extension_name):
@@ -71,6 +77,15 @@ def create_extension(extension_name):
 
     with connection.cursor() as cursor:
         cursor.execute(f"CREATE EXTENSION IF NOT EXISTS {extension_name};")
+    invalidate_db_meta(connection.alias)
+
+
+@cached_per_connection
+def _installed_extensions():
+    """Names of installed extensions, read once per connection."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT extname FROM pg_extension;")
+        return tuple(row[0] for row in cursor.fetchall())
 
 
 def list_extensions():
@@ -83,9 +98,7 @@ def list_extensions():
     if not check_postgres_connection():
         raise ValueError("Current connection is not PostgreSQL")
 
-    with connection.cursor() as cursor:
-        cursor.execute("SELECT extname FROM pg_extension;")
-        return [row[0] for row in cursor.fetchall()]
+    return list(_installed_extensions())
 
 
 def has_extension(extension_name):
@@ -98,7 +111,10 @@ def has_extension(extension_name):
     Returns:
         bool: True if the extension is installed, False otherwise.
     """
-    return extension_name in list_extensions()
+    if not check_postgres_connection():
+        raise ValueError("Current connection is not PostgreSQL")
+
+    return extension_name in _installed_extensions()
 
 
 def execute_sql(sql, params=None):
@@ -118,8 +134,7 @@ def execute_sql(sql, params=None):
     with connection.cursor() as cursor:
         cursor.execute(sql, params or [])
         if cursor.description:
-            columns = [col[0] for col in cursor.description]
-            return [dict(zip(columns, row, strict=False)) for row in cursor.fetchall()]
+            return fetch_dict_rows(cursor)
         return []
 
 
@@ -17,37 +17,88 @@ Usage:
     similar_docs = Document.objects.order_by(CosineDistance('embedding', query_embedding))[:10]
 """
 
-try:
-    from pgvector.django import CosineDistance, L2Distance, MaxInnerProduct, VectorField
-
-    HAS_PGVECTOR = True
-except ImportError:
-    # Create placeholder classes if pgvector is not installed
-    HAS_PGVECTOR = False
-
-    class VectorField:
-        """Placeholder for pgvector's VectorField."""
-
-        def __init__(self, *args, **kwargs):
-            raise ImportError("pgvector is not installed. Install it with: uv add django-pgvector")
+import functools
+import importlib.util
+from typing import TYPE_CHECKING
 
-    class L2Distance:
-        """Placeholder for pgvector's L2Distance."""
-
-        def __init__(self, *args, **kwargs):
-            raise ImportError("pgvector is not installed. Install it with: uv add django-pgvector")
-
-    class CosineDistance:
-        """Placeholder for pgvector's CosineDistance."""
-
-        def __init__(self, *args, **kwargs):
-            raise ImportError("pgvector is not installed. Install it with: uv add django-pgvector")
+from django_matt.db.meta_cache import cached_per_connection, invalidate_db_meta
 
-    class MaxInnerProduct:
-        """Placeholder for pgvector's MaxInnerProduct."""
+if TYPE_CHECKING:
+    from pgvector.django import CosineDistance, L2Distance, MaxInnerProduct, VectorField
 
-        def __init__(self, *args, **kwargs):
-            raise ImportError("pgvector is not installed. Install it with: uv add django-pgvector")
+# Probe for the package without importing it; pgvector.django (and Django's
+# model field machinery behind it) is only imported on first use.
+HAS_PGVECTOR = importlib.util.find_spec("pgvector") is not None
+
+_PGVECTOR_NAMES = frozenset({"CosineDistance", "L2Distance", "MaxInnerProduct", "VectorField"})
+
+
+def _pgvector_missing(*args, **kwargs):
+    raise ImportError("pgvector is not installed. Install it with: uv add django-pgvector")
+
+
+@functools.cache
+def _pgvector():
+    """Import and return ``pgvector.django`` (only called when HAS_PGVECTOR)."""
+    import pgvector.django
+
+    return pgvector.django
+
+
+def _load_pgvector(name):
+    """Return a pgvector class, or a placeholder that raises if pgvector is missing."""
+    value = globals().get(name)
+    if value is not None:
+        return value
+
+    if HAS_PGVECTOR:
+        value = getattr(_pgvector(), name)
+    else:
+        value = type(
+            name,
+            (),
+            {"__doc__": f"Placeholder for pgvector's {name}.", "__init__": _pgvector_missing},
+        )
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name):
+    if name in _PGVECTOR_NAMES:
+        return _load_pgvector(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Server-side helper installed by setup_pgvector(). Identifiers are quoted by
+# format('%I'), so create_vector_index() only sends bind parameters.
+_VECTOR_INDEX_PROCEDURE = "dm_create_vec_idx"
+_VECTOR_INDEX_PROCEDURE_SIGNATURE = f"{_VECTOR_INDEX_PROCEDURE}(text, text, text, text, integer)"
+_VECTOR_INDEX_PROCEDURE_SQL = f"""
+CREATE OR REPLACE PROCEDURE {_VECTOR_INDEX_PROCEDURE}(
+    index_name text, table_name text, column_name text, index_type text, lists integer
+)
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF index_type = 'ivfflat' THEN
+        EXECUTE format(
+            'CREATE INDEX IF NOT EXISTS %I ON %I USING ivfflat (%I vector_l2_ops) WITH (lists = %s)',
+            index_name, table_name, column_name, lists
+        );
+    ELSIF index_type = 'hnsw' THEN
+        EXECUTE format(
+            'CREATE INDEX IF NOT EXISTS %I ON %I USING hnsw (%I vector_l2_ops)',
+            index_name, table_name, column_name
+        );
+    ELSE
+        EXECUTE format(
+            'CREATE INDEX IF NOT EXISTS %I ON %I USING btree (%I)',
+            index_name, table_name, column_name
+        );
+    END IF;
+END
+$$;
+"""
 
 
 def setup_pgvector():
@@ -55,6 +106,7 @@ def setup_pgvector():
     Set up pgvector in the database.
 
     This function should be called in a migration to ensure the pgvector extension is created.
+    It also installs the ``dm_create_vec_idx`` procedure used by ``create_vector_index()``.
 
     Example:
         # In a migration file
@@ -71,12 +123,30 @@ def setup_pgvector():
 
     with connection.cursor() as cursor:
         cursor.execute("CREATE EXTENSION IF NOT EXISTS vector;")
+        cursor.execute(_VECTOR_INDEX_PROCEDURE_SQL)
+    invalidate_db_meta(connection.alias)
+
+
+@cached_per_connection
+def _has_vector_index_procedure():
+    """Whether setup_pgvector() has installed the index procedure."""
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT to_regprocedure(%s) IS NOT NULL", [_VECTOR_INDEX_PROCEDURE_SIGNATURE]
+        )
+        return cursor.fetchone()[0]
 
 
 def create_vector_index(model, field_name, index_type="ivfflat", lists=100):
     """
     Create a vector index on a field.
 
+    When ``setup_pgvector()`` has installed the ``dm_create_vec_idx`` procedure
+    the index is created through ``CALL`` with bind parameters; otherwise the
+    DDL is built here with backend-quoted identifiers.
+
     Args:
         model: The Django model class
         field_name: The name of the VectorField
@@ -92,30 +162,69 @@ def create_vector_index(model, field_name, index_type="ivfflat", lists=100):
     from django.db import connection
 
     table_name = model._meta.db_table
+    column = model._meta.get_field(field_name).column
+    lists = int(lists)
 
-    with connection.cursor() as cursor:
-        if index_type == "ivfflat":
-            cursor.execute(
-                f"""
-                CREATE INDEX IF NOT EXISTS {table_name}_{field_name}_ivfflat_idx
-                ON {table_name} USING ivfflat ({field_name} vector_l2_ops)
-                WITH (lists = {lists});
-            """
-            )
-        elif index_type == "hnsw":
-            cursor.execute(
-                f"""
-                CREATE INDEX IF NOT EXISTS {table_name}_{field_name}_hnsw_idx
-                ON {table_name} USING hnsw ({field_name} vector_l2_ops);
-            """
-            )
-        else:
+    if index_type in ("ivfflat", "hnsw"):
+        index_name = f"{table_name}_{field_name}_{index_type}_idx"
+    else:
+        index_type = "btree"
+        index_name = f"{table_name}_{field_name}_idx"
+
+    if _has_vector_index_procedure():
+        with connection.cursor() as cursor:
             cursor.execute(
-                f"""
-                CREATE INDEX IF NOT EXISTS {table_name}_{field_name}_idx
-                ON {table_name} USING btree ({field_name});
-            """
+                f"CALL {_VECTOR_INDEX_PROCEDURE}(%s, %s, %s, %s, %s)",
+                [index_name, table_name, column, index_type, lists],
             )
+        return
+
+    # Identifiers are quoted by the backend; DDL can't take bind parameters,
+    # so the only literal (lists) is coerced to int before it is inlined.
+    quote = connection.ops.quote_name
+    prefix = f"CREATE INDEX IF NOT EXISTS {quote(index_name)} ON {quote(table_name)}"
+    target = quote(column)
+
+    if index_type == "ivfflat":
+        statement = f"{prefix} USING ivfflat ({target} vector_l2_ops) WITH (lists = {lists});"
+    elif index_type == "hnsw":
+        statement = f"{prefix} USING hnsw ({target} vector_l2_ops);"
+    else:
+        statement = f"{prefix} USING btree ({target});"
+
+    with connection.cursor() as cursor:
+        cursor.execute(statement)
+
+
+@functools.lru_cache(maxsize=128)
+def _vector_literal(values: tuple[float, ...]) -> str:
+    """Serialize a vector to pgvector's text format, once per distinct vector."""
+    return "[" + ",".join([str(float(v)) for v in values]) + "]"
+
+
+def _query_vector_value(query_vector):
+    """
+    Turn a query vector into an expression carrying its serialized form.
+
+    pgvector's distance expressions re-serialize a list or array on every
+    call. Repeated queries with the same vector (e.g. RAG retrieval) reuse
+    the cached text instead. Only plain lists, tuples and numpy arrays are
+    converted; expressions and pgvector objects (``Vector``, ``SparseVector``,
+    ...) are passed through for pgvector to serialize in their own format.
+    """
+    if isinstance(query_vector, (list, tuple)):
+        values = tuple(query_vector)
+    elif type(query_vector).__name__ == "ndarray" and type(query_vector).__module__ == "numpy":
+        values = tuple(query_vector.tolist())
+    else:
+        return query_vector
+    from django.db.models import Value
+
+    return Value(_vector_literal(values))
+
+
+# distance_func name -> pgvector distance class (resolved lazily)
+_DISTANCE_CLASSES = {"cosine": "CosineDistance", "l2": "L2Distance", "dot": "MaxInnerProduct"}
 
 
 class VectorManager:
@@ -143,14 +252,10 @@ class VectorManager:
         if not HAS_PGVECTOR:
             raise ImportError("pgvector is not installed. Install it with: uv add django-pgvector")
 
-        if distance_func == "cosine":
-            distance = CosineDistance(field_name, query_vector)
-        elif distance_func == "l2":
-            distance = L2Distance(field_name, query_vector)
-        elif distance_func == "dot":
-            distance = MaxInnerProduct(field_name, query_vector)
-        else:
+        class_name = _DISTANCE_CLASSES.get(distance_func)
+        if class_name is None:
             raise ValueError(f"Unknown distance function: {distance_func}")
+        distance = _load_pgvector(class_name)(field_name, _query_vector_value(query_vector))
 
         return queryset.order_by(distance)[:limit]
 
@@ -1,8 +1,13 @@
-# file-length-max: 650
+# file-length-max: 950
+import base64
+import functools
+import hashlib
 import logging
 import os
+import selectors
 import signal
 import socket
+import struct
 import subprocess
 import sys
 import threading
@@ -11,17 +16,66 @@ from collections.abc import Callable
 from pathlib import Path
 
 import orjson
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.events import FileSystemEvent, FileSystemEventHandler, PatternMatchingEventHandler
 from watchdog.observers import Observer
 
 logger = logging.getLogger("django_matt.hot_reload")
 
+# RFC 6455 handshake GUID and limits
+_WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_MAX_HANDSHAKE_BYTES = 8192
+_WEBSOCKET_CLOSE_FRAME = b"\x88\x00"
 
-class HotReloadEventHandler(FileSystemEventHandler):
+# Each scheduled watch is its own watchdog emitter (a thread and, on Linux,
+# an inotify instance; the default per-user limit is 128)
+_MAX_WATCH_EMITTERS = 32
+
+
+def _websocket_accept_key(key: str) -> str:
+    """Compute the Sec-WebSocket-Accept value for a client's Sec-WebSocket-Key."""
+    digest = hashlib.sha1(key.encode() + _WEBSOCKET_GUID).digest()
+    return base64.b64encode(digest).decode()
+
+
+def _websocket_text_frame(payload: bytes) -> bytes:
+    """Wrap a payload in a single unmasked WebSocket text frame."""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x81, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x81, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x81, 127, length)
+    return header + payload
+
+
+def _websocket_handshake_response(request: bytes) -> bytes | None:
+    """Build the 101 response for an HTTP upgrade request, or None if it isn't one."""
+    headers = {}
+    for line in request.split(b"\r\n")[1:]:
+        name, sep, value = line.partition(b":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+
+    key = headers.get(b"sec-websocket-key")
+    if not key or headers.get(b"upgrade", b"").lower() != b"websocket":
+        return None
+
+    return (
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {_websocket_accept_key(key.decode('latin-1'))}\r\n\r\n"
+    ).encode()
+
+
+class HotReloadEventHandler(PatternMatchingEventHandler):
     """
     File system event handler for hot reloading.
 
     This handler watches for file changes and triggers a reload when needed.
+    Directory events, unwatched extensions and ignored file patterns are
+    dropped by watchdog's pattern matching before ``on_any_event`` runs.
     """
 
     def __init__(
@@ -33,7 +87,7 @@ class HotReloadEventHandler(FileSystemEventHandler):
         debounce_seconds: float = 0.5,
     ):
         self.reload_callback = reload_callback
-        self.watched_extensions = watched_extensions or {".py", ".html", ".js", ".css"}
+        self.watched_extensions = frozenset(watched_extensions or {".py", ".html", ".js", ".css"})
         self.ignored_dirs = ignored_dirs or {
             "__pycache__",
             ".git",
@@ -52,55 +106,82 @@ class HotReloadEventHandler(FileSystemEventHandler):
             "*.dll",
         }
         self.debounce_seconds = debounce_seconds
-        self.last_event_time = 0
-        self.pending_reload = False
-        self.reload_timer = None
 
-    def on_any_event(self, event: FileSystemEvent):
-        """Handle any file system event."""
-        # Skip directory events
-        if event.is_directory:
-            return
+        # Debouncing runs on one long-lived worker thread: events push the
+        # deadline back and add their path to the batch, and the worker fires
+        # one reload for the whole batch once the deadline passes undisturbed
+        self._cv = threading.Condition()
+        self._deadline: float | None = None
+        self._pending_paths: set[str] = set()
+        self._stopped = False
+        self._worker: threading.Thread | None = None
+
+        super().__init__(
+            patterns=[f"*{ext}" for ext in self.watched_extensions],
+            ignore_patterns=list(self.ignored_files),
+            ignore_directories=True,
+            case_sensitive=True,
+        )
 
-        # Skip events for ignored directories
-        for ignored_dir in self.ignored_dirs:
-            if ignored_dir in event.src_path:
-                return
+        # PurePath.match() anchors patterns at the end of the path, so
+        # "*/node_modules/*" wouldn't catch nested files; ignored directories
+        # are matched against whole path components instead
+        self._ignored_dir_set = frozenset(self.ignored_dirs)
 
-        # Skip events for ignored files
-        for ignored_file in self.ignored_files:
-            if ignored_file.replace("*", "") in event.src_path:
-                return
+    def on_any_event(self, event: FileSystemEvent):
+        """Handle a file event that passed the watched/ignored patterns."""
+        path = self._event_path(event)
 
-        # Skip events for non-watched extensions
-        _, ext = os.path.splitext(event.src_path)
-        if ext not in self.watched_extensions:
+        # Skip events for ignored directories
+        if not self._ignored_dir_set.isdisjoint(Path(path).parts):
             return
 
-        # Debounce events
-        current_time = time.time()
-        if current_time - self.last_event_time < self.debounce_seconds:
-            # If we already have a pending reload, just update the time
-            self.last_event_time = current_time
-            return
+        with self._cv:
+            self._deadline = time.monotonic() + self.debounce_seconds
+            self._pending_paths.add(path)
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._debounce_loop, name="hot-reload-debounce", daemon=True
+                )
+                self._worker.start()
+            self._cv.notify()
+
+    def _debounce_loop(self):
+        """Fire a reload once no new event has arrived for ``debounce_seconds``."""
+        while True:
+            with self._cv:
+                self._cv.wait_for(lambda: self._deadline is not None or self._stopped)
+                # Each event moves the deadline; keep waiting until it holds
+                while not self._stopped and (remaining := self._deadline - time.monotonic()) > 0:
+                    self._cv.wait(remaining)
+                if self._stopped:
+                    return
+                paths = sorted(self._pending_paths)
+                self._deadline = None
+                self._pending_paths.clear()
 
-        self.last_event_time = current_time
+            try:
+                self._trigger_reload(paths)
+            except Exception:
+                logger.exception("Hot reload callback failed")
 
-        # Cancel any pending reload
-        if self.reload_timer:
-            self.reload_timer.cancel()
+    def stop(self):
+        """Stop the debounce worker; pending changes are dropped."""
+        with self._cv:
+            self._stopped = True
+            self._cv.notify()
+        if self._worker is not None:
+            self._worker.join(timeout=1)
 
-        # Schedule a reload after the debounce period
-        self.reload_timer = threading.Timer(
-            self.debounce_seconds, self._trigger_reload, args=[event]
-        )
-        self.reload_timer.daemon = True
-        self.reload_timer.start()
+    @staticmethod
+    def _event_path(event: FileSystemEvent) -> str:
+        """The changed file: the destination for moves (editors' atomic saves)."""
+        return getattr(event, "dest_path", "") or event.src_path
 
-    def _trigger_reload(self, event: FileSystemEvent):
-        """Trigger a reload after the debounce period."""
-        logger.info(f"File changed: {event.src_path}")
-        self.reload_callback(event.src_path)
+    def _trigger_reload(self, paths: list[str]):
+        """Trigger one reload for every file changed during the debounce period."""
+        logger.info(f"Files changed: {', '.join(paths)}")
+        self.reload_callback(paths)
 
 
 class MigrationDetector:
@@ -216,10 +297,17 @@ class WebSocketServer:
     def __init__(self, host: str = "localhost", port: int = 35729):
         self.host = host
         self.port = port
+        # Clients that completed the WebSocket handshake
         self.clients = set()
+        self._clients_lock = threading.Lock()
+        # Partial upgrade requests, keyed by socket (server loop only)
+        self._handshakes: dict[socket.socket, bytearray] = {}
         self.server_socket = None
         self.running = False
         self.thread = None
+        # Socket pair used by stop() to wake the accept loop
+        self._wakeup_r = None
+        self._wakeup_w = None
 
     def start(self):
         """Start the WebSocket server."""
@@ -227,6 +315,7 @@ class WebSocketServer:
             return
 
         self.running = True
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
         self.thread = threading.Thread(target=self._run_server)
         self.thread.daemon = True
         self.thread.start()
@@ -237,83 +326,179 @@ class WebSocketServer:
         """Stop the WebSocket server."""
         self.running = False
 
-        if self.server_socket:
-            self.server_socket.close()
+        if self._wakeup_w:
+            try:
+                self._wakeup_w.send(b"\0")
+            except OSError:
+                pass
 
         if self.thread:
             self.thread.join(timeout=1)
 
+        for sock in (self._wakeup_r, self._wakeup_w):
+            if sock:
+                sock.close()
+        self._wakeup_r = self._wakeup_w = None
+
         logger.info("WebSocket server stopped")
 
     def _run_server(self):
-        """Run the WebSocket server."""
+        """
+        Run the WebSocket server.
+
+        A single selector loop accepts connections, completes the WebSocket
+        handshake and watches every client for disconnects; only this thread
+        adds, removes or closes clients.
+        """
+        selector = selectors.DefaultSelector()
         try:
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.server_socket.bind((self.host, self.port))
             self.server_socket.listen(5)
-            self.server_socket.settimeout(1)
+            self.server_socket.setblocking(False)
+
+            # Block until a socket is ready or stop() writes to the wakeup
+            # socket, instead of waking up on a timeout to poll self.running
+            selector.register(self.server_socket, selectors.EVENT_READ)
+            selector.register(self._wakeup_r, selectors.EVENT_READ)
 
             while self.running:
-                try:
-                    client_socket, addr = self.server_socket.accept()
-                    client_thread = threading.Thread(
-                        target=self._handle_client, args=(client_socket, addr)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-                except TimeoutError:
-                    continue
-                except Exception as e:
-                    logger.error(f"Error accepting connection: {e}")
+                for key, _ in selector.select():
+                    if key.fileobj is self._wakeup_r:
+                        return
+                    if key.fileobj is self.server_socket:
+                        self._accept_client(selector)
+                    else:
+                        self._read_client(selector, key.fileobj, key.data)
         except Exception as e:
             logger.error(f"Error starting WebSocket server: {e}")
         finally:
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
+                    self._drop_client(selector, key.fileobj, key.data)
+            selector.close()
             if self.server_socket:
                 self.server_socket.close()
 
-    def _handle_client(self, client_socket, addr):
-        """Handle a client connection."""
+    def _accept_client(self, selector):
+        """Accept a pending connection and register it with the selector."""
         try:
-            self.clients.add(client_socket)
-            logger.info(f"Client connected: {addr}")
+            client_socket, addr = self.server_socket.accept()
+        except BlockingIOError:
+            return
+        except Exception as e:
+            logger.error(f"Error accepting connection: {e}")
+            return
 
-            # Keep the connection open
-            while self.running:
-                try:
-                    # Just check if the client is still connected
-                    data = client_socket.recv(1024)
-                    if not data:
-                        break
-                except OSError:
-                    break
-        finally:
-            client_socket.close()
-            self.clients.remove(client_socket)
+        # Blocking, so broadcasts can sendall(); the loop only recv()s when
+        # the selector reports the socket readable
+        client_socket.setblocking(True)
+        selector.register(client_socket, selectors.EVENT_READ, data=addr)
+        self._handshakes[client_socket] = bytearray()
+
+    def _read_client(self, selector, client_socket, addr):
+        """Read from a ready client; an empty read or error means it disconnected."""
+        try:
+            data = client_socket.recv(1024)
+        except OSError:
+            data = b""
+        if not data:
+            self._drop_client(selector, client_socket, addr)
+            return
+
+        pending = self._handshakes.get(client_socket)
+        if pending is not None:
+            self._continue_handshake(selector, client_socket, addr, pending, data)
+        elif data[0] & 0x0F == 0x8:
+            # Close frame: answer it and drop the client. Other client
+            # frames (pongs, text) carry nothing the server needs.
+            try:
+                client_socket.sendall(_WEBSOCKET_CLOSE_FRAME)
+            except OSError:
+                pass
+            self._drop_client(selector, client_socket, addr)
+
+    def _continue_handshake(self, selector, client_socket, addr, pending, data):
+        """Buffer the HTTP upgrade request and answer it once it is complete."""
+        pending += data
+        end = pending.find(b"\r\n\r\n")
+        if end == -1:
+            if len(pending) > _MAX_HANDSHAKE_BYTES:
+                self._drop_client(selector, client_socket, addr)
+            return
+
+        response = _websocket_handshake_response(bytes(pending[:end]))
+        if response is None:
+            logger.debug(f"Rejected non-WebSocket request from {addr}")
+            self._drop_client(selector, client_socket, addr)
+            return
+
+        try:
+            client_socket.sendall(response)
+        except OSError:
+            self._drop_client(selector, client_socket, addr)
+            return
+
+        del self._handshakes[client_socket]
+        with self._clients_lock:
+            self.clients.add(client_socket)
+        logger.info(f"Client connected: {addr}")
+
+    def _drop_client(self, selector, client_socket, addr):
+        """Unregister and close a client."""
+        selector.unregister(client_socket)
+        upgraded = self._handshakes.pop(client_socket, None) is None
+        with self._clients_lock:
+            self.clients.discard(client_socket)
+        client_socket.close()
+        if upgraded:
             logger.info(f"Client disconnected: {addr}")
 
-    def send_reload_message(self, file_path: str):
-        """Send a reload message to all connected clients."""
-        message = {"command": "reload", "path": file_path, "time": time.time()}
+    def send_reload_message(self, file_paths: str | list[str]):
+        """Send one reload message for the changed file(s) to all connected clients."""
+        if isinstance(file_paths, str):
+            file_paths = [file_paths]
+        message = {
+            "command": "reload",
+            "path": file_paths[0],
+            "paths": file_paths,
+            "time": time.time(),
+        }
 
-        message_json = orjson.dumps(message).decode()
-        message_bytes = f"data: {message_json}\n\n".encode()
+        # Framed once for every client
+        message_bytes = _websocket_text_frame(orjson.dumps(message))
 
-        disconnected_clients = set()
+        # Send from a snapshot so the server loop can accept and drop clients
+        # while the broadcast is in progress
+        with self._clients_lock:
+            clients = tuple(self.clients)
 
-        for client in self.clients:
+        disconnected_clients = []
+        for client in clients:
             try:
                 client.sendall(message_bytes)
             except OSError:
-                disconnected_clients.add(client)
+                disconnected_clients.append(client)
 
-        # Remove disconnected clients
+        # Shut dead clients down; the server loop sees EOF and removes them
         for client in disconnected_clients:
             try:
-                client.close()
+                client.shutdown(socket.SHUT_RDWR)
             except OSError:
                 pass
-            self.clients.remove(client)
+
+
+class _NewDirectoryHandler(FileSystemEventHandler):
+    """Report directories created under a non-recursive watch (unless ignored)."""
+
+    def __init__(self, callback: Callable[[str], None], ignored_dirs: set[str]):
+        self.callback = callback
+        self.ignored_dirs = ignored_dirs
+
+    def on_created(self, event: FileSystemEvent):
+        if event.is_directory and Path(event.src_path).name not in self.ignored_dirs:
+            self.callback(event.src_path)
 
 
 class HotReloader:
@@ -362,6 +547,7 @@ class HotReloader:
         self.websocket_port = websocket_port
 
         self.observer = None
+        self.event_handler: HotReloadEventHandler | None = None
         self.websocket_server = None
         self.server_process = None
         self.running = False
@@ -396,7 +582,7 @@ class HotReloader:
 
         # Start the file system observer
         self.observer = Observer()
-        event_handler = HotReloadEventHandler(
+        self.event_handler = event_handler = HotReloadEventHandler(
             reload_callback=self._handle_reload,
             watched_extensions=self.watched_extensions,
             ignored_dirs=self.ignored_dirs,
@@ -404,7 +590,7 @@ class HotReloader:
             debounce_seconds=self.reload_delay,
         )
 
-        self.observer.schedule(event_handler, self.project_dir, recursive=True)
+        self._schedule_watches(event_handler)
         self.observer.start()
 
         # Start the server if a command is provided
@@ -428,6 +614,8 @@ class HotReloader:
         if self.observer:
             self.observer.stop()
             self.observer.join(timeout=1)
+        if self.event_handler:
+            self.event_handler.stop()
 
         # Stop the WebSocket server
         if self.websocket_server:
@@ -443,6 +631,68 @@ class HotReloader:
 
         logger.info("Hot reloader stopped")
 
+    def _watch_plan(self) -> list[tuple[str, bool]]:
+        """
+        Decide which directories to watch, pruning expensive ignored subtrees.
+
+        Subtrees get one recursive watch unless they contain an ignored
+        directory that has subdirectories of its own (``node_modules``,
+        ``.git``, virtualenvs); only those parents are watched on their own,
+        so the big trees never receive (inotify) watches. Leaf ignored
+        directories such as ``__pycache__`` cost a single watch and stay
+        inside the recursive watch. Every entry is a separate watchdog
+        emitter, so above ``_MAX_WATCH_EMITTERS`` the plan falls back to one
+        recursive watch on the project root.
+
+        Returns:
+            (path, recursive) pairs to schedule
+        """
+        plan: list[tuple[str, bool]] = []
+
+        def subdirectories(path: str) -> list[os.DirEntry]:
+            try:
+                with os.scandir(path) as entries:
+                    return [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+            except OSError:
+                return []
+
+        def visit(path: str) -> bool:
+            # Returns True when nothing expensive below path is ignored
+            clean = True
+            children = []
+            for entry in subdirectories(path):
+                if entry.name in self.ignored_dirs:
+                    if subdirectories(entry.path):
+                        clean = False
+                else:
+                    children.append((entry.path, visit(entry.path)))
+
+            if clean and all(child_clean for _, child_clean in children):
+                return True
+
+            plan.append((path, False))
+            plan.extend((child, True) for child, child_clean in children if child_clean)
+            return False
+
+        root = str(self.project_dir)
+        if visit(root) or len(plan) > _MAX_WATCH_EMITTERS:
+            return [(root, True)]
+        return plan
+
+    def _schedule_watches(self, event_handler: HotReloadEventHandler):
+        """Schedule the event handler on every directory in the watch plan."""
+        directory_handler = _NewDirectoryHandler(self._watch_new_directory, self.ignored_dirs)
+        for path, recursive in self._watch_plan():
+            watch = self.observer.schedule(event_handler, path, recursive=recursive)
+            if not recursive:
+                # Directories created later under a non-recursive watch
+                # need watches of their own
+                self.observer.add_handler_for_watch(directory_handler, watch)
+
+    def _watch_new_directory(self, path: str):
+        """Watch a directory created under a non-recursive watch."""
+        self.observer.schedule(self.event_handler, path, recursive=True)
+
     def _start_server(self, command: list[str]):
         """Start the server process."""
         if self.server_process:
@@ -458,20 +708,22 @@ class HotReloader:
             command, stdout=sys.stdout, stderr=sys.stderr, cwd=self.project_dir
         )
 
-    def _handle_reload(self, file_path: str):
-        """Handle a file change event."""
+    def _handle_reload(self, file_paths: list[str]):
+        """Handle a debounced batch of file changes with a single action."""
         # Check for migration needs before reloading
-        if self.migration_detector and self.migration_detector.should_check(file_path):
+        if self.migration_detector and any(
+            self.migration_detector.should_check(path) for path in file_paths
+        ):
             threading.Thread(
                 target=self.migration_detector.check_and_apply,
                 daemon=True,
             ).start()
 
-        _, ext = os.path.splitext(file_path)
+        python_files = [path for path in file_paths if os.path.splitext(path)[1] == ".py"]
 
-        # For Python files, restart the server
-        if ext == ".py" and self.server_process:
-            logger.info(f"Python file changed: {file_path}")
+        # If any Python file changed, restart the server once
+        if python_files and self.server_process:
+            logger.info(f"Python files changed: {', '.join(python_files)}")
             logger.info("Restarting server...")
 
             # Restart the server
@@ -484,13 +736,13 @@ class HotReloader:
             # Start the server with the same command
             self._start_server(self.server_process.args)
 
-        # For other files, just notify the browser
+        # Otherwise, notify the browser once for the whole batch
         elif self.use_websocket and self.websocket_server:
-            logger.info(f"Static file changed: {file_path}")
+            logger.info(f"Static files changed: {', '.join(file_paths)}")
             logger.info("Notifying browser to reload...")
 
             # Send a reload message to the browser
-            self.websocket_server.send_reload_message(file_path)
+            self.websocket_server.send_reload_message(file_paths)
 
     def _handle_signal(self, signum, frame):
         """Handle termination signals."""
@@ -499,57 +751,76 @@ class HotReloader:
         sys.exit(0)
 
 
-# Helper function to inject the live reload script into HTML responses
-def inject_live_reload_script(response, host="localhost", port=35729):
-    """
-    Inject the live reload script into HTML responses.
-
-    This function should be used as middleware to add the live reload script
-    to HTML responses during development.
-    """
-    if not response.get("Content-Type", "").startswith("text/html"):
-        return response
-
-    content = response.content.decode("utf-8")
-
-    # Create the live reload script
-    script = f"""
+# Live reload <script> block; formatted with the WebSocket host and port
+_SCRIPT_TEMPLATE = """
     <script>
-    (function() {{
-        const socket = new WebSocket('ws://{host}:{port}');
+    (function() {
+        const socket = new WebSocket('ws://%s:%s');
         
-        socket.onopen = function() {{
+        socket.onopen = function() {
             console.log('Live reload connected');
-        }};
+        };
         
-        socket.onmessage = function(event) {{
+        socket.onmessage = function(event) {
             const data = JSON.parse(event.data);
             
-            if (data.command === 'reload') {{
+            if (data.command === 'reload') {
                 console.log('Reloading page...');
                 window.location.reload();
-            }}
-        }};
+            }
+        };
         
-        socket.onclose = function() {{
+        socket.onclose = function() {
             console.log('Live reload disconnected');
             
             // Try to reconnect after a delay
-            setTimeout(function() {{
+            setTimeout(function() {
                 window.location.reload();
-            }}, 2000);
-        }};
-    }})();
+            }, 2000);
+        };
+    })();
     </script>
     """
 
+
+@functools.lru_cache(maxsize=8)
+def _live_reload_script(host: str, port: int) -> bytes:
+    """The encoded live reload <script> block for a WebSocket host and port."""
+    return (_SCRIPT_TEMPLATE % (host, port)).encode("utf-8")
+
+
+def inject_live_reload_script(response, host="localhost", port=35729, script_bytes=None):
+    """
+    Inject the live reload script into HTML responses.
+
+    This function should be used as middleware to add the live reload script
+    to HTML responses during development. The script is spliced into the
+    encoded body before the last ``</body>`` tag, without decoding it.
+
+    Args:
+        response: The response to modify
+        host: WebSocket host the script connects to
+        port: WebSocket port the script connects to
+        script_bytes: Pre-encoded script block; overrides host and port
+    """
+    if not response.get("Content-Type", "").startswith("text/html"):
+        return response
+
+    if script_bytes is None:
+        script_bytes = _live_reload_script(host, port)
+    return _splice_script(response, script_bytes)
+
+
+def _splice_script(response, script_bytes: bytes):
+    """Insert the script before the last ``</body>`` tag (callers check the content type)."""
+    content = response.content
+
     # Inject the script before the closing </body> tag
-    if "</body>" in content:
-        content = content.replace("</body>", f"{script}</body>")
+    index = content.rfind(b"</body>")
+    if index == -1:
+        response.content = content + script_bytes
     else:
-        content += script
-
-    response.content = content.encode("utf-8")
+        response.content = content[:index] + script_bytes + content[index:]
     return response
 
 
@@ -558,25 +829,32 @@ class LiveReloadMiddleware:
     Middleware for injecting the live reload script into HTML responses.
 
     This middleware should be used during development to enable live reloading.
+    The debug flag and the encoded script are resolved once, when the
+    middleware is created.
     """
 
     def __init__(self, get_response):
+        from django_matt.core.errors import _env_debug
+
         self.get_response = get_response
         self.host = os.environ.get("LIVE_RELOAD_HOST", "localhost")
         self.port = int(os.environ.get("LIVE_RELOAD_PORT", "35729"))
+        self._enabled = _env_debug()
+        self._script_bytes = _live_reload_script(self.host, self.port)
 
     def __call__(self, request):
         response = self.get_response(request)
 
         # Only inject the script in debug mode
-        if not os.environ.get("DJANGO_DEBUG", "False").lower() == "true":
+        if not self._enabled:
             return response
 
-        # Only inject the script in HTML responses
-        if not response.get("Content-Type", "").startswith("text/html"):
+        # Only inject the script in HTML responses (the only content-type check)
+        content_type = response.get("Content-Type") or ""
+        if not content_type.startswith("text/html"):
             return response
 
-        return inject_live_reload_script(response, self.host, self.port)
+        return _splice_script(response, self._script_bytes)
 
 
 # Command to run the hot reloader
@@ -9,6 +9,7 @@ Provides a modern, interactive documentation UI with:
 - Code snippet generation
 """
 
+from functools import cache
 from typing import Any
 
 from django.http import HttpRequest, HttpResponse, JsonResponse
@@ -20,6 +21,12 @@ import orjson
 from .playground import CodeGenerator, PlaygroundSession
 
 
+@cache
+def _compile_template(source: str) -> Template:
+    """Parse a built-in template string once and reuse the compiled nodelist."""
+    return Template(source)
+
+
 class DocsView:
     """
     Interactive documentation view.
@@ -111,9 +118,7 @@ class DocsView:
 
     def _render_template(self, context: dict) -> str:
         """Render the documentation HTML template."""
-        template = DOCS_TEMPLATE
-        t = Template(template)
-        return t.render(Context(context))
+        return _compile_template(DOCS_TEMPLATE).render(Context(context))
 
 
 class PlaygroundView:
@@ -180,9 +185,7 @@ class PlaygroundView:
 
     def _render_playground_template(self, context: dict) -> str:
         """Render the playground HTML template."""
-        template = PLAYGROUND_TEMPLATE
-        t = Template(template)
-        return t.render(Context(context))
+        return _compile_template(PLAYGROUND_TEMPLATE).render(Context(context))
 
 
 class SearchView:
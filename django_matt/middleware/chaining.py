@@ -1,11 +1,9 @@
 """Auto-chaining middleware — wraps the internal middleware stack."""
 
-import os
-
 from django.http import JsonResponse
 from django.utils.deprecation import MiddlewareMixin
 
-from django_matt.core.errors import ErrorHandler, ErrorMiddleware
+from django_matt.core.errors import ErrorMiddleware, _env_debug, _get_error_handler
 
 
 class DjangoMattMiddleware(MiddlewareMixin):
@@ -29,7 +27,7 @@ class DjangoMattMiddleware(MiddlewareMixin):
         self.error_middleware = ErrorMiddleware(get_response)
 
         # Only use LiveReloadMiddleware in debug mode
-        if os.environ.get("DJANGO_DEBUG", "False").lower() == "true":
+        if _env_debug():
             from django_matt.dev.hot_reload import LiveReloadMiddleware
 
             self.live_reload_middleware = LiveReloadMiddleware(get_response)
@@ -119,9 +117,7 @@ class APIExceptionMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
-        self.error_handler = ErrorHandler(
-            debug=os.environ.get("DJANGO_DEBUG", "False").lower() == "true"
-        )
+        self.error_handler = _get_error_handler(_env_debug())
 
     def __call__(self, request):
         try:
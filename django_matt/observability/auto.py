@@ -82,7 +82,9 @@ class AutoInstrumentor:
 
         @classmethod  # type: ignore[misc]
         def patched_init_subclass(cls: type, **kwargs: Any) -> None:
-            original_init_subclass(**kwargs)
+            # Call the unbound hook so per-subclass setup (route collection,
+            # class-level lists) lands on the new subclass, not on APIController
+            original_init_subclass.__func__(cls, **kwargs)
             _instrument_controller_class(cls)
 
         APIController.__init_subclass__ = patched_init_subclass  # type: ignore[assignment]
@@ -5,6 +5,7 @@ Generates the HTML shell with page data injected as a script tag
 (not a data attribute like Inertia) for better performance.
 """
 
+from functools import cache
 from typing import Any
 
 from django.conf import settings
@@ -94,8 +95,13 @@ def render_page_html(request: HttpRequest, page_data: PageData) -> str:
             pass
 
     # Use default template
-    template = Template(DEFAULT_TEMPLATE)
-    return template.render(Context(context))
+    return _default_template().render(Context(context))
+
+
+@cache
+def _default_template() -> Template:
+    """Compile DEFAULT_TEMPLATE on first use (needs a configured template engine)."""
+    return Template(DEFAULT_TEMPLATE)
 
 
 def _get_head_tags(config: dict[str, Any]) -> str:
@@ -3,51 +3,73 @@ Utility modules for Django Matt framework.
 
 This package contains utility modules for error handling, hot reloading,
 and other framework features.
+
+Exports are resolved lazily on first access so that ``import django_matt.utils``
+does not pull in watchdog, msgpack, redis, etc. for commands that never touch
+the performance or hot-reload layers.
 """
 
-from django_matt.core.errors import (
-    ErrorHandler,
-    ErrorMiddleware,
-    ValidationErrorFormatter,
-    error_handler,
-)
-from django_matt.utils.cache_invalidation import (
-    CacheInvalidationMixin,
-    CacheInvalidator,
-    cache_invalidator,
-    cached_view,
-    invalidate_cache_for_model,
-    register_cache_invalidation,
-)
-from django_matt.utils.hot_reload import (
-    HotReloader,
-    HotReloadMiddleware,
-    start_hot_reloading,
-    stop_hot_reloading,
-)
-from django_matt.utils.performance import (
-    HAS_MSGPACK,
-    APIBenchmark,
-    BenchmarkMiddleware,
-    CacheManager,
-    DistributedCacheManager,
-    FastJSONRenderer,
-    FastJsonResponse,
-    MessagePackRenderer,
-    MessagePackResponse,
-    PerformanceSuggester,
-    QueryAnalyzer,
-    QueryLoggingMiddleware,
-    StreamingJsonResponse,
-    benchmark,
-    cache_manager,
-    cache_response,
-    distributed_cache,
-    optimize_queryset,
-    performance_suggester,
-    query_analyzer,
-    stream_json_list,
-)
+_LAZY_IMPORTS = {
+    # Error handling
+    "ErrorHandler": "django_matt.core.errors",
+    "ErrorMiddleware": "django_matt.core.errors",
+    "ValidationErrorFormatter": "django_matt.core.errors",
+    "error_handler": "django_matt.core.errors",
+    # Cache invalidation
+    "CacheInvalidationMixin": "django_matt.utils.cache_invalidation",
+    "CacheInvalidator": "django_matt.utils.cache_invalidation",
+    "cache_invalidator": "django_matt.utils.cache_invalidation",
+    "cached_view": "django_matt.utils.cache_invalidation",
+    "invalidate_cache_for_model": "django_matt.utils.cache_invalidation",
+    "register_cache_invalidation": "django_matt.utils.cache_invalidation",
+    # Hot reloading
+    "HotReloader": "django_matt.utils.hot_reload",
+    "HotReloadMiddleware": "django_matt.utils.hot_reload",
+    "start_hot_reloading": "django_matt.utils.hot_reload",
+    "stop_hot_reloading": "django_matt.utils.hot_reload",
+    # Performance
+    "HAS_MSGPACK": "django_matt.utils.performance",
+    "APIBenchmark": "django_matt.utils.performance",
+    "BenchmarkMiddleware": "django_matt.utils.performance",
+    "CacheManager": "django_matt.utils.performance",
+    "DistributedCacheManager": "django_matt.utils.performance",
+    "FastJSONRenderer": "django_matt.utils.performance",
+    "FastJsonResponse": "django_matt.utils.performance",
+    "MessagePackRenderer": "django_matt.utils.performance",
+    "MessagePackResponse": "django_matt.utils.performance",
+    "PerformanceSuggester": "django_matt.utils.performance",
+    "QueryAnalyzer": "django_matt.utils.performance",
+    "QueryLoggingMiddleware": "django_matt.utils.performance",
+    "StreamingJsonResponse": "django_matt.utils.performance",
+    "benchmark": "django_matt.utils.performance",
+    "cache_manager": "django_matt.utils.performance",
+    "cache_response": "django_matt.utils.performance",
+    "distributed_cache": "django_matt.utils.performance",
+    "optimize_queryset": "django_matt.utils.performance",
+    "performance_suggester": "django_matt.utils.performance",
+    "query_analyzer": "django_matt.utils.performance",
+    "stream_json_list": "django_matt.utils.performance",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import handler for package attributes."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module 'django_matt.utils' has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_path), name)
+    # Cache on the module so subsequent lookups bypass __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List available attributes for autocompletion."""
+    return list(globals()) + list(_LAZY_IMPORTS)
+
 
 __all__ = [
     # Error handling
@@ -2408,10 +2408,8 @@ class TestAuthSchemas:
 class TestAuthControllerLogin:
     """Test AuthController login endpoint.
 
-    Note: We call unbound class methods (e.g., AuthController.login(controller, request))
-    to bypass a closure variable capture bug in Controller._setup_dependencies / _setup_error_handling
-    where loop variable 'method' is captured by reference, causing all instance wrappers
-    to call the last method iterated.
+    Note: These call unbound class methods (e.g., AuthController.login(controller, request))
+    to exercise the endpoint bodies without the instance-level wrappers.
     """
 
     @pytest.mark.django_db(transaction=True)
@@ -462,6 +462,21 @@ class TestAutoInstrumentor:
         inst.instrument_controllers()
         inst.instrument_controllers()  # should not raise
 
+    def test_instrumented_controller_keeps_its_own_routes(self):
+        from django_matt.core.controller import APIController
+        from django_matt.core.router import get
+
+        AutoInstrumentor().instrument_controllers()
+
+        class InstrumentedController(APIController):
+            @get("/")
+            async def index(self, request):
+                return {}
+
+        assert [name for name, _ in InstrumentedController._routes] == ["index"]
+        assert APIController._routes == ()
+        assert "tags" in vars(InstrumentedController)
+
     def test_instrument_db_idempotent(self):
         inst = AutoInstrumentor()
         inst.instrument_db()
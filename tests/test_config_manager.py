@@ -0,0 +1,238 @@
+"""Tests for the layered ConfigurationManager."""
+
+import pytest
+
+from django_matt.config import ConfigurationManager, _settings_cache
+
+
+class TestConfigurationManagerLoading:
+    def test_load_base(self):
+        manager = ConfigurationManager()
+        result = manager.load_base()
+        assert result["LANGUAGE_CODE"] == "en-us"
+        assert "django.contrib.auth" in result["INSTALLED_APPS"]
+
+    def test_load_environment(self):
+        manager = ConfigurationManager()
+        manager.load_base()
+        result = manager.load_environment("development")
+        assert result["DEBUG"] is True
+
+    def test_load_component(self):
+        manager = ConfigurationManager()
+        result = manager.load_component("security")
+        assert result["CSRF_COOKIE_HTTPONLY"] is True
+
+    def test_settings_module_cached(self):
+        ConfigurationManager().load_component("security")
+        assert "django_matt.config.components.security" in _settings_cache
+
+    def test_unknown_environment_raises(self):
+        with pytest.raises(ImportError, match="nope"):
+            ConfigurationManager().load_environment("nope")
+
+    def test_unknown_component_raises(self):
+        with pytest.raises(ImportError, match="nope"):
+            ConfigurationManager().load_component("nope")
+
+    def test_configure_without_django(self):
+        manager = ConfigurationManager()
+        result = manager.configure(
+            environment="development",
+            components=["security"],
+            extra_settings={"ROOT_URLCONF": "tests.urls"},
+            apply_to_django=False,
+        )
+        assert result["ROOT_URLCONF"] == "tests.urls"
+        assert result["DEBUG"] is True
+        assert "CSRF_COOKIE_HTTPONLY" in result
+
+    def test_base_settings_read_only(self):
+        from django_matt.config.base import settings as base_settings
+
+        with pytest.raises(TypeError):
+            base_settings["DEBUG"] = True  # type: ignore[index]
+
+        manager = ConfigurationManager()
+        manager.load_base()
+        manager.get_settings()["DEBUG"] = True
+        assert base_settings["DEBUG"] is False
+
+
+class TestSettingsMerge:
+    def test_component_middleware_extends_base(self):
+        manager = ConfigurationManager()
+        manager.load_base()
+        result = manager.load_component("performance")
+        assert "django.middleware.security.SecurityMiddleware" in result["MIDDLEWARE"]
+        assert "django.middleware.gzip.GZipMiddleware" in result["MIDDLEWARE"]
+
+    def test_environment_apps_extend_base(self):
+        manager = ConfigurationManager()
+        manager.load_base()
+        result = manager.load_environment("development")
+        assert result["INSTALLED_APPS"][0] == "django.contrib.admin"
+        assert result["INSTALLED_APPS"][-1] == "debug_toolbar"
+
+    def test_dict_settings_shallow_merge(self):
+        manager = ConfigurationManager()
+        manager.load_base()
+        result = manager.load_environment("development")
+        assert result["DJANGO_MATT"]["BENCHMARK_ENABLED"] is True
+        assert result["DJANGO_MATT"]["CACHE_KEY_PREFIX"] == "django_matt:"
+
+    def test_merge_skips_duplicates(self):
+        from django_matt.config import _merge_settings
+
+        dst = {"MIDDLEWARE": ["a", "b"]}
+        _merge_settings(dst, {"MIDDLEWARE": ["b", "c"]})
+        assert dst["MIDDLEWARE"] == ("a", "b", "c")
+
+    def test_merge_does_not_mutate_source_layers(self):
+        from django_matt.config.base import settings as base_settings
+
+        manager = ConfigurationManager()
+        manager.load_base()
+        manager.load_environment("development")
+        assert "debug_toolbar" not in base_settings["INSTALLED_APPS"]
+        assert "DB_TYPE" not in base_settings["DJANGO_MATT"]
+
+
+class TestApplyToDjangoSettings:
+    def test_applies_and_invalidates_cached_values(self):
+        from django.conf import settings
+        from django.test import override_settings
+
+        with override_settings(MATT_CONFIG_PROBE="before"):
+            assert settings.MATT_CONFIG_PROBE == "before"
+            manager = ConfigurationManager()
+            manager._settings = {"MATT_CONFIG_PROBE": "after"}
+            manager.apply_to_django_settings()
+            assert settings.MATT_CONFIG_PROBE == "after"
+
+    def test_undeletes_setting_on_user_holder(self):
+        from django.conf import settings
+        from django.test import override_settings
+
+        with override_settings(MATT_CONFIG_PROBE="x"):
+            del settings.MATT_CONFIG_PROBE
+            manager = ConfigurationManager()
+            manager._settings = {"MATT_CONFIG_PROBE": "restored"}
+            manager.apply_to_django_settings()
+            assert settings.MATT_CONFIG_PROBE == "restored"
+
+
+class TestSettingsLayers:
+    def test_layers_are_not_copied(self):
+        from django_matt.config.components.security import settings as security_settings
+
+        manager = ConfigurationManager()
+        manager.load_component("security")
+        assert manager._layers.maps[0] is security_settings
+
+    def test_merge_is_cached_until_next_layer(self):
+        manager = ConfigurationManager()
+        first = manager.load_base()
+        assert manager.get_settings() is first
+        second = manager.load_environment("development")
+        assert second is not first
+        assert second["DEBUG"] is True
+
+    def test_extra_settings_override_layers(self):
+        manager = ConfigurationManager()
+        result = manager.configure(
+            environment="development",
+            extra_settings={"INSTALLED_APPS": ["only_this"]},
+            apply_to_django=False,
+        )
+        assert result["INSTALLED_APPS"] == ["only_this"]
+
+
+class TestDevelopmentSecretKey:
+    def test_secret_key_generated_lazily_and_stable(self):
+        from django_matt.config.environments.development import settings as dev_settings
+
+        key = dev_settings["SECRET_KEY"]
+        assert len(str(key)) == 64
+        assert str(key) == str(dev_settings["SECRET_KEY"])
+
+    def test_secret_key_usable_for_signing(self):
+        from django.core.signing import Signer
+
+        from django_matt.config.environments.development import settings as dev_settings
+
+        signer = Signer(key=dev_settings["SECRET_KEY"])
+        assert signer.unsign(signer.sign("value")) == "value"
+
+
+class TestStagingSettings:
+    def test_settings_built_lazily_from_environment(self, monkeypatch):
+        from django_matt.config.environments import staging
+
+        staging.get_settings.cache_clear()
+        monkeypatch.setenv("DB_NAME", "lazy_staging_db")
+        try:
+            assert staging.settings["DATABASES"]["default"]["NAME"] == "lazy_staging_db"
+            assert staging.settings is staging.get_settings()
+        finally:
+            staging.get_settings.cache_clear()
+
+    def test_unknown_attribute_raises(self):
+        from django_matt.config.environments import staging
+
+        with pytest.raises(AttributeError):
+            staging.not_a_setting  # noqa: B018
+
+    def test_manager_loads_staging(self):
+        settings = ConfigurationManager().load_environment("staging")
+        assert settings["DEBUG"] is False
+        assert len(settings["AUTH_PASSWORD_VALIDATORS"]) == 4
+
+
+class TestRepeatedConfigure:
+    def test_repeat_configure_reuses_merged_settings(self):
+        manager = ConfigurationManager()
+        kwargs = {
+            "environment": "development",
+            "components": ["security"],
+            "extra_settings": {"ROOT_URLCONF": "tests.urls"},
+            "apply_to_django": False,
+        }
+        first = manager.configure(**kwargs)
+        second = manager.configure(**kwargs)
+        assert second is first
+
+    def test_new_extra_settings_patch_merged_settings(self):
+        manager = ConfigurationManager()
+        first = manager.configure(environment="development", apply_to_django=False)
+        second = manager.configure(
+            environment="development",
+            extra_settings={"DEBUG": False},
+            apply_to_django=False,
+        )
+        assert second is first
+        assert second["DEBUG"] is False
+
+    def test_overrides_survive_later_layers(self):
+        manager = ConfigurationManager()
+        manager.configure(
+            environment="development",
+            extra_settings={"DEBUG": False},
+            apply_to_django=False,
+        )
+        result = manager.load_component("security")
+        assert result["DEBUG"] is False
+
+    def test_manager_is_slotted(self):
+        manager = ConfigurationManager()
+        assert not hasattr(manager, "__dict__")
+        with pytest.raises(AttributeError):
+            manager.unexpected = True  # type: ignore[attr-defined]
+
+    def test_component_settings_read_only(self):
+        from types import MappingProxyType
+
+        from django_matt.config.components import cache, database, performance, security
+
+        for module in (cache, database, performance, security):
+            assert isinstance(module.settings, MappingProxyType)
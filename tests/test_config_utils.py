@@ -0,0 +1,150 @@
+"""Tests for django_matt.config.utils environment helpers."""
+
+from django_matt.config.utils import (
+    deep_merge,
+    get_env_bool,
+    get_env_dict,
+    get_env_float,
+    get_env_int,
+    get_env_list,
+)
+
+
+class TestGetEnvBool:
+    def test_missing_returns_default(self, monkeypatch):
+        monkeypatch.delenv("MATT_TEST_FLAG", raising=False)
+        assert get_env_bool("MATT_TEST_FLAG") is False
+        assert get_env_bool("MATT_TEST_FLAG", True) is True
+
+    def test_truthy_values(self, monkeypatch):
+        for raw in ("true", "True", "YES", "1", "y", "t", "on", " On "):
+            monkeypatch.setenv("MATT_TEST_FLAG", raw)
+            assert get_env_bool("MATT_TEST_FLAG") is True
+
+    def test_falsy_values(self, monkeypatch):
+        for raw in ("false", "0", "no", "off", "OFF"):
+            monkeypatch.setenv("MATT_TEST_FLAG", raw)
+            assert get_env_bool("MATT_TEST_FLAG", True) is False
+
+    def test_sees_environment_changes(self, monkeypatch):
+        monkeypatch.setenv("MATT_TEST_FLAG", "true")
+        assert get_env_bool("MATT_TEST_FLAG") is True
+        monkeypatch.setenv("MATT_TEST_FLAG", "false")
+        assert get_env_bool("MATT_TEST_FLAG") is False
+
+
+class TestGetEnvNumbers:
+    def test_int(self, monkeypatch):
+        monkeypatch.setenv("MATT_TEST_NUM", "42")
+        assert get_env_int("MATT_TEST_NUM") == 42
+
+    def test_int_invalid_returns_default(self, monkeypatch):
+        monkeypatch.setenv("MATT_TEST_NUM", "forty-two")
+        assert get_env_int("MATT_TEST_NUM", 7) == 7
+
+    def test_int_missing_returns_default(self, monkeypatch):
+        monkeypatch.delenv("MATT_TEST_NUM", raising=False)
+        assert get_env_int("MATT_TEST_NUM", 7) == 7
+
+    def test_float(self, monkeypatch):
+        monkeypatch.setenv("MATT_TEST_NUM", "1.5")
+        assert get_env_float("MATT_TEST_NUM") == 1.5
+
+    def test_float_invalid_returns_default(self, monkeypatch):
+        monkeypatch.setenv("MATT_TEST_NUM", "abc")
+        assert get_env_float("MATT_TEST_NUM", 2.5) == 2.5
+
+
+class TestBoolParsing:
+    def test_unrecognised_value_returns_default(self, monkeypatch):
+        monkeypatch.setenv("MATT_TEST_FLAG", "maybe")
+        assert get_env_bool("MATT_TEST_FLAG") is False
+        assert get_env_bool("MATT_TEST_FLAG", True) is True
+
+    def test_component_flags_accept_numeric_truthy(self, monkeypatch):
+        import importlib
+
+        from django_matt.config.components import security
+
+        monkeypatch.setenv("SECURE_SSL_REDIRECT", "1")
+        try:
+            assert importlib.reload(security).settings["SECURE_SSL_REDIRECT"] is True
+        finally:
+            monkeypatch.delenv("SECURE_SSL_REDIRECT")
+            importlib.reload(security)
+
+
+class TestGetEnvCollections:
+    def test_list_strips_and_skips_empty(self, monkeypatch):
+        monkeypatch.setenv("MATT_TEST_LIST", " a, b ,,c ")
+        assert get_env_list("MATT_TEST_LIST") == ["a", "b", "c"]
+
+    def test_list_returns_fresh_copy(self, monkeypatch):
+        monkeypatch.setenv("MATT_TEST_LIST", "a,b")
+        first = get_env_list("MATT_TEST_LIST")
+        first.append("mutated")
+        assert get_env_list("MATT_TEST_LIST") == ["a", "b"]
+
+    def test_list_missing_returns_default(self, monkeypatch):
+        monkeypatch.delenv("MATT_TEST_LIST", raising=False)
+        assert get_env_list("MATT_TEST_LIST") == []
+        assert get_env_list("MATT_TEST_LIST", ["x"]) == ["x"]
+
+    def test_dict(self, monkeypatch):
+        monkeypatch.setenv("MATT_TEST_DICT", "a=1, b = 2,junk,c=x=y")
+        assert get_env_dict("MATT_TEST_DICT") == {"a": "1", "b": "2", "c": "x=y"}
+
+    def test_dict_returns_fresh_copy(self, monkeypatch):
+        monkeypatch.setenv("MATT_TEST_DICT", "a=1")
+        get_env_dict("MATT_TEST_DICT")["b"] = "2"
+        assert get_env_dict("MATT_TEST_DICT") == {"a": "1"}
+
+    def test_dict_custom_separators(self, monkeypatch):
+        monkeypatch.setenv("MATT_TEST_DICT", "a:1;b:2")
+        assert get_env_dict("MATT_TEST_DICT", separator=";", key_value_separator=":") == {
+            "a": "1",
+            "b": "2",
+        }
+
+
+class TestDeepMerge:
+    def test_nested_dicts_merged(self):
+        base = {"a": {"x": 1, "y": 2}, "b": 1}
+        result = deep_merge(base, {"a": {"y": 3, "z": 4}})
+        assert result == {"a": {"x": 1, "y": 3, "z": 4}, "b": 1}
+
+    def test_lists_extended_without_duplicates(self):
+        result = deep_merge({"apps": ["a", "b"]}, {"apps": ["b", "c", "c"]})
+        assert result["apps"] == ["a", "b", "c"]
+
+    def test_lists_with_unhashable_items(self):
+        result = deep_merge({"items": [{"a": 1}]}, {"items": [{"a": 1}, {"b": 2}]})
+        assert result["items"] == [{"a": 1}, {"b": 2}]
+
+    def test_scalar_override(self):
+        assert deep_merge({"a": [1]}, {"a": "x"}) == {"a": "x"}
+
+    def test_base_not_mutated(self):
+        base = {"a": {"x": 1}, "l": [1]}
+        deep_merge(base, {"a": {"y": 2}, "l": [2]})
+        assert base == {"a": {"x": 1}, "l": [1]}
+
+    def test_nested_base_not_mutated(self):
+        base = {"LOGGING": {"handlers": {"console": {"level": "INFO"}}}}
+        deep_merge(base, {"LOGGING": {"handlers": {"console": {"level": "DEBUG"}}}})
+        assert base["LOGGING"]["handlers"]["console"]["level"] == "INFO"
+
+    def test_untouched_subtrees_are_shared(self):
+        base = {"DATABASES": {"default": {"NAME": "db"}}, "DEBUG": False}
+        result = deep_merge(base, {"DEBUG": True, "DATABASES": {}})
+        assert result["DATABASES"] is base["DATABASES"]
+        assert result["DEBUG"] is True
+
+    def test_none_base_value_is_overridden(self):
+        assert deep_merge({"a": None}, {"a": {"x": 1}}) == {"a": {"x": 1}}
+
+    def test_dict_subclasses_are_merged(self):
+        from collections import OrderedDict
+
+        result = deep_merge({"a": OrderedDict(x=1)}, {"a": {"y": 2}})
+        assert result["a"] == {"x": 1, "y": 2}
@@ -312,6 +312,28 @@ class TestCRUDControllerFilterQueryset:
         sql = str(filtered.query)
         assert "username" in sql.lower()
 
+    def test_filter_queryset_applies_filters_in_one_call(self, rf):
+        """All field filters are combined into a single filter() call."""
+        from unittest.mock import patch
+
+        from django.db.models import QuerySet
+
+        controller = UserController()
+        request = rf.get("/users/?username=john&is_staff=1&limit=5")
+        qs = controller.get_queryset()
+        with patch.object(QuerySet, "filter", autospec=True, side_effect=QuerySet.filter) as spy:
+            filtered = controller.filter_queryset(qs, request)
+        assert spy.call_count == 1
+        assert spy.call_args.kwargs == {"username": "john", "is_staff": "1"}
+        sql = str(filtered.query).lower()
+        assert "username" in sql and "is_staff" in sql
+
+    def test_filter_queryset_without_filters_returns_queryset(self, rf):
+        """No filterable params means the queryset is returned unchanged."""
+        controller = UserController()
+        qs = controller.get_queryset()
+        assert controller.filter_queryset(qs, rf.get("/users/?limit=5&unknown=1")) is qs
+
 
 class TestCRUDControllerInheritance:
     """Test that CRUDController properly inherits from APIController."""
@@ -772,6 +794,477 @@ class TestLoginNotRequired:
         assert getattr(openapi_urls[0].callback, "login_required", None) is False
 
 
+class TestRouteHintsCache:
+    """Type hints for route methods are resolved once per function."""
+
+    def test_hints_resolved_once_across_instances(self):
+        from unittest.mock import patch
+
+        from django_matt.core import controller as controller_module
+
+        class HintsController(Controller):
+            @route_get("/")
+            async def create_item(self, request, data: UserSchema):
+                return data
+
+        with patch.object(
+            controller_module,
+            "get_type_hints",
+            wraps=controller_module.get_type_hints,
+        ) as spy:
+            HintsController()
+            HintsController()
+
+        assert spy.call_count == 1
+
+    def test_signature_analyzed_once_across_instances(self):
+        import inspect
+        from unittest.mock import patch
+
+        class SignatureController(Controller):
+            @route_get("/")
+            async def index(self, request):
+                return {}
+
+        with patch.object(inspect, "signature", wraps=inspect.signature) as spy:
+            SignatureController()
+            SignatureController()
+
+        assert spy.call_count == 1
+
+    def test_coroutine_check_cached_across_instances(self):
+        import inspect
+        from unittest.mock import patch
+
+        class CoroController(Controller):
+            @route_get("/")
+            async def index(self, request):
+                return {}
+
+        with patch.object(inspect, "iscoroutinefunction", wraps=inspect.iscoroutinefunction) as spy:
+            CoroController()
+            CoroController()
+
+        assert spy.call_count == 1
+
+    def test_di_params_cached_per_function(self):
+        from django_matt.core.controller import _route_di_params
+        from django_matt.di.depends import Depends
+
+        def get_service():
+            return object()
+
+        async def handler(self, request, service=Depends(get_service), limit: int = 1):
+            return {}
+
+        di_params = _route_di_params(handler)
+        assert list(di_params) == ["service"]
+        assert _route_di_params(handler) is di_params
+
+    def test_pydantic_params_precomputed(self):
+        from django_matt.core.controller import _route_hints
+
+        async def handler(self, request, data: UserSchema, limit: int = 10) -> dict:
+            return {}
+
+        hints, pydantic_params = _route_hints(handler)
+        assert hints["limit"] is int
+        assert pydantic_params == (("data", UserSchema),)
+
+
+class TestControllerWrapperDispatch:
+    """Plain routes are dispatched inline by the single per-method wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_sync_method_without_request(self, rf):
+        class PlainController(Controller):
+            @route_get("/")
+            def ping(self):
+                return {"pong": True}
+
+        controller = PlainController()
+        assert await controller.ping(rf.get("/")) == {"pong": True}
+
+    @pytest.mark.asyncio
+    async def test_async_method_receives_request_and_args(self, rf):
+        class EchoController(Controller):
+            @route_get("/<id>")
+            async def echo(self, request, id):
+                return {"method": request.method, "id": id}
+
+        controller = EchoController()
+        assert await controller.echo(rf.get("/"), "7") == {"method": "GET", "id": "7"}
+
+
+class TestControllerRouteRegistry:
+    """Route methods are collected once per class by __init_subclass__."""
+
+    def test_routes_collected_at_class_creation(self):
+        class ItemsController(Controller):
+            @route_get("/")
+            async def list_items(self, request):
+                return []
+
+            async def helper(self, request):
+                return None
+
+        assert [name for name, _ in ItemsController._routes] == ["list_items"]
+
+    def test_routes_inherited_and_overridden(self):
+        class ParentController(Controller):
+            @route_get("/a")
+            async def a(self, request):
+                return "a"
+
+            @route_get("/b")
+            async def b(self, request):
+                return "b"
+
+        class ChildController(ParentController):
+            async def b(self, request):
+                return "undecorated"
+
+            @route_get("/c")
+            async def c(self, request):
+                return "c"
+
+        names = {name for name, _ in ChildController._routes}
+        assert names == {"a", "c"}
+        assert {name for name, _ in ParentController._routes} == {"a", "b"}
+
+    def test_init_does_not_scan_dir(self):
+        from unittest.mock import patch
+
+        class ScanController(Controller):
+            @route_get("/")
+            async def index(self, request):
+                return {}
+
+        with patch("builtins.dir", side_effect=AssertionError("dir() called")):
+            controller = ScanController()
+        assert hasattr(controller.index, "__wrapped__")
+
+
+class TestJsonBodyParsedOnce:
+    """The request body is decoded once even though router and wrapper both need it."""
+
+    @pytest.mark.asyncio
+    async def test_controller_route_parses_body_once(self, rf):
+        from unittest.mock import patch
+
+        from django_matt.core import router as router_module
+
+        router = APIRouter()
+
+        class CreateController(Controller):
+            prefix = "/users"
+
+            @route_get("/")
+            async def create(self, request, data: UserSchema, **kwargs):
+                return JsonResponse({"username": data.username})
+
+        router.register_controller(CreateController)
+        urls = router.get_urls()
+
+        payload = b'{"id": 1, "username": "matt", "email": "m@example.com"}'
+        request = rf.generic("GET", "/users/", payload, content_type="application/json")
+        with patch.object(router_module.orjson, "loads", wraps=router_module.orjson.loads) as spy:
+            response = await urls[0].callback(request)
+
+        assert response.status_code == 200
+        assert spy.call_count == 1
+
+    def test_invalid_json_not_cached(self, rf):
+        from django_matt.core.router import load_json_body
+
+        request = rf.generic("POST", "/", b"{bad", content_type="application/json")
+        with pytest.raises(ValueError):
+            load_json_body(request)
+        assert not hasattr(request, "_json_body")
+
+
+class TestOrjsonJsonResponse:
+    """Controller responses are encoded with orjson."""
+
+    def test_is_json_response(self):
+        import orjson
+
+        from django_matt.core.controller import OrjsonJsonResponse
+
+        response = OrjsonJsonResponse({"detail": "ok"}, status=201)
+        assert isinstance(response, JsonResponse)
+        assert response.status_code == 201
+        assert response["Content-Type"] == "application/json"
+        assert orjson.loads(response.content) == {"detail": "ok"}
+
+    def test_falls_back_to_django_encoder(self):
+        from decimal import Decimal
+
+        from django.utils.translation import gettext_lazy
+
+        from django_matt.core.controller import OrjsonJsonResponse
+
+        response = OrjsonJsonResponse({"price": Decimal("1.50"), "label": gettext_lazy("Name")})
+        assert response.content == b'{"price":"1.50","label":"Name"}'
+
+    def test_safe_rejects_non_dict(self):
+        from django_matt.core.controller import OrjsonJsonResponse
+
+        with pytest.raises(TypeError):
+            OrjsonJsonResponse([1, 2])
+        assert OrjsonJsonResponse([1, 2], safe=False).content == b"[1,2]"
+
+    def test_stringifies_non_str_keys(self):
+        from django_matt.core.responses import OrjsonJsonResponse
+
+        assert OrjsonJsonResponse({1: "a"}).content == b'{"1":"a"}'
+
+
+class TestCRUDControllerListSerialization:
+    """Schemaless list() fetches dict rows with values()."""
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.asyncio
+    async def test_values_rows_match_raw_serialization(self, rf):
+        from django.contrib.auth.models import Permission
+
+        class PermissionController(CRUDController):
+            model = Permission
+            ordering = ["id"]
+
+        controller = PermissionController()
+        assert controller._serialize_with_values is True
+
+        result = await controller.list(rf.get("/", {"limit": 5}))
+
+        expected = [
+            controller._model_to_dict_raw(p) async for p in Permission.objects.order_by("id")[:5]
+        ]
+        assert result["items"] == expected
+        assert "content_type" in result["items"][0]
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.asyncio
+    async def test_m2m_prefetch_dropped_for_values(self, rf):
+        await Group.objects.acreate(name="editors")
+
+        class GroupController(CRUDController):
+            model = Group
+
+        controller = GroupController()
+        # auto_optimize prefetches the permissions M2M, which values() can't use
+        assert controller._m2m_fields == ["permissions"]
+
+        result = await controller.list(rf.get("/"))
+        assert result["count"] == 1
+        assert result["items"] == [{"id": result["items"][0]["id"], "name": "editors"}]
+
+    @pytest.mark.django_db
+    def test_raw_serialization_reads_fk_ids(self):
+        from django.contrib.auth.models import Permission
+
+        from django_matt.core.controller import _field_accessors
+
+        permission = Permission.objects.select_related(None).first()
+        data = NoOptimizationController()._model_to_dict_raw(permission)
+        assert data == {
+            "id": permission.id,
+            "name": permission.name,
+            "content_type": permission.content_type_id,
+            "codename": permission.codename,
+        }
+        assert _field_accessors(Permission) is _field_accessors(Permission)
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.asyncio
+    async def test_model_schema_page_dumped_in_batch(self, rf):
+        from django_matt.core.schema import ModelSchema
+
+        class GroupSchema(ModelSchema):
+            class Config:
+                model = Group
+                include = ["id", "name"]
+
+        class GroupController(CRUDController):
+            model = Group
+            schema = GroupSchema
+            ordering = ["name"]
+
+        await Group.objects.acreate(name="b")
+        await Group.objects.acreate(name="a")
+
+        controller = GroupController()
+        assert controller._batch_dump is True
+        result = await controller.list(rf.get("/"))
+        expected = [controller._model_to_dict_fast(g) async for g in Group.objects.order_by("name")]
+        assert result["items"] == expected
+        assert [item["name"] for item in result["items"]] == ["a", "b"]
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.asyncio
+    async def test_bulk_create_uses_batched_dump(self, rf):
+        from django_matt.core.schema import ModelSchema
+
+        class GroupSchema(ModelSchema):
+            class Config:
+                model = Group
+                include = ["id", "name"]
+
+        class GroupCreate(BaseModel):
+            name: str
+
+        class GroupController(CRUDController):
+            model = Group
+            schema = GroupSchema
+
+        controller = GroupController()
+        result = await controller.bulk_create(
+            rf.post("/"), [GroupCreate(name="x"), GroupCreate(name="y")]
+        )
+        assert result["count"] == 2
+        assert [item["name"] for item in result["items"]] == ["x", "y"]
+        assert set(result["items"][0]) == {"id", "name"}
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.asyncio
+    async def test_model_dump_override_is_honored(self, rf):
+        from django_matt.core.schema import ModelSchema
+
+        class GroupSchema(ModelSchema):
+            class Config:
+                model = Group
+                include = ["id", "name"]
+
+            def model_dump(self, **kwargs):
+                data = super().model_dump(**kwargs)
+                data["label"] = data.pop("name").upper()
+                return data
+
+        class GroupCreate(BaseModel):
+            name: str
+
+        class GroupController(CRUDController):
+            model = Group
+            schema = GroupSchema
+
+        controller = GroupController()
+        assert controller._batch_dump is False
+
+        created = await controller.bulk_create(rf.post("/"), [GroupCreate(name="x")])
+        assert [item["label"] for item in created["items"]] == ["X"]
+        listed = await controller.list(rf.get("/"))
+        assert [item["label"] for item in listed["items"]] == ["X"]
+        assert "name" not in listed["items"][0]
+
+    def test_schema_or_custom_serializer_uses_instances(self):
+        class CustomController(CRUDController):
+            model = Group
+
+            def _model_to_dict_raw(self, instance):
+                return {"name": instance.name.upper()}
+
+        assert UserController()._serialize_with_values is False
+        assert CustomController()._serialize_with_values is False
+
+
+class TestControllerErrorHandling:
+    """Exception handling is resolved once per method at setup time."""
+
+    @pytest.mark.asyncio
+    async def test_api_controller_uses_handle_exception(self, rf):
+        from unittest.mock import patch
+
+        from django_matt.core import controller as controller_module
+
+        class FailingController(APIController):
+            @route_get("/")
+            async def boom(self, request):
+                raise NotFoundAPIError(message="missing")
+
+        with patch.object(controller_module, "_get_error_handler") as get_error_handler:
+            controller = FailingController()
+        get_error_handler.assert_not_called()
+
+        response = await controller.boom(rf.get("/"))
+        assert response.status_code == 404
+
+    def test_error_handler_shared_per_debug_flag(self):
+        from django_matt.core.errors import _get_error_handler
+
+        assert _get_error_handler(True) is _get_error_handler(True)
+        assert _get_error_handler(False) is not _get_error_handler(True)
+        assert _get_error_handler(False).debug is False
+
+    @pytest.mark.asyncio
+    async def test_plain_controller_uses_error_handler(self, rf):
+        class FailingController(Controller):
+            @route_get("/")
+            async def boom(self, request):
+                raise RuntimeError("boom")
+
+        response = await FailingController().boom(rf.get("/"))
+        assert response.status_code == 500
+
+
+class TestControllerWrapperBinding:
+    """Each wrapper is bound to its own method, not the last one set up."""
+
+    @pytest.mark.asyncio
+    async def test_each_route_calls_its_own_method(self, rf):
+        class MultiController(Controller):
+            @route_get("/a")
+            async def alpha(self, request):
+                return "alpha"
+
+            @route_get("/b")
+            def beta(self, request):
+                return "beta"
+
+            @route_get("/c")
+            async def gamma(self, request):
+                return "gamma"
+
+        controller = MultiController()
+        request = rf.get("/")
+        assert await controller.alpha(request) == "alpha"
+        assert await controller.beta(request) == "beta"
+        assert await controller.gamma(request) == "gamma"
+
+
+class TestControllerBodyShortCircuit:
+    """The request body is only read when a route declares a Pydantic param."""
+
+    @pytest.mark.asyncio
+    async def test_route_without_model_does_not_read_body(self, rf):
+        from unittest.mock import patch
+
+        from django_matt.core import controller as controller_module
+
+        class ReadController(Controller):
+            @route_get("/<id>")
+            async def retrieve(self, request, id):
+                return {"id": id}
+
+        controller = ReadController()
+        request = rf.generic("DELETE", "/1", b'{"a": 1}', content_type="application/json")
+        with patch.object(controller_module, "load_json_body") as loader:
+            assert await controller.retrieve(request, "1") == {"id": "1"}
+        loader.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_non_json_body_not_read(self, rf):
+        class UploadController(Controller):
+            @route_get("/")
+            async def upload(self, request, data: UserSchema = None):
+                return {"files": list(request.FILES)}
+
+        controller = UploadController()
+        request = rf.post("/", {"file": "x"})
+        # Reading request.body after request.FILES raises RawPostDataException
+        request.FILES  # noqa: B018
+        assert await controller.upload(request) == {"files": []}
+
+
 @pytest.fixture
 def rf():
     """Provide a Django RequestFactory for tests."""
@@ -0,0 +1,319 @@
+"""
+Tests for django_matt.core.router.APIRouter view construction.
+
+Covers:
+- Per-endpoint work hoisted out of the generated view function
+- Body parsing specialized by HTTP method
+- get_urls() caching and include_router merging
+- The Route record and its read-only mapping interface
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from django.test import RequestFactory
+
+import pytest
+from pydantic import BaseModel
+
+from django_matt.core.router import APIRouter, Route
+
+
+class ItemOut(BaseModel):
+    id: int
+    name: str
+
+
+@pytest.fixture
+def rf():
+    return RequestFactory()
+
+
+class TestViewFuncConstruction:
+    """Tests for APIRouter._create_view_func."""
+
+    @pytest.mark.asyncio
+    async def test_coroutine_check_runs_once_per_endpoint(self, rf):
+        """iscoroutinefunction is resolved at build time, not per request."""
+
+        async def endpoint(request):
+            return {"ok": True}
+
+        view = APIRouter._create_view_func(endpoint, None, 200, methods=["GET"])
+        with patch("django_matt.core.router.inspect.iscoroutinefunction") as iscoro:
+            await view(rf.get("/"))
+            await view(rf.get("/"))
+        iscoro.assert_not_called()
+
+    def test_view_func_carries_endpoint_identity(self):
+        """The built view reports the endpoint's name for resolver/tracebacks."""
+
+        async def list_widgets(request):
+            return []
+
+        view = APIRouter._create_view_func(list_widgets, None, 200, methods=["GET"])
+        assert view.__name__ == "list_widgets"
+        assert view.__qualname__ == list_widgets.__qualname__
+        assert view.__module__ == __name__
+        assert view.__wrapped__ is list_widgets
+
+    @pytest.mark.asyncio
+    async def test_dict_result_validated_against_response_model(self, rf):
+        """Dict results are validated when a response_model is declared."""
+
+        def endpoint(request):
+            return {"id": 1, "name": "widget", "secret": "x"}
+
+        view = APIRouter._create_view_func(endpoint, ItemOut, 200, methods=["GET"])
+        response = await view(rf.get("/"))
+        assert json.loads(response.content) == {"id": 1, "name": "widget"}
+
+    @pytest.mark.asyncio
+    async def test_model_and_dict_results_format_datetimes_alike(self, rf):
+        """Model, dict and list responses all use Django's datetime format."""
+        import datetime
+
+        class EventOut(BaseModel):
+            at: datetime.datetime
+
+        at = datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.UTC)
+
+        async def model_endpoint(request):
+            return EventOut(at=at)
+
+        async def dict_endpoint(request):
+            return {"at": at}
+
+        async def list_endpoint(request):
+            return [EventOut(at=at)]
+
+        bodies = []
+        for endpoint, model in (
+            (model_endpoint, EventOut),
+            (dict_endpoint, EventOut),
+            (dict_endpoint, None),
+            (list_endpoint, None),
+        ):
+            view = APIRouter._create_view_func(endpoint, model, 200, methods=["GET"])
+            bodies.append(json.loads((await view(rf.get("/"))).content))
+
+        assert bodies[0] == bodies[1] == bodies[2] == {"at": "2024-01-02T03:04:05.123Z"}
+        assert bodies[3] == [bodies[0]]
+
+    @pytest.mark.asyncio
+    async def test_invalid_dict_result_is_server_error(self, rf):
+        """Dicts that don't satisfy the response_model still yield a 500."""
+
+        def endpoint(request):
+            return {"id": "not-an-int"}
+
+        view = APIRouter._create_view_func(endpoint, ItemOut, 200, methods=["GET"])
+        response = await view(rf.get("/"))
+        assert response.status_code == 500
+        assert json.loads(response.content)["detail"] == "Response validation error"
+
+    @pytest.mark.asyncio
+    async def test_plain_results_encoded_with_orjson(self, rf):
+        """Dict/list results skip DjangoJSONEncoder but keep its datetime format."""
+        import datetime
+
+        from django.http import JsonResponse
+
+        stamp = datetime.datetime(2024, 5, 1, 12, 0, 0, 123456, tzinfo=datetime.UTC)
+
+        async def endpoint(request):
+            return [{"at": stamp}]
+
+        view = APIRouter._create_view_func(endpoint, None, 200, methods=["GET"])
+        with patch("django.core.serializers.json.DjangoJSONEncoder.encode") as encode:
+            response = await view(rf.get("/"))
+        encode.assert_not_called()
+        assert isinstance(response, JsonResponse)
+        expected = JsonResponse([{"at": stamp}], safe=False).content
+        assert json.loads(response.content) == json.loads(expected)
+
+
+class TestBodyParsingByMethod:
+    """Body parsing is specialized by the route's HTTP methods."""
+
+    @pytest.mark.asyncio
+    async def test_get_route_skips_body_parsing(self, rf):
+        """GET routes without a body parameter never parse the payload."""
+        seen = {}
+
+        async def endpoint(request, **kwargs):
+            seen.update(kwargs)
+            return {"ok": True}
+
+        view = APIRouter._create_view_func(endpoint, None, 200, methods=["GET"])
+        request = rf.generic("GET", "/", data="not json", content_type="application/json")
+        response = await view(request)
+        assert response.status_code == 200
+        assert seen == {}
+
+    @pytest.mark.asyncio
+    async def test_delete_route_with_body_param_still_parses(self, rf):
+        """A DELETE endpoint that declares ``body`` keeps receiving it."""
+
+        async def endpoint(request, body=None):
+            return {"body": body}
+
+        view = APIRouter._create_view_func(endpoint, None, 200, methods=["DELETE"])
+        request = rf.delete("/", data='{"ids": [1, 2]}', content_type="application/json")
+        response = await view(request)
+        assert json.loads(response.content) == {"body": {"ids": [1, 2]}}
+
+    @pytest.mark.asyncio
+    async def test_post_route_accepts_charset_content_type(self, rf):
+        """POST bodies are parsed when the content type carries a charset."""
+
+        async def endpoint(request, body=None):
+            return {"body": body}
+
+        view = APIRouter._create_view_func(endpoint, None, 201, methods=["POST"])
+        request = rf.post("/", data='{"name": "x"}', content_type="application/json; charset=utf-8")
+        response = await view(request)
+        assert json.loads(response.content) == {"body": {"name": "x"}}
+
+    @pytest.mark.asyncio
+    async def test_post_route_without_body_param_skips_parsing(self, rf):
+        """Write endpoints that can't receive ``body`` never parse the payload."""
+
+        async def endpoint(request):
+            return {"ok": True}
+
+        view = APIRouter._create_view_func(endpoint, None, 200, methods=["POST"])
+        with patch("django_matt.core.router.load_json_body") as load:
+            response = await view(rf.post("/", data="not json", content_type="application/json"))
+        load.assert_not_called()
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_post_route_with_var_kwargs_still_parses(self, rf):
+        """``**kwargs`` endpoints on write routes keep receiving ``body``."""
+        seen = {}
+
+        async def endpoint(request, **kwargs):
+            seen.update(kwargs)
+            return {"ok": True}
+
+        view = APIRouter._create_view_func(endpoint, None, 200, methods=["POST"])
+        await view(rf.post("/", data='{"name": "x"}', content_type="application/json"))
+        assert seen == {"body": {"name": "x"}}
+
+
+class TestRouterUrlCache:
+    """get_urls() output is cached until the route table changes."""
+
+    def test_get_urls_reuses_built_patterns(self):
+        router = APIRouter()
+
+        @router.get("/items/")
+        async def list_items(request):
+            return []
+
+        with patch.object(
+            APIRouter, "_create_view_func", wraps=APIRouter._create_view_func
+        ) as create:
+            first = router.get_urls()
+            second = router.get_urls()
+        assert create.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_adding_route_invalidates_cache(self):
+        router = APIRouter()
+
+        @router.get("/a/")
+        async def a(request):
+            return {}
+
+        assert len(router.get_urls()) == 1
+
+        @router.get("/b/")
+        async def b(request):
+            return {}
+
+        assert len(router.get_urls()) == 2
+
+    def test_include_router_merges_paths_and_tags(self):
+        child = APIRouter(tags=["child"])
+
+        @child.get("/things/", tags=["things"])
+        async def things(request):
+            return []
+
+        parent = APIRouter(prefix="/api", tags=["api"])
+        assert parent.get_urls() == []
+        parent.include_router(child, prefix="/v1")
+
+        route = parent.routes[0]
+        assert route["path"] == "/api/v1/things/"
+        assert route["tags"] == ["things", "api"]
+        assert child.routes[0]["path"] == "/things/"
+        assert len(parent.get_urls()) == 1
+
+
+class TestRouteRecord:
+    """Routes are slotted records that still read like dicts."""
+
+    def test_add_route_stores_route_record(self):
+        router = APIRouter()
+
+        @router.post("/items/", tags=["items"])
+        async def create_item(request):
+            return {}
+
+        route = router.routes[0]
+        assert isinstance(route, Route)
+        assert route.methods == ["POST"]
+        assert route.status_code == 201
+        assert not hasattr(route, "__dict__")
+
+    def test_mapping_interface(self):
+        route = Route(path="/x/", endpoint=print, methods=["GET"], name="x")
+        assert route["path"] == "/x/"
+        assert route.get("tags", None) == []
+        assert route.get("hints", {}) == {}
+        assert dict(route)["name"] == "x"
+        with pytest.raises(KeyError):
+            route["missing"]
+
+
+class TestControllerRouteScan:
+    """Controller routes are taken from the class-level registry."""
+
+    def test_controller_routes_cached_in_declaration_order(self):
+        from django_matt.core.controller import APIController
+        from django_matt.core.router import _controller_routes, get, post
+
+        class WidgetController(APIController):
+            prefix = "/widgets"
+
+            @post("/")
+            async def zebra(self, request):
+                return {}
+
+            @get("/")
+            async def alpha(self, request):
+                return []
+
+        routes = _controller_routes(WidgetController)
+        assert [name for name, _info in routes] == ["zebra", "alpha"]
+        assert routes[0][1]["methods"] == ["POST"]
+        assert _controller_routes(WidgetController) is routes
+
+    def test_plain_class_falls_back_to_scanning(self):
+        from django_matt.core.router import _controller_routes, get
+
+        class Plain:
+            @get("/ping/")
+            def ping(self, request):
+                return {}
+
+            def helper(self):
+                return None
+
+        assert [name for name, _info in _controller_routes(Plain)] == ["ping"]
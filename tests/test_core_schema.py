@@ -0,0 +1,316 @@
+"""Tests for django_matt.core.schema model → schema generation."""
+
+from decimal import Decimal
+from typing import Optional
+
+from django.contrib.auth.models import Group, User
+from django.db import models
+
+from pydantic import BaseModel
+
+from django_matt.core.schema import (
+    create_schema_from_model,
+    register_field_type,
+    unregister_field_type,
+)
+
+
+class TestCreateSchemaCache:
+    """create_schema_from_model builds each (model, projection) schema once."""
+
+    def test_same_arguments_return_same_class(self):
+        first = create_schema_from_model(User, include=["id", "username"])
+        second = create_schema_from_model(User, include=("username", "id"))
+        assert first is second
+        assert set(first.model_fields) == {"id", "username"}
+
+    def test_different_projection_builds_new_class(self):
+        full = create_schema_from_model(Group)
+        slim = create_schema_from_model(Group, exclude=["permissions"])
+        assert full is not slim
+        assert "permissions" in full.model_fields
+        assert "permissions" not in slim.model_fields
+
+    def test_optional_is_part_of_the_key(self):
+        required = create_schema_from_model(Group, name="GroupIn")
+        optional = create_schema_from_model(Group, name="GroupIn", optional=["name"])
+        assert required is not optional
+        assert required.model_fields["name"].is_required()
+        assert not optional.model_fields["name"].is_required()
+
+    def test_registering_field_type_invalidates_cache(self):
+        before = create_schema_from_model(Group, include=["name"])
+        register_field_type(models.CharField, bytes)
+        try:
+            after = create_schema_from_model(Group, include=["name"])
+            assert after is not before
+            assert after.model_fields["name"].annotation is bytes
+        finally:
+            unregister_field_type(models.CharField)
+        assert (
+            create_schema_from_model(Group, include=["name"]).model_fields["name"].annotation is str
+        )
+
+
+class TestModelFieldTable:
+    """Model fields are reflected once into parallel tuples."""
+
+    def test_table_is_built_once_per_model(self):
+        from django_matt.core.schema import _model_field_table
+
+        table = _model_field_table(Group)
+        assert _model_field_table(Group) is table
+        names, python_types, nullable, defaults, m2m_names = table
+        assert names == ("id", "name")
+        assert python_types == (int, str)
+        assert nullable == (False, False)
+        assert defaults == (models.NOT_PROVIDED, models.NOT_PROVIDED)
+        assert m2m_names == ("permissions",)
+
+    def test_field_defaults_carry_into_schema(self):
+        schema = create_schema_from_model(User, include=["is_active", "last_login"])
+        assert schema.model_fields["is_active"].default is True
+        assert schema.model_fields["last_login"].default is None
+
+
+class TestFieldTypeResolution:
+    """Field types resolve by class, most specific mapping first."""
+
+    def test_datetime_field_maps_to_datetime(self):
+        import datetime
+
+        from django_matt.core.schema import _get_python_type_for_field
+
+        assert _get_python_type_for_field(models.DateTimeField()) is datetime.datetime
+        assert _get_python_type_for_field(models.DateField()) is datetime.date
+
+    def test_subclass_resolves_to_closest_mapped_base(self):
+        from django_matt.core.schema import _get_python_type_for_field, _mapped_type_for_class
+
+        class ShoutingEmailField(models.EmailField):
+            pass
+
+        assert _get_python_type_for_field(ShoutingEmailField()) is str
+        assert _mapped_type_for_class(ShoutingEmailField) is str
+
+    def test_unknown_field_maps_to_any(self):
+        from typing import Any
+
+        from django_matt.core.schema import _get_python_type_for_field
+
+        class OpaqueField(models.Field):
+            pass
+
+        assert _get_python_type_for_field(OpaqueField()) is Any
+
+
+class TestOptionalAlias:
+    """Optional annotations are built once per distinct type."""
+
+    def test_optional_alias_is_shared_across_schemas(self):
+        users = create_schema_from_model(
+            User, include=["last_login", "first_name"], optional=["first_name"]
+        )
+        groups = create_schema_from_model(
+            Group, include=["name"], optional=["name"], name="OptionalGroup"
+        )
+        assert users.model_fields["first_name"].annotation is groups.model_fields["name"].annotation
+
+    def test_optional_matches_typing(self):
+        from typing import Optional
+
+        from django_matt.core.schema import _optional
+
+        assert _optional(int) == Optional[int]
+        assert _optional(int) is _optional(int)
+
+
+class TestSchemaClassConstruction:
+    """Generated schemas are built through the base class's own metaclass."""
+
+    def test_required_and_default_fields(self):
+        schema = create_schema_from_model(Group, name="GroupOut")
+        assert schema.__name__ == "GroupOut"
+        assert schema.__module__ == "django_matt.core.schema"
+        assert schema.model_fields["name"].is_required()
+        assert schema.model_fields["permissions"].default_factory is list
+        assert schema(id=1, name="staff").permissions == []
+
+    def test_model_schema_base_uses_its_metaclass(self):
+        from django_matt.core.schema import Schema
+
+        schema = Schema.from_django_model(Group, include=["id", "name"])
+        assert issubclass(schema, Schema)
+        assert type(schema) is type(Schema)
+        assert schema._django_model is Group
+        assert schema.from_orm(Group(id=3, name="ops")).name == "ops"
+
+
+class TestGeneratedFromOrm:
+    """The generated from_orm reads attributes through cached getters."""
+
+    def test_getters_cached_per_schema_class(self):
+        schema = create_schema_from_model(Group, include=["id", "name"], name="GroupRow")
+        schema.from_orm(Group(id=1, name="a"))
+        getters = schema.__dict__["_orm_getters"]
+        schema.from_orm(Group(id=2, name="b"))
+        assert schema.__dict__["_orm_getters"] is getters
+        assert [name for name, _getter in getters] == ["id", "name"]
+
+    def test_subclass_builds_its_own_getters(self):
+        schema = create_schema_from_model(Group, include=["id"], name="GroupId")
+        schema.from_orm(Group(id=1, name="a"))
+
+        class GroupWithName(schema):
+            name: str
+
+        row = GroupWithName.from_orm(Group(id=4, name="ops"))
+        assert (row.id, row.name) == (4, "ops")
+
+    def test_missing_attributes_fall_back_to_defaults(self):
+        from types import SimpleNamespace
+
+        schema = create_schema_from_model(User, include=["id", "username", "last_login"])
+        row = schema.from_orm(SimpleNamespace(id=1, username="ann"))
+        assert row.last_login is None
+
+
+class TestDjangoFieldForType:
+    """Type hints resolve to cached Django field factories."""
+
+    def test_each_call_builds_a_fresh_field(self):
+        from django_matt.core.schema import _get_django_field_for_type
+
+        first = _get_django_field_for_type(int)
+        second = _get_django_field_for_type(int)
+        assert isinstance(first, models.IntegerField)
+        assert first is not second
+        assert first.null
+
+    def test_optional_and_container_hints(self):
+        from typing import Optional
+
+        from django_matt.core.schema import _get_django_field_for_type
+
+        assert isinstance(_get_django_field_for_type(Optional[str]), models.CharField)
+        assert isinstance(_get_django_field_for_type(list[int]), models.JSONField)
+        assert isinstance(_get_django_field_for_type(dict[str, int]), models.JSONField)
+        assert isinstance(_get_django_field_for_type(Decimal), models.TextField)
+
+    def test_factory_resolution_is_cached(self):
+        from django_matt.core.schema import _django_field_factory
+
+        assert _django_field_factory(Optional[int]) is _django_field_factory(int)
+
+    def test_all_container_types_map_to_json(self):
+        from django_matt.core.schema import _get_django_field_for_type
+
+        for hint in (list, dict, tuple[int, ...], set[str], frozenset[int], Optional[set[int]]):
+            assert isinstance(_get_django_field_for_type(hint), models.JSONField), hint
+
+
+class TestSchemaFromDjangoModelCache:
+    """Schema.from_django_model caches built schemas per subclass."""
+
+    def test_repeat_calls_hit_the_class_cache(self):
+        from unittest.mock import patch
+
+        from django_matt.core.schema import Schema
+
+        class GroupSchemaBase(Schema):
+            pass
+
+        first = GroupSchemaBase.from_django_model(Group, include=["id", "name"])
+        with patch("django_matt.core.schema.create_schema_from_model") as create:
+            second = GroupSchemaBase.from_django_model(Group, include=["name", "id"])
+        create.assert_not_called()
+        assert first is second
+        assert "_schema_cache" in vars(GroupSchemaBase)
+
+    def test_subclasses_get_their_own_schemas(self):
+        from django_matt.core.schema import Schema
+
+        class AdminSchema(Schema):
+            pass
+
+        class PublicSchema(Schema):
+            pass
+
+        admin = AdminSchema.from_django_model(Group)
+        public = PublicSchema.from_django_model(Group)
+        assert admin is not public
+        assert issubclass(admin, AdminSchema)
+        assert issubclass(public, PublicSchema)
+
+    def test_field_registration_clears_base_schema_cache(self):
+        from django_matt.core.schema import Schema
+
+        before = Schema.from_django_model(User, include=["username"])
+        assert Schema.from_django_model(User, include=["username"]) is before
+        register_field_type(models.CharField, int)
+        try:
+            after = Schema.from_django_model(User, include=["username"])
+        finally:
+            unregister_field_type(models.CharField)
+        assert after is not before
+        assert after.model_fields["username"].annotation is int
+        assert (
+            Schema.from_django_model(User, include=["username"]).model_fields["username"].annotation
+            is str
+        )
+
+    def test_field_registration_clears_class_caches(self):
+        from django_matt.core.schema import Schema
+
+        class RegistrySchema(Schema):
+            pass
+
+        before = RegistrySchema.from_django_model(Group, include=["name"])
+        register_field_type(models.CharField, bytes)
+        try:
+            after = RegistrySchema.from_django_model(Group, include=["name"])
+        finally:
+            unregister_field_type(models.CharField)
+        assert after is not before
+        assert after.model_fields["name"].annotation is bytes
+
+
+class TestFieldDefaults:
+    """Plain defaults are set without a Field() call; callables use a factory."""
+
+    def test_plain_and_callable_defaults(self):
+        from django.utils import timezone
+
+        schema = create_schema_from_model(User, include=["is_staff", "date_joined"])
+        assert schema.model_fields["is_staff"].default is False
+        assert schema.model_fields["date_joined"].default_factory is timezone.now
+
+    def test_model_schema_defaults(self):
+        from django_matt.core.schema import ModelSchema
+
+        class UserFlags(ModelSchema):
+            class Config:
+                model = User
+                include = ["id", "is_active", "last_login"]
+
+        row = UserFlags(id=1)
+        assert row.is_active is True
+        assert row.last_login is None
+
+
+class TestGeneratedInstanceLayout:
+    """Generated schema rows keep pydantic's lean default layout."""
+
+    def test_rows_carry_only_field_values(self):
+        schema = create_schema_from_model(Group, include=["id", "name"], name="GroupLean")
+        row = schema(id=1, name="ops", unexpected="dropped")
+        assert row.__pydantic_extra__ is None
+        assert vars(row) == {"id": 1, "name": "ops"}
+        assert "__pydantic_extra__" in BaseModel.__slots__
+
+    def test_base_config_is_inherited(self):
+        from django_matt.core.schema import Schema
+
+        schema = Schema.from_django_model(Group, include=["id", "name"])
+        assert schema.model_config["from_attributes"] is True
+        assert schema.model_config.get("extra", "ignore") == "ignore"
@@ -628,6 +628,24 @@ class TestDBUtilities:
         """is_mysql() returns False when running on SQLite."""
         assert is_mysql() is False
 
+    def test_vendor_cached_per_alias(self):
+        """The vendor is read once per alias and refreshed when a connection opens."""
+        from django.db.backends.signals import connection_created
+
+        from django_matt.db import meta_cache
+
+        meta_cache.invalidate_db_meta(connection.alias)
+        assert get_db_type() == "sqlite"
+        assert meta_cache._VENDOR_CACHE[connection.alias] == "sqlite"
+
+        meta_cache._VENDOR_CACHE[connection.alias] = "postgresql"
+        try:
+            assert is_postgres() is True
+        finally:
+            connection_created.send(sender=type(connection), connection=connection)
+        assert meta_cache._VENDOR_CACHE[connection.alias] == "sqlite"
+        assert is_sqlite() is True
+
     def test_get_table_names_returns_list(self):
         """get_table_names() returns a non-empty list of table names."""
         tables = get_table_names()
@@ -657,6 +675,55 @@ class TestDBUtilities:
         # Cleanup
         execute_raw_sql("DROP TABLE IF EXISTS _test_raw_sql")
 
+    def test_execute_raw_sql_fetches_in_batches(self):
+        """Rows are pulled in fetchmany() batches and keyed by column."""
+        from django_matt.db.cursors import fetch_dict_rows
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 AS a, 'x' AS b UNION ALL SELECT 2, 'y' UNION ALL SELECT 3, 'z'"
+            )
+            rows = fetch_dict_rows(cursor, batch_size=2)
+        assert rows == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "b": "z"}]
+
+    def test_iter_raw_sql_yields_rows_lazily(self):
+        """iter_raw_sql streams dict rows and matches execute_raw_sql."""
+        import types
+
+        from django_matt.db import iter_raw_sql
+
+        sql = "SELECT 1 AS n UNION ALL SELECT 2 UNION ALL SELECT 3"
+        rows = iter_raw_sql(sql, itersize=2)
+        assert isinstance(rows, types.GeneratorType)
+        assert next(rows) == {"n": 1}
+        assert list(rows) == [{"n": 2}, {"n": 3}]
+        assert list(iter_raw_sql(sql)) == execute_raw_sql(sql)
+
+    def test_get_db_version_cached_per_connection(self):
+        """get_db_version() queries the server once per connection."""
+        from django.test.utils import CaptureQueriesContext
+
+        from django_matt.db import get_db_version, invalidate_db_meta
+
+        invalidate_db_meta()
+        with CaptureQueriesContext(connection) as queries:
+            first = get_db_version()
+            second = get_db_version()
+        assert first == second
+        assert len(queries) == 1
+
+    def test_reconnect_invalidates_cached_metadata(self):
+        """A new connection for the alias drops its cached metadata."""
+        from django.db.backends.signals import connection_created
+
+        from django_matt.db import get_db_version
+        from django_matt.db.meta_cache import _DB_META_CACHE
+
+        get_db_version()
+        assert connection.alias in _DB_META_CACHE
+        connection_created.send(sender=type(connection), connection=connection)
+        assert connection.alias not in _DB_META_CACHE
+
 
 # =============================================================================
 # QuerySet interaction with Django ORM features
@@ -748,6 +815,22 @@ class TestPostgresUtilities:
 
         assert is_postgres_version_compatible() is False
 
+    def test_is_postgres_version_compatible_uses_connection_info(self):
+        """The server version comes from pg_version; nothing is queried."""
+        from django_matt.db import postgres
+
+        with (
+            patch.object(postgres, "check_postgres_connection", return_value=True),
+            patch.object(postgres, "connection") as conn,
+        ):
+            conn.pg_version = 150004
+            assert postgres.is_postgres_version_compatible("12.0") is True
+            assert postgres.is_postgres_version_compatible("15") is True
+            assert postgres.is_postgres_version_compatible("16.1") is False
+            conn.pg_version = 90603
+            assert postgres.is_postgres_version_compatible("10") is False
+        conn.cursor.assert_not_called()
+
     def test_create_extension_raises_on_sqlite(self):
         """create_extension raises ValueError on non-PostgreSQL connection."""
         from django_matt.db.postgres import create_extension
@@ -817,3 +900,188 @@ class TestDBModuleExports:
         assert callable(get_table_names)
         assert callable(get_table_description)
         assert callable(execute_raw_sql)
+
+    def test_pgvector_classes_resolve_lazily(self):
+        """pgvector classes are only loaded when first accessed."""
+        from django_matt.db import VectorField
+        from django_matt.db.postgres import vector
+
+        assert VectorField is vector.VectorField
+        assert vars(vector)["VectorField"] is VectorField
+        if not vector.HAS_PGVECTOR:
+            with pytest.raises(ImportError, match="pgvector is not installed"):
+                VectorField(dimensions=3)
+
+    def test_pgvector_import_deferred_until_use(self, monkeypatch):
+        """With pgvector installed, pgvector.django is imported on first access."""
+        import sys
+        import types
+
+        from django_matt.db.postgres import vector
+
+        fake = types.ModuleType("pgvector.django")
+        fake.CosineDistance = type("CosineDistance", (), {})
+        package = types.ModuleType("pgvector")
+        package.django = fake
+        monkeypatch.setitem(sys.modules, "pgvector", package)
+        monkeypatch.setitem(sys.modules, "pgvector.django", fake)
+        monkeypatch.setattr(vector, "HAS_PGVECTOR", True)
+        monkeypatch.delitem(vars(vector), "CosineDistance", raising=False)
+        vector._pgvector.cache_clear()
+
+        try:
+            assert vector.CosineDistance is fake.CosineDistance
+            assert vector._pgvector() is fake
+        finally:
+            vector._pgvector.cache_clear()
+
+    def test_postgres_support_needs_no_optional_imports(self):
+        """The postgres helpers are always importable; only pgvector is optional."""
+        from django_matt import db
+
+        assert db.HAS_POSTGRES is True
+        assert db.HAS_PGVECTOR is db.postgres.vector.HAS_PGVECTOR
+        assert "create_vector_index" in db.__all__
+
+
+class TestCreateVectorIndex:
+    """create_vector_index builds quoted DDL for each index type."""
+
+    def _run(self, *args, procedure=False, **kwargs):
+        from django_matt.db.postgres import vector
+
+        cursor = MagicMock()
+        with (
+            patch.object(connection, "cursor") as make_cursor,
+            patch.object(vector, "_has_vector_index_procedure", return_value=procedure),
+        ):
+            make_cursor.return_value.__enter__.return_value = cursor
+            vector.create_vector_index(*args, **kwargs)
+        return cursor.execute.call_args.args
+
+    def _statement(self, *args, **kwargs):
+        return self._run(*args, **kwargs)[0]
+
+    def test_ivfflat_quotes_identifiers(self):
+        statement = self._statement(SoftArticle, "title", index_type="ivfflat", lists="50")
+        table = SoftArticle._meta.db_table
+        assert f'CREATE INDEX IF NOT EXISTS "{table}_title_ivfflat_idx" ON "{table}"' in statement
+        assert 'USING ivfflat ("title" vector_l2_ops) WITH (lists = 50);' in statement
+
+    def test_hnsw_and_exact_indexes(self):
+        assert 'USING hnsw ("title" vector_l2_ops)' in self._statement(
+            SoftArticle, "title", index_type="hnsw"
+        )
+        assert 'USING btree ("title")' in self._statement(SoftArticle, "title", index_type=None)
+
+    def test_rejects_non_integer_lists(self):
+        with pytest.raises(ValueError):
+            self._statement(SoftArticle, "title", lists="1); DROP TABLE x; --")
+
+    def test_unknown_field_is_rejected(self):
+        from django.core.exceptions import FieldDoesNotExist
+
+        with pytest.raises(FieldDoesNotExist):
+            self._statement(SoftArticle, "nope")
+
+    def test_installed_procedure_is_called_with_parameters(self):
+        table = SoftArticle._meta.db_table
+        statement, params = self._run(
+            SoftArticle, "title", index_type="ivfflat", lists="50", procedure=True
+        )
+        assert statement == "CALL dm_create_vec_idx(%s, %s, %s, %s, %s)"
+        assert params == [f"{table}_title_ivfflat_idx", table, "title", "ivfflat", 50]
+
+        _statement, params = self._run(SoftArticle, "title", index_type=None, procedure=True)
+        assert params == [f"{table}_title_idx", table, "title", "btree", 100]
+
+    def test_setup_installs_procedure(self):
+        from django_matt.db.postgres.vector import setup_pgvector
+
+        cursor = MagicMock()
+        with patch.object(connection, "cursor") as make_cursor:
+            make_cursor.return_value.__enter__.return_value = cursor
+            setup_pgvector()
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        assert statements[0] == "CREATE EXTENSION IF NOT EXISTS vector;"
+        assert "CREATE OR REPLACE PROCEDURE dm_create_vec_idx(" in statements[1]
+        assert "format(" in statements[1]
+
+
+class TestSimilaritySearch:
+    """similarity_search serializes each distinct query vector once."""
+
+    def test_vector_literal_matches_pgvector_text_format(self):
+        from django_matt.db.postgres.vector import _vector_literal
+
+        assert _vector_literal((1, 0.5, -2)) == "[1.0,0.5,-2.0]"
+        assert _vector_literal((1, 0.5, -2)) is _vector_literal((1, 0.5, -2))
+
+    def test_query_vector_passed_as_serialized_value(self, monkeypatch):
+        from django.db.models import Value
+
+        from django_matt.db.postgres import vector
+
+        calls = []
+
+        class FakeDistance:
+            def __init__(self, field_name, value):
+                calls.append((field_name, value))
+
+        monkeypatch.setattr(vector, "HAS_PGVECTOR", True)
+        monkeypatch.setitem(vars(vector), "CosineDistance", FakeDistance)
+        queryset = MagicMock()
+
+        vector.vector_manager.similarity_search(queryset, "embedding", [0.25, 1])
+        vector.vector_manager.similarity_search(queryset, "embedding", (0.25, 1.0))
+
+        (_, first), (_, second) = calls
+        assert isinstance(first, Value)
+        assert first.value == "[0.25,1.0]"
+        assert first.value is second.value
+
+    def test_expressions_pass_through(self):
+        from django.db.models import F
+
+        from django_matt.db.postgres.vector import _query_vector_value
+
+        expression = F("other_embedding")
+        assert _query_vector_value(expression) is expression
+
+    def test_pgvector_objects_pass_through(self):
+        """Objects such as SparseVector keep pgvector's own serialization."""
+        from django_matt.db.postgres.vector import _query_vector_value
+
+        class SparseVector:
+            def to_list(self):
+                return [0.0, 1.5, 0.0]
+
+        sparse = SparseVector()
+        assert _query_vector_value(sparse) is sparse
+
+    def test_numpy_arrays_are_serialized(self):
+        from django_matt.db.postgres.vector import _query_vector_value
+
+        ndarray = type("ndarray", (), {"__module__": "numpy", "tolist": lambda self: [1, 2]})
+        assert _query_vector_value(ndarray()).value == "[1.0,2.0]"
+
+    def test_distance_func_dispatch(self, monkeypatch):
+        from django_matt.db.postgres import vector
+
+        used = []
+        monkeypatch.setattr(vector, "HAS_PGVECTOR", True)
+        for name in ("CosineDistance", "L2Distance", "MaxInnerProduct"):
+            monkeypatch.setitem(
+                vars(vector),
+                name,
+                type(name, (), {"__init__": lambda self, *a, n=name: used.append(n)}),
+            )
+
+        for func in ("cosine", "l2", "dot"):
+            vector.vector_manager.similarity_search(
+                MagicMock(), "embedding", [1.0], distance_func=func
+            )
+        assert used == ["CosineDistance", "L2Distance", "MaxInnerProduct"]
+
+        with pytest.raises(ValueError, match="Unknown distance function: manhattan"):
+            vector.vector_manager.similarity_search(MagicMock(), "embedding", [1.0], "manhattan")
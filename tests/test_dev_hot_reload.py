@@ -0,0 +1,510 @@
+"""
+Tests for django_matt.dev.hot_reload.
+
+Covers:
+  - HotReloadEventHandler: watchdog patterns, ignored directories/files
+  - HotReloadEventHandler: debounce worker thread, batched paths
+  - HotReloader._handle_reload: one action per batch
+  - WebSocketServer: broadcast, accept loop lifecycle, RFC 6455 handshake/framing
+  - inject_live_reload_script / LiveReloadMiddleware: bytes-level injection
+  - HotReloader watch plan: expensive ignored subtrees pruned, emitters bounded
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+
+pytest.importorskip("watchdog")
+
+from watchdog.events import DirModifiedEvent, FileModifiedEvent, FileMovedEvent
+
+from django_matt.dev.hot_reload import HotReloadEventHandler
+
+
+class TestHotReloadEventFiltering:
+    """Events are filtered by path component, file suffix and extension."""
+
+    def setup_method(self):
+        self.handler = HotReloadEventHandler(MagicMock(), debounce_seconds=60)
+
+    def teardown_method(self):
+        self.handler.stop()
+
+    def _schedules(self, path: str) -> bool:
+        self.handler._pending_paths.clear()
+        self.handler.dispatch(FileModifiedEvent(path))
+        return path in self.handler._pending_paths
+
+    def test_watched_file_schedules_reload(self):
+        assert self._schedules("/app/views.py")
+
+    def test_ignored_directory_component(self):
+        assert not self._schedules("/app/node_modules/pkg/index.js")
+        assert not self._schedules("/app/__pycache__/views.py")
+
+    def test_directory_names_match_whole_components_only(self):
+        # "env" is ignored, but only as a directory, not as part of a name
+        assert not self._schedules("/app/env/lib/site.py")
+        assert self._schedules("/app/environment/settings.py")
+
+    def test_ignored_file_suffix(self):
+        assert not self._schedules("/app/views.pyc")
+
+    def test_unwatched_extension(self):
+        assert not self._schedules("/app/README.md")
+
+    def test_directory_events_are_ignored(self):
+        self.handler.dispatch(DirModifiedEvent("/app/templates.py"))
+        assert not self.handler._pending_paths
+
+    def test_move_onto_watched_file_reloads_destination(self):
+        self.handler.dispatch(FileMovedEvent("/app/.views.py.swp", "/app/views.py"))
+        assert self.handler._pending_paths == {"/app/views.py"}
+
+    def test_patterns_built_from_configuration(self):
+        handler = HotReloadEventHandler(
+            MagicMock(), watched_extensions={".txt"}, ignored_files={"*.log", "secret.txt"}
+        )
+        assert handler.watched_extensions == frozenset({".txt"})
+        assert handler.patterns == ["*.txt"]
+        assert set(handler.ignore_patterns) == {"*.log", "secret.txt"}
+        assert handler.ignore_directories
+
+
+class TestHotReloadDebounce:
+    """A burst of events is debounced on one long-lived worker thread."""
+
+    def test_burst_fires_once_with_every_path(self):
+        fired = threading.Event()
+        callback = MagicMock(side_effect=lambda paths: fired.set())
+        handler = HotReloadEventHandler(callback, debounce_seconds=0.05)
+        try:
+            for name in ("c.py", "a.py", "c.py", "b.css"):
+                handler.dispatch(FileModifiedEvent(f"/app/{name}"))
+            worker = handler._worker
+            assert fired.wait(2)
+            time.sleep(0.1)
+            callback.assert_called_once_with(["/app/a.py", "/app/b.css", "/app/c.py"])
+
+            fired.clear()
+            handler.dispatch(FileModifiedEvent("/app/d.py"))
+            assert fired.wait(2)
+            assert handler._worker is worker
+        finally:
+            handler.stop()
+        assert not worker.is_alive()
+
+    def test_callback_errors_do_not_stop_the_worker(self):
+        fired = threading.Event()
+        calls = []
+
+        def callback(paths):
+            calls.extend(paths)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            fired.set()
+
+        handler = HotReloadEventHandler(callback, debounce_seconds=0.01)
+        try:
+            handler.dispatch(FileModifiedEvent("/app/a.py"))
+            time.sleep(0.1)
+            handler.dispatch(FileModifiedEvent("/app/b.py"))
+            assert fired.wait(2)
+        finally:
+            handler.stop()
+        assert calls == ["/app/a.py", "/app/b.py"]
+
+
+class TestHotReloaderBatches:
+    """A batch of changed paths results in a single reload action."""
+
+    def _reloader(self):
+        from django_matt.dev.hot_reload import HotReloader
+
+        reloader = HotReloader(project_dir="/app")
+        reloader.websocket_server = MagicMock()
+        return reloader
+
+    def test_python_change_restarts_server_once(self):
+        reloader = self._reloader()
+        reloader.server_process = MagicMock(args=["runserver"])
+        with patch.object(reloader, "_start_server") as start:
+            reloader._handle_reload(["/app/a.py", "/app/b.py", "/app/site.css"])
+        start.assert_called_once_with(["runserver"])
+        reloader.server_process.terminate.assert_called_once()
+        reloader.websocket_server.send_reload_message.assert_not_called()
+
+    def test_static_changes_send_one_message(self):
+        reloader = self._reloader()
+        reloader._handle_reload(["/app/site.css", "/app/base.html"])
+        reloader.websocket_server.send_reload_message.assert_called_once_with(
+            ["/app/site.css", "/app/base.html"]
+        )
+
+    def test_reload_message_lists_all_paths(self):
+        from django_matt.dev.hot_reload import WebSocketServer
+
+        server = WebSocketServer()
+        client = MagicMock()
+        server.clients.add(client)
+        server.send_reload_message(["/app/a.css", "/app/b.js"])
+        payload = client.sendall.call_args.args[0]
+        assert payload[0] == 0x81
+        assert b'"paths":["/app/a.css","/app/b.js"]' in payload
+        assert b'"path":"/app/a.css"' in payload
+
+
+class TestWebSocketBroadcast:
+    """Broadcasts send one pre-encoded frame to a snapshot of the clients."""
+
+    def test_dead_clients_are_shut_down_for_the_server_loop(self):
+        import socket
+
+        from django_matt.dev.hot_reload import WebSocketServer
+
+        server = WebSocketServer()
+        alive, dead = MagicMock(), MagicMock()
+        dead.sendall.side_effect = BrokenPipeError
+        server.clients.update({alive, dead})
+
+        server.send_reload_message("/app/site.css")
+
+        dead.shutdown.assert_called_once_with(socket.SHUT_RDWR)
+        alive.shutdown.assert_not_called()
+        assert alive.sendall.call_args.args[0].startswith(b"\x81")
+
+    def test_same_bytes_sent_to_every_client(self):
+        from django_matt.dev.hot_reload import WebSocketServer
+
+        server = WebSocketServer()
+        clients = [MagicMock() for _ in range(3)]
+        server.clients.update(clients)
+        server.send_reload_message("/app/site.css")
+        payloads = {id(client.sendall.call_args.args[0]) for client in clients}
+        assert len(payloads) == 1
+
+
+class TestWebSocketServerLifecycle:
+    """One selector loop serves all clients and stops without a poll timeout."""
+
+    def _wait_for(self, condition, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _start(self):
+        from django_matt.dev.hot_reload import WebSocketServer
+
+        server = WebSocketServer(host="127.0.0.1", port=0)
+        server.start()
+        assert self._wait_for(lambda: server.server_socket is not None)
+        assert self._wait_for(lambda: server.server_socket.getsockname()[1] != 0)
+        return server, server.server_socket.getsockname()[1]
+
+    def _connect(self, port):
+        """Open a connection and complete the WebSocket handshake."""
+        conn = socket.create_connection(("127.0.0.1", port), timeout=2)
+        conn.sendall(
+            b"GET / HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n"
+            b"Connection: Upgrade\r\nSec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n"
+            b"Sec-WebSocket-Version: 13\r\n\r\n"
+        )
+        response = b""
+        while b"\r\n\r\n" not in response:
+            response += conn.recv(1024)
+        assert response.startswith(b"HTTP/1.1 101 Switching Protocols\r\n")
+        assert b"Sec-WebSocket-Accept: s3pPLMBiTxaQ9kYGzzhZRbK+xOo=\r\n" in response
+        return conn
+
+    def test_one_thread_serves_all_clients(self):
+        threads_before = threading.active_count()
+        server, port = self._start()
+        try:
+            conns = [self._connect(port) for _ in range(5)]
+            assert self._wait_for(lambda: len(server.clients) == 5)
+            assert threading.active_count() <= threads_before + 1
+            for conn in conns:
+                conn.close()
+            assert self._wait_for(lambda: not server.clients)
+        finally:
+            server.stop()
+
+    def test_reload_message_is_a_websocket_text_frame(self):
+        server, port = self._start()
+        try:
+            conn = self._connect(port)
+            assert self._wait_for(lambda: len(server.clients) == 1)
+            server.send_reload_message(["/app/site.css"])
+            header = conn.recv(2)
+            assert header[0] == 0x81
+            payload = b""
+            while len(payload) < header[1]:
+                payload += conn.recv(header[1] - len(payload))
+            assert orjson.loads(payload)["paths"] == ["/app/site.css"]
+
+            # A close frame from the browser is answered and the client dropped
+            conn.sendall(b"\x88\x80\x00\x00\x00\x00")
+            assert conn.recv(2) == b"\x88\x00"
+            assert self._wait_for(lambda: not server.clients)
+            conn.close()
+        finally:
+            server.stop()
+
+    def test_plain_http_requests_are_rejected(self):
+        server, port = self._start()
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=2) as conn:
+                conn.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                assert conn.recv(1) == b""
+            assert not server.clients
+        finally:
+            server.stop()
+
+    def test_accepts_clients_and_stops_promptly(self):
+        server, port = self._start()
+        try:
+            with self._connect(port):
+                assert self._wait_for(lambda: len(server.clients) == 1)
+            assert self._wait_for(lambda: not server.clients)
+
+            # Clients still connected at shutdown are closed by the server loop
+            lingering = self._connect(port)
+            assert self._wait_for(lambda: len(server.clients) == 1)
+        finally:
+            started = time.monotonic()
+            server.stop()
+        assert time.monotonic() - started < 0.5
+        assert not server.thread.is_alive()
+        assert not server.clients
+        assert lingering.recv(1) == b""
+        lingering.close()
+
+
+class TestWebSocketFraming:
+    """RFC 6455 handshake and frame helpers."""
+
+    def test_accept_key_matches_rfc_example(self):
+        from django_matt.dev.hot_reload import _websocket_accept_key
+
+        assert _websocket_accept_key("dGhlIHNhbXBsZSBub25jZQ==") == "s3pPLMBiTxaQ9kYGzzhZRbK+xOo="
+
+    def test_frame_length_encodings(self):
+        from django_matt.dev.hot_reload import _websocket_text_frame
+
+        assert _websocket_text_frame(b"x" * 125)[:2] == bytes([0x81, 125])
+        assert _websocket_text_frame(b"x" * 126)[:4] == bytes([0x81, 126, 0, 126])
+        long_frame = _websocket_text_frame(b"x" * 65536)
+        assert long_frame[:2] == bytes([0x81, 127])
+        assert int.from_bytes(long_frame[2:10], "big") == 65536
+        assert len(long_frame) == 10 + 65536
+
+    def test_handshake_requires_upgrade_and_key(self):
+        from django_matt.dev.hot_reload import _websocket_handshake_response
+
+        assert _websocket_handshake_response(b"GET / HTTP/1.1\r\nHost: x") is None
+        assert _websocket_handshake_response(b"GET / HTTP/1.1\r\nUpgrade: websocket") is None
+
+
+class TestLiveReloadInjection:
+    """The live reload script is spliced into encoded HTML bodies."""
+
+    def test_script_inserted_before_last_body_tag(self):
+        from django.http import HttpResponse
+
+        from django_matt.dev.hot_reload import inject_live_reload_script
+
+        html = "<html><body><p>caf\u00e9 </body></p></body></html>".encode()
+        response = inject_live_reload_script(HttpResponse(html), "127.0.0.1", 4000)
+        before, _, after = response.content.rpartition(b"</script>")
+        assert before.startswith("<html><body><p>caf\u00e9 </body></p>".encode())
+        assert b"new WebSocket('ws://127.0.0.1:4000')" in before
+        assert after.strip() == b"</body></html>"
+
+    def test_script_appended_without_body_tag(self):
+        from django.http import HttpResponse
+
+        from django_matt.dev.hot_reload import inject_live_reload_script
+
+        response = inject_live_reload_script(HttpResponse(b"<p>fragment</p>"))
+        assert response.content.startswith(b"<p>fragment</p>")
+        assert response.content.rstrip().endswith(b"</script>")
+
+    def test_non_html_and_non_utf8_bodies(self):
+        from django.http import HttpResponse, JsonResponse
+
+        from django_matt.dev.hot_reload import inject_live_reload_script
+
+        json_response = JsonResponse({"a": 1})
+        assert inject_live_reload_script(json_response).content == b'{"a": 1}'
+
+        latin1 = HttpResponse("<body>\u00e9</body>".encode("latin-1"))
+        assert b"<script>" in inject_live_reload_script(latin1).content
+
+    def test_script_bytes_cached_per_host_and_port(self):
+        from django_matt.dev.hot_reload import _live_reload_script
+
+        assert _live_reload_script("localhost", 35729) is _live_reload_script("localhost", 35729)
+
+
+class TestLiveReloadMiddleware:
+    """The middleware resolves its settings and script once."""
+
+    def _middleware(self, monkeypatch, debug, response):
+        from django_matt.dev.hot_reload import LiveReloadMiddleware
+
+        monkeypatch.setenv("DJANGO_DEBUG", debug)
+        monkeypatch.setenv("LIVE_RELOAD_PORT", "4100")
+        return LiveReloadMiddleware(lambda request: response)
+
+    def test_injects_prebuilt_script_in_debug(self, monkeypatch):
+        from django.http import HttpResponse
+
+        from django_matt.dev.hot_reload import _live_reload_script
+
+        middleware = self._middleware(monkeypatch, "true", HttpResponse(b"<body></body>"))
+        assert middleware._script_bytes is _live_reload_script("localhost", 4100)
+
+        # The debug flag is read at construction, not per request
+        monkeypatch.setenv("DJANGO_DEBUG", "false")
+        content = middleware(None).content
+        assert b"ws://localhost:4100" in content
+
+    def test_content_type_checked_once(self, monkeypatch):
+        from django.http import HttpResponse
+
+        response = HttpResponse(b"<body></body>")
+        middleware = self._middleware(monkeypatch, "true", response)
+        with patch.object(response, "get", wraps=response.get) as get:
+            middleware(None)
+        get.assert_called_once_with("Content-Type")
+
+    def test_non_html_passes_through(self, monkeypatch):
+        from django.http import JsonResponse
+
+        response = JsonResponse({"a": 1})
+        middleware = self._middleware(monkeypatch, "true", response)
+        assert middleware(None).content == b'{"a": 1}'
+
+    def test_disabled_outside_debug(self, monkeypatch):
+        from django.http import HttpResponse
+
+        middleware = self._middleware(monkeypatch, "false", HttpResponse(b"<body></body>"))
+        assert middleware(None).content == b"<body></body>"
+
+    def test_explicit_script_bytes(self):
+        from django.http import HttpResponse
+
+        from django_matt.dev.hot_reload import inject_live_reload_script
+
+        response = inject_live_reload_script(
+            HttpResponse(b"<body></body>"), script_bytes=b"<script></script>"
+        )
+        assert response.content == b"<body><script></script></body>"
+
+
+class TestWatchPlan:
+    """Ignored subtrees are pruned before watches are scheduled."""
+
+    def _tree(self, root, *dirs):
+        for rel in dirs:
+            (root / rel).mkdir(parents=True, exist_ok=True)
+
+    def _reloader(self, root):
+        from django_matt.dev.hot_reload import HotReloader
+
+        return HotReloader(project_dir=str(root), use_websocket=False)
+
+    def test_clean_tree_is_one_recursive_watch(self, tmp_path):
+        self._tree(tmp_path, "app/templates", "static/css")
+        assert self._reloader(tmp_path)._watch_plan() == [(str(tmp_path), True)]
+
+    def test_ignored_directories_are_pruned(self, tmp_path):
+        self._tree(
+            tmp_path,
+            ".git/objects",
+            "app/__pycache__",
+            "frontend/node_modules/pkg",
+            "frontend/src/components",
+            "docs",
+        )
+        plan = sorted(self._reloader(tmp_path)._watch_plan())
+        assert plan == sorted(
+            [
+                (str(tmp_path), False),
+                (str(tmp_path / "app"), True),
+                (str(tmp_path / "docs"), True),
+                (str(tmp_path / "frontend"), False),
+                (str(tmp_path / "frontend" / "src"), True),
+            ]
+        )
+
+    def test_leaf_ignored_directories_stay_in_the_recursive_watch(self, tmp_path):
+        self._tree(
+            tmp_path,
+            "__pycache__",
+            *(f"pkg{i}/sub{j}/__pycache__" for i in range(5) for j in range(3)),
+        )
+        assert self._reloader(tmp_path)._watch_plan() == [(str(tmp_path), True)]
+
+    def test_too_many_emitters_fall_back_to_one_recursive_watch(self, tmp_path):
+        from django_matt.dev.hot_reload import _MAX_WATCH_EMITTERS
+
+        self._tree(
+            tmp_path,
+            *(f"app{i}/node_modules/pkg" for i in range(_MAX_WATCH_EMITTERS + 1)),
+        )
+        assert self._reloader(tmp_path)._watch_plan() == [(str(tmp_path), True)]
+
+    def test_real_observer_starts_on_a_large_project(self, tmp_path):
+        from watchdog.observers import Observer
+
+        self._tree(
+            tmp_path,
+            ".git/objects/ab",
+            *(f"pkg{i}/mod{j}/__pycache__" for i in range(50) for j in range(3)),
+        )
+        reloader = self._reloader(tmp_path)
+        reloader.observer = Observer()
+        reloader.event_handler = handler = HotReloadEventHandler(MagicMock())
+
+        reloader._schedule_watches(handler)
+        reloader.observer.start()
+        try:
+            assert len(reloader.observer.emitters) == 1
+        finally:
+            reloader.observer.stop()
+            reloader.observer.join(timeout=5)
+            handler.stop()
+
+    def test_schedule_adds_directory_handler_to_shallow_watches(self, tmp_path):
+        from watchdog.events import DirCreatedEvent
+
+        self._tree(tmp_path, "venv/lib", "app")
+        reloader = self._reloader(tmp_path)
+        reloader.observer = MagicMock()
+        reloader.event_handler = handler = HotReloadEventHandler(MagicMock())
+
+        reloader._schedule_watches(handler)
+
+        scheduled = {
+            (call.args[1], call.kwargs["recursive"])
+            for call in reloader.observer.schedule.call_args_list
+        }
+        assert scheduled == {(str(tmp_path), False), (str(tmp_path / "app"), True)}
+        directory_handler = reloader.observer.add_handler_for_watch.call_args.args[0]
+
+        reloader.observer.schedule.reset_mock()
+        directory_handler.dispatch(DirCreatedEvent(str(tmp_path / "newapp")))
+        directory_handler.dispatch(DirCreatedEvent(str(tmp_path / "node_modules")))
+        reloader.observer.schedule.assert_called_once_with(
+            handler, str(tmp_path / "newapp"), recursive=True
+        )
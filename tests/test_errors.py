@@ -191,6 +191,15 @@ class TestErrorDetail:
         assert body["traceback"] == "TB-content"
         assert body["code_snippet"] == ["42: boom"]
 
+    def test_to_response_encodes_non_native_context(self):
+        """to_response serializes context values orjson doesn't support natively."""
+        from decimal import Decimal
+
+        detail = ErrorDetail(message="err", error_type="E", context={"amount": Decimal("9.99")})
+        resp = detail.to_response()
+        assert resp["Content-Type"] == "application/json"
+        assert json.loads(resp.content)["context"] == {"amount": "9.99"}
+
 
 # ---------------------------------------------------------------------------
 # APIError base class
@@ -233,6 +242,39 @@ class TestAPIError:
         with pytest.raises(APIError, match="test"):
             raise err
 
+    def test_default_suggestion_class_attribute(self):
+        """Subclasses supply their fallback hint via default_suggestion."""
+
+        class GoneAPIError(NotFoundAPIError):
+            default_suggestion = "This resource was removed."
+
+        assert APIError("x").suggestion is None
+        assert NotFoundAPIError().suggestion == NotFoundAPIError.default_suggestion
+        assert GoneAPIError().suggestion == "This resource was removed."
+        assert GoneAPIError(suggestion="Use v2.").suggestion == "Use v2."
+
+    def test_to_response_reuses_encoded_envelope(self):
+        """Context-free errors with the same fields share one serialized body."""
+        first = NotFoundAPIError().to_response()
+        second = NotFoundAPIError().to_response()
+        assert isinstance(first, JsonResponse)
+        assert first.status_code == 404
+        assert first.content is second.content
+        body = json.loads(first.content)
+        assert body["detail"] == "Resource not found"
+        assert body["code"] == "not_found"
+        assert body["extra"] is None
+
+    def test_to_response_debug_context_not_cached(self):
+        """In debug mode the context is rendered into ``extra``."""
+        err = NotFoundAPIError(resource_type="Item", resource_id="7")
+        with patch.dict(os.environ, {"DJANGO_DEBUG": "true"}):
+            body = json.loads(err.to_response().content)
+        assert body["extra"] == {"resource_type": "Item", "resource_id": "7"}
+        with patch.dict(os.environ, {"DJANGO_DEBUG": "false"}):
+            body = json.loads(err.to_response().content)
+        assert body["extra"] is None
+
 
 # ---------------------------------------------------------------------------
 # ValidationAPIError
@@ -548,6 +590,26 @@ class TestErrorHandler:
         sugg = handler._generate_suggestion(RuntimeError("boom"), "RuntimeError")
         assert "review" in sugg.lower() or "error message" in sugg.lower()
 
+    def test_exception_subclass_uses_base_mapping(self):
+        """Subclasses of mapped exceptions resolve through the MRO."""
+
+        class MissingField(KeyError):
+            pass
+
+        handler = ErrorHandler()
+        exc = MissingField("email")
+        assert handler._get_status_code(exc) == 400
+        assert "'email'" in handler._generate_suggestion(exc, "MissingField")
+
+    def test_classify_prefers_exception_attributes(self):
+        """_classify honours status_code/code attributes set on the exception."""
+        exc = PermissionError("nope")
+        exc.status_code = 451
+        exc.code = "blocked"
+        status_code, code, suggestion = ErrorHandler()._classify(exc)
+        assert (status_code, code) == (451, "blocked")
+        assert "permissions" in suggestion
+
     def test_capture_exception_returns_error_detail(self):
         """capture_exception returns an ErrorDetail object."""
         handler = ErrorHandler(debug=False)
@@ -604,6 +666,28 @@ class TestErrorHandler:
             detail = handler.capture_exception(e, request)
             assert detail.context["request"]["body"] == "Invalid JSON"
 
+    def test_capture_exception_reuses_parsed_body(self):
+        """A body already parsed by the view isn't decoded again."""
+        request = RequestFactory().post(
+            "/api/test/", data=json.dumps({"a": 1}), content_type="application/json"
+        )
+        request._json_body = {"a": 1}
+        with patch("django_matt.core.router.orjson.loads") as loads:
+            try:
+                raise RuntimeError("parse")
+            except RuntimeError as e:
+                detail = ErrorHandler(debug=False).capture_exception(e, request)
+        loads.assert_not_called()
+        assert detail.context["request"]["body"] == {"a": 1}
+
+    def test_capture_exception_empty_query_params(self):
+        """Requests without a query string get an empty query_params dict."""
+        try:
+            raise RuntimeError("q")
+        except RuntimeError as e:
+            detail = ErrorHandler(debug=False).capture_exception(e, RequestFactory().get("/x/"))
+        assert detail.context["request"]["query_params"] == {}
+
     def test_capture_exception_debug_includes_traceback(self):
         """In debug mode, capture_exception includes traceback."""
         handler = ErrorHandler(debug=True)
@@ -633,6 +717,84 @@ class TestErrorHandler:
             assert detail.status_code == 409
             assert detail.code == "conflict"
 
+    def test_capture_exception_location_is_innermost_frame(self):
+        """The reported location is the frame that raised, not the caller."""
+        handler = ErrorHandler(debug=True)
+
+        def inner():
+            raise RuntimeError("deep")
+
+        def outer():
+            inner()
+
+        try:
+            outer()
+        except RuntimeError as e:
+            detail = handler.capture_exception(e)
+        assert detail.path == __file__
+        assert detail.line_number == inner.__code__.co_firstlineno + 1
+        assert "outer()" in detail.traceback_str
+
+    def test_capture_exception_formats_traceback_lazily(self):
+        """The traceback is only formatted when traceback_str is read."""
+        handler = ErrorHandler(debug=True)
+        with (
+            patch("django_matt.core.errors.logger.isEnabledFor", return_value=False),
+            patch("django_matt.core.errors.traceback.format_exception") as fmt,
+        ):
+            fmt.return_value = ["Traceback: lazy\n"]
+            try:
+                raise RuntimeError("lazy")
+            except RuntimeError as e:
+                detail = handler.capture_exception(e)
+            fmt.assert_not_called()
+            assert detail.traceback_str == "Traceback: lazy\n"
+            assert detail.traceback_str == "Traceback: lazy\n"
+        fmt.assert_called_once()
+
+    def test_capture_exception_reads_snippet_only_when_serialized(self):
+        """The source file is read only when the snippet is actually included."""
+        handler = ErrorHandler(debug=True)
+        with patch.object(handler, "_get_code_snippet", return_value=["1: boom"]) as get:
+            try:
+                raise RuntimeError("snippet")
+            except RuntimeError as e:
+                detail = handler.capture_exception(e)
+            assert "code_snippet" not in detail.to_dict()
+            get.assert_not_called()
+            assert detail.to_dict(include_snippet=True)["code_snippet"] == ["1: boom"]
+            detail.to_dict(include_snippet=True)
+        get.assert_called_once()
+
+    def test_capture_exception_without_active_traceback(self):
+        """Outside an except block there is no location or traceback."""
+        detail = ErrorHandler(debug=True).capture_exception(RuntimeError("bare"))
+        assert detail.path is None
+        assert detail.line_number is None
+
+    def test_code_snippet_reads_file_once(self, tmp_path):
+        """Repeated snippets for the same unchanged file hit the line cache."""
+        src = tmp_path / "mod.py"
+        src.write_text("a = 1\nb = 2\nc = 3\n")
+        handler = ErrorHandler(debug=True)
+        with patch("builtins.open", wraps=open) as mock_open:
+            first = handler._get_code_snippet(str(src), 2, context_lines=1)
+            second = handler._get_code_snippet(str(src), 2, context_lines=1)
+            ErrorHandler.get_code_snippet(str(src), 2, context_lines=1)
+        assert first == second == ["1: a = 1", "2: b = 2", "3: c = 3"]
+        assert mock_open.call_count == 1
+
+    def test_code_snippet_refreshes_after_file_change(self, tmp_path):
+        """A new mtime invalidates the cached lines."""
+        src = tmp_path / "mod.py"
+        src.write_text("old = 1\n")
+        handler = ErrorHandler(debug=True)
+        assert handler._get_code_snippet(str(src), 1, context_lines=0) == ["1: old = 1"]
+        src.write_text("new = 1\n")
+        stat = src.stat()
+        os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert handler._get_code_snippet(str(src), 1, context_lines=0) == ["1: new = 1"]
+
 
 # ---------------------------------------------------------------------------
 # ErrorMiddleware
@@ -712,6 +874,11 @@ class TestErrorMiddleware:
         assert ErrorMiddleware.sync_capable is True
         assert ErrorMiddleware.async_capable is True
 
+    def test_middlewares_share_error_handler(self):
+        """Middleware instances with the same debug flag reuse one ErrorHandler."""
+        assert self._make_middleware().error_handler is self._make_middleware().error_handler
+        assert self._make_middleware(debug=True).error_handler.debug is True
+
 
 # ---------------------------------------------------------------------------
 # handle_exceptions decorator
@@ -789,6 +956,21 @@ class TestHandleExceptionsDecorator:
         resp = await my_view(request)
         assert resp.status_code == 401
 
+    @pytest.mark.asyncio
+    async def test_error_handler_not_rebuilt_per_exception(self):
+        """handle_exceptions reuses the cached default ErrorHandler."""
+
+        @handle_exceptions
+        async def my_view(request):
+            raise RuntimeError("again")
+
+        request = RequestFactory().get("/test/")
+        await my_view(request)
+        with patch("django_matt.core.errors.ErrorHandler") as error_handler_cls:
+            resp = await my_view(request)
+        error_handler_cls.assert_not_called()
+        assert resp.status_code == 500
+
 
 # ---------------------------------------------------------------------------
 # Edge cases
@@ -824,6 +1006,22 @@ class TestErrorEdgeCases:
         assert "Resource" in err.message
         assert "123" in err.message
 
+    def test_error_detail_is_slotted(self):
+        """ErrorDetail stores its fields in slots, not a per-instance dict."""
+        detail = ErrorDetail(message="err", error_type="E")
+        assert not hasattr(detail, "__dict__")
+        with pytest.raises(AttributeError):
+            detail.unexpected = True
+
+    def test_error_detail_timestamp_formatted_once(self):
+        """The ISO timestamp is rendered on first access and then reused."""
+        import datetime as dt
+
+        detail = ErrorDetail(message="err", error_type="E")
+        stamp = detail.timestamp
+        assert dt.datetime.fromisoformat(stamp) <= dt.datetime.now()
+        assert detail.timestamp is stamp
+
     def test_error_detail_context_defaults_to_empty_dict(self):
         """ErrorDetail context=None becomes empty dict."""
         detail = ErrorDetail(message="err", error_type="E", context=None)
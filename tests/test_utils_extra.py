@@ -2,6 +2,7 @@
 Tests for django_matt.utils — cache_invalidation, errors, hot_reload.
 
 Covers:
+  - Package exports: lazy resolution via module-level __getattr__
   - CacheInvalidator: register, unregister, invalidate, get_cache_keys, signals
   - CacheInvalidationMixin: auto-registration via __init_subclass__
   - cached_view: sync/async decorator, cache hit/miss, vary_on
@@ -634,3 +635,30 @@ class TestFileChangeHandler:
 
         self.handler.dispatch(event)
         self.callback.assert_not_called()
+
+
+# ===========================================================================
+# Package-level lazy exports
+# ===========================================================================
+
+
+class TestUtilsLazyExports:
+    def test_all_exports_resolve(self):
+        from django_matt import utils
+
+        for name in utils.__all__:
+            getattr(utils, name)
+            assert name in dir(utils)
+
+    def test_resolved_export_matches_submodule(self):
+        from django_matt import utils
+        from django_matt.utils.hot_reload import HotReloader
+
+        assert utils.HotReloader is HotReloader
+        assert "HotReloader" in vars(utils)
+
+    def test_unknown_attribute_raises(self):
+        from django_matt import utils
+
+        with pytest.raises(AttributeError):
+            utils.does_not_exist  # noqa: B018